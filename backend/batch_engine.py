@@ -0,0 +1,142 @@
+from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from cover_letter_pipeline import get_cover_letter_pipeline
+import asyncio
+import os
+import threading
+import uuid
+from datetime import datetime
+
+# 메모리에 보관할 완료된 일괄 작업 수
+BATCH_JOB_RETENTION = int(os.getenv('BATCH_JOB_RETENTION', '100'))
+
+
+class BatchGenerationEngine:
+    def __init__(self, pipeline=None, max_workers: int = None, retention: int = None):
+        """
+        일괄 Cover Letter 생성 작업을 백그라운드에서 실행하고 진행 상황을 보관합니다.
+        """
+        self.pipeline = pipeline or get_cover_letter_pipeline()
+        self.max_workers = max_workers
+        self.retention = retention if retention is not None else BATCH_JOB_RETENTION
+        self.jobs = OrderedDict()
+        self._tasks = {}
+        self._lock = threading.Lock()
+
+    def submit(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        일괄 생성 작업을 등록하고 실행 중인 이벤트 루프에서 시작합니다.
+        """
+        job_id = f"batch_{uuid.uuid4().hex[:12]}"
+        job = {
+            'job_id': job_id,
+            'status': 'pending',
+            'total': len(requests),
+            'completed': 0,
+            'failed': 0,
+            'items': [
+                {'request_index': i, 'status': 'pending', 'started_at': None, 'finished_at': None, 'result': None}
+                for i in range(len(requests))
+            ],
+            'created_at': datetime.now().isoformat(),
+            'started_at': None,
+            'finished_at': None,
+            'error': None
+        }
+        with self._lock:
+            self.jobs[job_id] = job
+            self._evict_finished_jobs()
+        self._tasks[job_id] = asyncio.create_task(self._run(job, requests))
+        return self._summary(job)
+
+    async def _run(self, job: Dict[str, Any], requests: List[Dict[str, Any]]):
+        """
+        파이프라인의 일괄 생성을 실행하면서 항목별 상태를 갱신합니다.
+        """
+        job['status'] = 'running'
+        job['started_at'] = datetime.now().isoformat()
+
+        def on_progress(index: int, status: str, payload: Dict[str, Any]):
+            item = job['items'][index]
+            item['status'] = status
+            if status == 'running':
+                item['started_at'] = datetime.now().isoformat()
+                return
+            item['finished_at'] = datetime.now().isoformat()
+            item['result'] = payload
+            job[status] += 1
+
+        try:
+            batch = await self.pipeline.abatch_generate_cover_letters(
+                requests, max_workers=self.max_workers, on_progress=on_progress
+            )
+            job['shared_retrievals'] = batch['shared_retrievals']
+            job['status'] = 'completed' if batch['failed'] == 0 else 'completed_with_errors'
+        except Exception as e:
+            job['status'] = 'failed'
+            job['error'] = str(e)
+        finally:
+            job['finished_at'] = datetime.now().isoformat()
+            self._tasks.pop(job['job_id'], None)
+
+    def _evict_finished_jobs(self):
+        """
+        보관 한도를 넘으면 오래된 완료 작업부터 제거합니다.
+        """
+        finished = [job_id for job_id, job in self.jobs.items() if job['finished_at'] is not None]
+        while len(self.jobs) > self.retention and finished:
+            del self.jobs[finished.pop(0)]
+
+    def _summary(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        항목 결과를 제외한 작업 요약을 반환합니다.
+        """
+        done = job['completed'] + job['failed']
+        return {
+            'job_id': job['job_id'],
+            'status': job['status'],
+            'total': job['total'],
+            'completed': job['completed'],
+            'failed': job['failed'],
+            'progress': round(done / job['total'], 4) if job['total'] else 1.0,
+            'created_at': job['created_at'],
+            'started_at': job['started_at'],
+            'finished_at': job['finished_at']
+        }
+
+    def get_job(self, job_id: str, include_items: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        작업 진행 상황을 반환합니다. 없는 작업이면 None을 반환합니다.
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        summary = self._summary(job)
+        if job.get('error'):
+            summary['error'] = job['error']
+        if 'shared_retrievals' in job:
+            summary['shared_retrievals'] = job['shared_retrievals']
+        if include_items:
+            summary['items'] = [dict(item) for item in job['items']]
+        return summary
+
+    async def wait(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업이 끝날 때까지 기다린 뒤 결과를 반환합니다.
+        """
+        task = self._tasks.get(job_id)
+        if task is not None:
+            await task
+        return self.get_job(job_id)
+
+# 전역 일괄 생성 엔진 인스턴스
+batch_engine = None
+
+def get_batch_engine():
+    """
+    전역 일괄 생성 엔진 인스턴스를 반환합니다.
+    """
+    global batch_engine
+    if batch_engine is None:
+        batch_engine = BatchGenerationEngine()
+    return batch_engine
@@ -0,0 +1,118 @@
+"""
+합성 PDF/TXT/Job Posting JSON 디렉토리를 기존 방식(파일 하나씩 업로드와 같은 순서로 파싱 → 인코딩 → 저장)과
+bulk_import(프로세스 풀 파싱 + 큰 배치 인코딩/저장)로 가져오며 docs/s를 비교합니다.
+병렬 파싱 효과는 CPU 코어 수에 비례하므로 결과와 함께 코어 수를 출력합니다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_bulk_import.py --pdfs 40 --pages 10 --txts 40 --jobs 200 --workers 1 4
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fitz
+from bulk_import import BulkImporter, ImportState, run_import
+from import_sources import read_source, scan_directory
+from job_posting_store import JobPostingStore
+
+WORDS = "백엔드 서비스 설계 운영 트래픽 데이터 파이프라인 Python Kubernetes 성능 개선 장애 대응 협업 리뷰".split()
+
+
+def sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)) + "."
+
+
+def write_corpus(directory: str, pdfs: int, pages: int, txts: int, jobs: int, rng: random.Random):
+    for i in range(pdfs):
+        doc = fitz.open()
+        for _ in range(pages):
+            doc.new_page().insert_text((40, 40), "\n".join(sentence(rng) for _ in range(30)), fontsize=9, fontname="korea")
+        doc.save(os.path.join(directory, f"resume_{i}.pdf"))
+        doc.close()
+    for i in range(txts):
+        with open(os.path.join(directory, f"portfolio_{i}.txt"), 'w', encoding='utf-8') as f:
+            f.write("\f".join(" ".join(sentence(rng) for _ in range(20)) for _ in range(3)))
+    postings = [
+        {'jobTitle': f"Engineer {i}", 'companyName': f"Company {i % 17}", 'jobDescription': sentence(rng, 40)}
+        for i in range(jobs)
+    ]
+    for start in range(0, jobs, 50):
+        with open(os.path.join(directory, f"jobs_{start}.json"), 'w', encoding='utf-8') as f:
+            json.dump(postings[start:start + 50], f, ensure_ascii=False)
+
+
+def run_one_by_one(source: str, work: str):
+    """
+    기존 API 경로처럼 파일마다 파싱 → PDFIngestionPipeline.ingest / 저장 → add_job_posting을 순서대로 합니다.
+    """
+    from ingestion import PDFIngestionPipeline
+    from vector_store import VectorStore
+    vector_store = VectorStore(persist_directory=os.path.join(work, "one_by_one_db"))
+    pipeline = PDFIngestionPipeline(vector_store=vector_store)
+    store = JobPostingStore(directory=os.path.join(work, "one_by_one_jobs"), backend='json')
+    documents = 0
+    start = time.perf_counter()
+    for source_file in scan_directory(source):
+        parsed = read_source(source_file)
+        if parsed['kind'] == 'job':
+            for i, posting in enumerate(parsed['postings']):
+                posting = dict(posting, id=f"job_{os.path.basename(parsed['path'])}_{i}")
+                store.save(posting)
+                vector_store.add_job_posting(posting)
+                documents += 1
+        else:
+            documents += len(pipeline.ingest(os.path.basename(parsed['path']), parsed['pages'])['vector_ids'])
+    elapsed = time.perf_counter() - start
+    return elapsed, documents
+
+
+def run_bulk(source: str, work: str, workers: int, batch_size: int):
+    from vector_store import VectorStore
+    importer = BulkImporter(
+        vector_store=VectorStore(persist_directory=os.path.join(work, f"bulk_{workers}_db")),
+        job_posting_store=JobPostingStore(directory=os.path.join(work, f"bulk_{workers}_jobs"), backend='json'),
+        state=ImportState(os.path.join(work, f"bulk_{workers}_state.sqlite3")),
+        batch_size=batch_size
+    )
+    stats = run_import(source, workers=workers, importer=importer)
+    return stats['elapsed_s'], stats['documents'] + stats['job_postings']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pdfs', type=int, default=40)
+    parser.add_argument('--pages', type=int, default=10)
+    parser.add_argument('--txts', type=int, default=40)
+    parser.add_argument('--jobs', type=int, default=200)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--batch-size', type=int, default=256)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as work:
+        write_corpus(source, args.pdfs, args.pages, args.txts, args.jobs, random.Random(args.seed))
+        # 모델 로딩은 한 번이므로 측정에서 제외.
+        # 벡터 스토어/임베딩 모듈은 함수 안에서 가져옴 (spawn 파싱 워커가 이 스크립트를 다시 import할 때 로딩하지 않도록)
+        from embedding_service import get_embedding_service
+        get_embedding_service().get_model()
+        results = [('one-by-one', *run_one_by_one(source, work))]
+        for workers in args.workers:
+            results.append((f'bulk w={workers}', *run_bulk(source, work, workers, args.batch_size)))
+
+    print(
+        f"files: {args.pdfs} pdf x {args.pages} pages, {args.txts} txt, {args.jobs} job postings, "
+        f"cpu cores: {os.cpu_count()}"
+    )
+    print(f"{'mode':<11} {'total s':>8} {'docs':>6} {'docs/s':>8}")
+    for name, elapsed, documents in results:
+        print(f"{name:<11} {elapsed:>8.2f} {documents:>6} {documents / elapsed:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+페이지 단위 인덱싱과 청크 단위 인덱싱의 검색 재현율(recall)과 프롬프트 크기를 비교합니다.
+
+합성 이력서 페이지마다 고유한 사실 문장을 하나씩 심어두고, 그 사실을 질의했을 때
+프롬프트에 실제로 들어가는 텍스트(페이지: 앞 300자, 청크: 청크 전체)에
+해당 문장이 포함되는지를 측정합니다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_chunking.py --pages 30 --top-k 2
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion import PDFIngestionPipeline
+from llm_integration import PDF_CONTEXT_MAX_CHARS
+from vector_store import VectorStore
+
+PAGE_HEAD_CHARS = 300  # 기존 프롬프트가 페이지에서 사용하던 글자 수
+
+FILLER_SENTENCES = [
+    "I collaborated with cross-functional teams to deliver features on schedule.",
+    "The team followed agile practices with two-week sprints and regular retrospectives.",
+    "I documented design decisions and shared them with stakeholders.",
+    "Code reviews were part of the daily workflow and improved overall quality.",
+    "I mentored junior developers and ran internal knowledge-sharing sessions.",
+    "Monitoring dashboards were maintained to track service health.",
+    "I participated in on-call rotations and incident postmortems.",
+    "Requirements were gathered through interviews with internal users.",
+]
+
+FACT_TOPICS = [
+    ("Kubernetes", "migrated {n} legacy services to a Kubernetes cluster with zero downtime"),
+    ("PostgreSQL", "tuned PostgreSQL queries and cut report latency by {n} percent"),
+    ("Kafka", "built a Kafka streaming pipeline processing {n} thousand events per second"),
+    ("React", "rebuilt the React dashboard used by {n} thousand monthly users"),
+    ("PyTorch", "trained a PyTorch recommendation model that lifted click-through by {n} percent"),
+    ("Terraform", "codified {n} cloud environments with Terraform modules"),
+    ("Spark", "optimized Spark batch jobs that shrank nightly processing by {n} minutes"),
+    ("GraphQL", "designed a GraphQL gateway aggregating {n} backend services"),
+]
+
+
+def build_corpus(num_pages: int, sentences_per_page: int, seed: int):
+    """
+    사실 문장이 임의 위치에 심어진 합성 페이지와 질의 목록을 만듭니다.
+    """
+    rng = random.Random(seed)
+    pages = []
+    queries = []
+    for page_index in range(num_pages):
+        topic, template = FACT_TOPICS[page_index % len(FACT_TOPICS)]
+        fact = f"At project {page_index} I {template.format(n=rng.randint(2, 90))}."
+        sentences = [rng.choice(FILLER_SENTENCES) for _ in range(sentences_per_page)]
+        sentences.insert(rng.randint(0, sentences_per_page), fact)
+        pages.append(" ".join(sentences))
+        queries.append((f"project {page_index} {topic} experience", fact))
+    return pages, queries
+
+
+def visible_text(document: str, chunked: bool) -> str:
+    """
+    프롬프트에 실제로 포함되는 텍스트를 반환합니다.
+    """
+    limit = PDF_CONTEXT_MAX_CHARS if chunked else PAGE_HEAD_CHARS
+    return document[:limit]
+
+
+def evaluate(pipeline: PDFIngestionPipeline, pages, queries, top_k: int, chunked: bool):
+    """
+    인덱스를 만들고 질의별 재현율과 프롬프트 크기를 측정합니다.
+    """
+    pipeline.ingest("synthetic_resume.pdf", pages)
+    hits = 0
+    prompt_chars = 0
+    for query, fact in queries:
+        results = pipeline.vector_store.search_pdf_documents(query, top_k)
+        contexts = [visible_text(doc, chunked) for doc in results['documents']]
+        prompt_chars += sum(len(context) for context in contexts)
+        if any(fact in context for context in contexts):
+            hits += 1
+    return {
+        'indexed_documents': pipeline.vector_store.collections['pdf_documents'].count(),
+        'recall': hits / len(queries),
+        'avg_prompt_chars': prompt_chars / len(queries)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=30)
+    parser.add_argument('--sentences-per-page', type=int, default=24)
+    parser.add_argument('--top-k', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    pages, queries = build_corpus(args.pages, args.sentences_per_page, args.seed)
+
+    print(f"{'mode':<8} {'docs':>6} {'recall@' + str(args.top_k):>10} {'avg prompt chars':>18}")
+    for mode, chunked in (('page', False), ('chunk', True)):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = VectorStore(persist_directory=temp_dir)
+            pipeline = PDFIngestionPipeline(use_chunking=chunked, vector_store=store)
+            result = evaluate(pipeline, pages, queries, args.top_k, chunked)
+        print(f"{mode:<8} {result['indexed_documents']:>6} {result['recall']:>10.2%} {result['avg_prompt_chars']:>18.0f}")
+
+
+if __name__ == '__main__':
+    main()
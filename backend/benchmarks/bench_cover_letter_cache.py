@@ -0,0 +1,92 @@
+"""
+편집기 사용 패턴(조회, 저장 상태 확인, 섹션 히스토리 조회, 섹션 수정 반복)에서
+Cover Letter 캐시와 지연 저장(write-back)의 효과를 측정합니다.
+
+- off: 캐시 없음 (매번 파일을 읽고 검증)
+- cache: 캐시 사용, 수정은 즉시 저장
+- write-back: 캐시 사용, 섹션 수정은 --write-back-ms 동안 모아서 저장
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_cover_letter_cache.py --versions 50 --rounds 2000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cover_letter_cache import CoverLetterCache
+from cover_letter_models import CoverLetterManager, CoverLetterSection, CoverLetterVersion
+
+SECTION_TEXT = "저는 대규모 트래픽을 처리하는 백엔드 서비스를 설계하고 운영해 왔습니다. " * 8
+SECTIONS = ('header', 'introduction', 'body', 'conclusion', 'signature')
+
+
+def make_cover_letter(version_id: str) -> CoverLetterVersion:
+    now = "2025-08-01T09:00:00"
+    return CoverLetterVersion(
+        version_id=version_id,
+        original_content=SECTION_TEXT,
+        sections={name: CoverLetterSection(section_name=name, content=SECTION_TEXT) for name in SECTIONS},
+        created_at=now,
+        updated_at=now,
+        job_title="백엔드 개발자",
+        company_name="테스트 회사"
+    )
+
+
+def run(cache: CoverLetterCache, versions: int, rounds: int, seed: int):
+    """
+    rounds번 동안 편집기 한 번의 요청 묶음(조회 2회, 히스토리 조회, 섹션 수정)을 실행합니다.
+    """
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as storage_dir:
+        manager = CoverLetterManager(storage_dir=storage_dir, cache=cache)
+        for i in range(versions):
+            manager.save_cover_letter(make_cover_letter(f"v{i:04d}"))
+        read_s = 0.0
+        start = time.perf_counter()
+        for i in range(rounds):
+            version_id = f"v{rng.randrange(versions):04d}"
+            section_name = rng.choice(SECTIONS)
+            read_start = time.perf_counter()
+            manager.load_cover_letter(version_id)        # GET /cover-letter/{id}
+            manager.load_cover_letter(version_id)        # GET /cover-letter/{id}/save-status
+            read_s += time.perf_counter() - read_start
+            manager.get_section_history(version_id, section_name)
+            manager.update_section(version_id, section_name, f"{SECTION_TEXT} ({i})")
+        elapsed = time.perf_counter() - start
+        manager.flush()
+        stats = manager.cache.get_stats()
+    return rounds / elapsed, read_s * 1e6 / (rounds * 2), stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--versions', type=int, default=50)
+    parser.add_argument('--rounds', type=int, default=2000)
+    parser.add_argument('--cache-size', type=int, default=256)
+    parser.add_argument('--write-back-ms', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    modes = [
+        ('off', CoverLetterCache(max_entries=0, write_back_ms=0)),
+        ('cache', CoverLetterCache(max_entries=args.cache_size, write_back_ms=0)),
+        ('write-back', CoverLetterCache(max_entries=args.cache_size, write_back_ms=args.write_back_ms)),
+    ]
+    print(f"{'mode':<11} {'rounds/s':>9} {'load us':>8} {'hit rate':>9} {'disk writes':>12} {'flushes':>8} {'avg flush ms':>13} {'max flush ms':>13}")
+    for name, cache in modes:
+        rounds_per_s, read_us, stats = run(cache, args.versions, args.rounds, args.seed)
+        disk_writes = args.rounds if not cache.write_back else stats['flushed_versions']
+        print(
+            f"{name:<11} {rounds_per_s:>9.0f} {read_us:>8.1f} {stats['hit_rate']:>9.2%} {disk_writes:>12} {stats['flushes']:>8} "
+            f"{stats['avg_flush_ms']:>13.2f} {stats['max_flush_ms']:>13.2f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
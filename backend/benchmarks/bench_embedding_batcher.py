@@ -0,0 +1,116 @@
+"""
+동시 요청이 한 개짜리 쿼리를 인코딩할 때 마이크로 배칭(EmbeddingMicroBatcher) 유무와
+최대 배치 크기/최대 대기 시간 설정에 따른 처리량(req/s)과 지연 시간(p50/p99)을 비교합니다.
+
+- off: 요청마다 모델을 직접 호출 (기존 search_similar_documents, add_job_posting 동작)
+- bs=N wait=W: 최대 N개 요청을 W ms까지 기다려 한 번의 encode 호출로 합침
+
+기본은 EMBEDDING_MODEL_NAME 모델을 사용합니다. 모델을 받을 수 없는 환경에서는
+--synthetic-model로 호출당 고정 비용과 텍스트당 비용만 흉내 낸 모델을 쓸 수 있습니다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_embedding_batcher.py --clients 1 8 32 --seconds 3
+    python benchmarks/bench_embedding_batcher.py --synthetic-model 8 0.3
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from embedding_batcher import EmbeddingMicroBatcher
+from embedding_service import EmbeddingService
+
+WORDS = "백엔드 서비스 설계 운영 트래픽 데이터 파이프라인 Python Kubernetes 성능 개선 장애 대응 협업 리뷰".split()
+
+
+class SyntheticModel:
+    """호출당 고정 비용 + 텍스트당 비용만큼 (GIL을 풀고) 기다리는 모델"""
+
+    def __init__(self, overhead_ms: float, per_text_ms: float, dimension: int = 384):
+        self.overhead_ms = overhead_ms
+        self.per_text_ms = per_text_ms
+        self.dimension = dimension
+        self._lock = threading.Lock()
+
+    def encode(self, texts):
+        # 실제 모델처럼 한 번에 한 배치만 계산 (코어를 나눠 쓰는 동시 호출은 빨라지지 않음)
+        with self._lock:
+            time.sleep((self.overhead_ms + self.per_text_ms * len(texts)) / 1000)
+        return np.zeros((len(texts), self.dimension), dtype=np.float32)
+
+
+def run_load(encode, clients: int, seconds: float, rng: random.Random):
+    """
+    clients개 스레드가 seconds 동안 한 개짜리 쿼리를 반복 인코딩하고 (req/s, p50 ms, p99 ms)를 반환합니다.
+    """
+    queries = [" ".join(rng.choice(WORDS) for _ in range(8)) for _ in range(256)]
+    latencies = [[] for _ in range(clients)]
+    stop_at = time.perf_counter() + seconds
+
+    def client(i):
+        j = i
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            encode([queries[j % len(queries)]])
+            latencies[i].append((time.perf_counter() - start) * 1000)
+            j += clients
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    samples = sorted(sample for client_samples in latencies for sample in client_samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return len(samples) / elapsed, statistics.median(samples), p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[8, 32])
+    parser.add_argument('--waits', type=float, nargs='+', default=[0, 2, 5])
+    parser.add_argument('--seconds', type=float, default=3.0)
+    parser.add_argument('--synthetic-model', type=float, nargs=2, metavar=('OVERHEAD_MS', 'PER_TEXT_MS'))
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    service = EmbeddingService()
+    if args.synthetic_model:
+        service._model = SyntheticModel(*args.synthetic_model)
+        model_name = f"synthetic (overhead {args.synthetic_model[0]} ms, {args.synthetic_model[1]} ms/text)"
+    else:
+        service.get_model()
+        model_name = service.model_name
+    service.batcher = None
+
+    configs = [('off', None)] + [
+        (f"bs={batch_size} wait={wait:g}", (batch_size, wait))
+        for batch_size in args.batch_sizes
+        for wait in args.waits
+    ]
+    print(f"model: {model_name}, cpu cores: {os.cpu_count()}, {args.seconds:g}s per run")
+    print(f"{'config':<16} {'clients':>7} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'avg batch':>10}")
+    for name, config in configs:
+        for clients in args.clients:
+            if config is None:
+                encode = service.encode
+                batcher = None
+            else:
+                batcher = EmbeddingMicroBatcher(service._encode_batch, max_batch_size=config[0], max_wait_ms=config[1])
+                encode = batcher.encode
+            throughput, p50, p99 = run_load(encode, clients, args.seconds, random.Random(args.seed))
+            avg_batch = batcher.get_stats()['avg_batch_texts'] if batcher else 1.0
+            print(f"{name:<16} {clients:>7} {throughput:>8.0f} {p50:>8.2f} {p99:>8.2f} {avg_batch:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
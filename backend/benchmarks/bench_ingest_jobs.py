@@ -0,0 +1,125 @@
+"""
+합성 PDF 여러 개를 백그라운드 수집 작업 큐(IngestJobQueue)에 넣고
+워커 수에 따른 처리량(docs/s)과 작업 등록 지연(202 응답까지 걸리는 시간)을 측정합니다.
+
+- sync: 기존 동기 업로드처럼 요청 하나가 수집을 끝낼 때까지 기다림
+- workers=N: 작업 등록 후 바로 반환하고 N개의 워커 스레드가 수집
+
+PyMuPDF 추출과 임베딩 인코딩은 GIL을 풀기 때문에 코어가 여러 개면 워커 수에 따라 처리량이 늘어납니다.
+결과와 함께 코어 수를 출력합니다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_ingest_jobs.py --documents 16 --pages 20 --workers 1 2 4
+"""
+import argparse
+import hashlib
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fitz
+import ingestion
+import vector_store as vector_store_module
+from ingest_jobs import IngestJobQueue, IngestJobStore, run_pdf_ingest_job
+
+WORDS = "백엔드 서비스 설계 운영 트래픽 데이터 파이프라인 Python Kubernetes 성능 개선 장애 대응 협업 리뷰".split()
+
+
+def write_pdf(path: str, pages: int, rng: random.Random):
+    doc = fitz.open()
+    for _ in range(pages):
+        lines = [" ".join(rng.choice(WORDS) for _ in range(12)) + "." for _ in range(30)]
+        doc.new_page().insert_text((40, 40), "\n".join(lines), fontsize=9, fontname="korea")
+    doc.save(path)
+    doc.close()
+
+
+def payload_for(path: str):
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    # 작업이 끝나면 업로드 파일이 삭제되므로 복사본을 넘김
+    spooled = f"{path}.{time.perf_counter_ns()}.pdf"
+    with open(path, 'rb') as src, open(spooled, 'wb') as dst:
+        dst.write(src.read())
+    return {'path': spooled, 'filename': os.path.basename(path), 'sha256': digest}
+
+
+def fresh_vector_store(directory: str):
+    """
+    측정마다 빈 벡터 스토어를 사용합니다 (이전 측정의 중복 제거 결과를 재사용하지 않도록).
+    """
+    vector_store_module.vector_store = vector_store_module.VectorStore(persist_directory=directory)
+    ingestion.pdf_ingestion_pipeline = None
+
+
+def run_sync(paths, directory: str):
+    fresh_vector_store(os.path.join(directory, "sync_db"))
+    latencies = []
+    start = time.perf_counter()
+    for path in paths:
+        request_start = time.perf_counter()
+        run_pdf_ingest_job(payload_for(path), lambda **fields: None)
+        latencies.append((time.perf_counter() - request_start) * 1000)
+    return time.perf_counter() - start, latencies
+
+
+def run_queue(paths, directory: str, workers: int):
+    fresh_vector_store(os.path.join(directory, f"queue_{workers}_db"))
+    queue = IngestJobQueue(store=IngestJobStore(os.path.join(directory, f"jobs_{workers}.sqlite3")), workers=workers)
+    queue.register('pdf', run_pdf_ingest_job)
+    queue.start()
+    payloads = [payload_for(path) for path in paths]
+    latencies = []
+    jobs = []
+    start = time.perf_counter()
+    for path, payload in zip(paths, payloads):
+        request_start = time.perf_counter()
+        jobs.append(queue.submit('pdf', os.path.basename(path), payload))
+        latencies.append((time.perf_counter() - request_start) * 1000)
+    for job in jobs:
+        finished = queue.wait(job['id'], timeout=600, interval=0.01)
+        if finished['status'] != 'completed':
+            raise RuntimeError(f"{job['id']} {finished['status']}: {finished['error']}")
+    elapsed = time.perf_counter() - start
+    queue.stop()
+    return elapsed, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=16)
+    parser.add_argument('--pages', type=int, default=20)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for i in range(args.documents):
+            path = os.path.join(directory, f"portfolio_{i}.pdf")
+            write_pdf(path, args.pages, rng)
+            paths.append(path)
+
+        # 모델 로딩은 서버 시작 시 한 번이므로 측정에서 제외
+        ingestion.get_pdf_ingestion_pipeline().embedding_service.get_model()
+        results = [('sync', *run_sync(paths, directory))]
+        for workers in args.workers:
+            results.append((f'workers={workers}', *run_queue(paths, directory, workers)))
+
+    print(f"documents: {args.documents} x {args.pages} pages, cpu cores: {os.cpu_count()}")
+    print(f"{'mode':<10} {'total s':>8} {'docs/s':>7} {'pages/s':>8} {'p50 response ms':>16}")
+    for name, elapsed, latencies in results:
+        print(
+            f"{name:<10} {elapsed:>8.2f} {args.documents / elapsed:>7.1f} "
+            f"{args.documents * args.pages / elapsed:>8.0f} {statistics.median(latencies):>16.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
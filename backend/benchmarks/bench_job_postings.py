@@ -0,0 +1,97 @@
+"""
+기존 디렉토리 스캔 방식과 인덱스 기반 JobPostingStore의 Job Posting 목록 조회 시간을 비교합니다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_job_postings.py --postings 10000
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_posting_store import JobPostingStore
+from main import JobPostingResponse
+
+COMPANIES = ["네이버", "카카오", "토스", "쿠팡", "배달의민족", "카카오뱅크"]
+TITLES = ["백엔드 개발자", "데이터 엔지니어", "프론트엔드 개발자", "ML 엔지니어", "보안 엔지니어"]
+
+
+def write_postings(directory: str, num_postings: int, rng: random.Random):
+    """
+    합성 Job Posting JSON 파일을 만듭니다.
+    """
+    start = datetime(2025, 1, 1)
+    for i in range(num_postings):
+        job_id = f"job_{i:06d}"
+        posting = {
+            'id': job_id,
+            'jobTitle': rng.choice(TITLES),
+            'companyName': rng.choice(COMPANIES),
+            'jobDescription': "서비스 개발 및 운영 " * 20,
+            'requirements': "Python, Go 경험",
+            'companyVision': None,
+            'createdAt': (start + timedelta(minutes=rng.randint(0, 500000))).isoformat(),
+            'status': 'active'
+        }
+        with open(os.path.join(directory, f"{job_id}.json"), 'w', encoding='utf-8') as f:
+            json.dump(posting, f, ensure_ascii=False, indent=2)
+
+
+def scan_directory(directory: str):
+    """
+    기존 GET /job-postings 구현과 같은 방식으로 모든 파일을 읽습니다.
+    """
+    job_postings = []
+    for filename in os.listdir(directory):
+        if filename.endswith('.json'):
+            with open(os.path.join(directory, filename), 'r', encoding='utf-8') as f:
+                job_postings.append(JobPostingResponse(**json.load(f)))
+    return job_postings
+
+
+def timed(func, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--postings', type=int, default=10000)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        write_postings(temp_dir, args.postings, random.Random(args.seed))
+
+        start = time.perf_counter()
+        store = JobPostingStore(directory=temp_dir)
+        import_ms = (time.perf_counter() - start) * 1000
+
+        results = [
+            ('directory scan (all)', timed(lambda: scan_directory(temp_dir), args.repeat)),
+            ('store list (all)', timed(lambda: store.list(), args.repeat)),
+            (f'store page ({args.page_size})', timed(lambda: store.list(offset=100, limit=args.page_size), args.repeat)),
+            ('store company filter page', timed(lambda: store.list(company="카카오", limit=args.page_size), args.repeat)),
+        ]
+
+    print(f"postings: {args.postings}, one-pass import: {import_ms:.1f} ms")
+    print(f"{'operation':<28} {'median ms':>10}")
+    for name, median_ms in results:
+        print(f"{name:<28} {median_ms:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+합성 다중 페이지 PDF 묶음에서 기존 순차 파싱과 페이지 병렬 추출(extract_pdf_pages)의 시간을 비교합니다.
+
+- legacy: 기존 parse_pdf_sync. PyMuPDF로 전체 페이지를 순차 추출하고, 모두 비었을 때만 문서 전체를 pdfplumber로 다시 파싱
+- workers=N: 페이지 구간을 N개 프로세스에 나눠 추출하고, 빈 페이지만 pdfplumber로 다시 추출
+
+코퍼스의 일부 문서는 텍스트 없는 페이지(스캔 페이지 가정)를 포함합니다.
+병렬 효과는 CPU 코어 수에 비례하므로 결과와 함께 코어 수를 출력합니다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_pdf_extraction.py --documents 6 --pages 150 --workers 1 2 4
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fitz
+import pdfplumber
+from pdf_extraction import extract_pdf_pages, get_pdf_process_pool, shutdown_pdf_process_pool
+
+WORDS = "백엔드 서비스 설계 운영 트래픽 데이터 파이프라인 Python Kubernetes 성능 개선 장애 대응 협업 리뷰".split()
+
+
+def write_corpus(directory: str, documents: int, pages: int, blank_ratio: float, rng: random.Random):
+    """
+    페이지마다 여러 줄의 텍스트가 있는 합성 PDF를 만듭니다. 일부 페이지는 비워 둡니다.
+    """
+    paths = []
+    for i in range(documents):
+        doc = fitz.open()
+        for _ in range(pages):
+            page = doc.new_page()
+            if rng.random() < blank_ratio:
+                continue
+            lines = [" ".join(rng.choice(WORDS) for _ in range(12)) for _ in range(45)]
+            page.insert_text((40, 40), "\n".join(lines), fontsize=9, fontname="korea")
+        path = os.path.join(directory, f"portfolio_{i}.pdf")
+        doc.save(path)
+        doc.close()
+        paths.append(path)
+    return paths
+
+
+def legacy_parse(file_path: str):
+    """
+    병렬 추출 이전의 parse_pdf_sync 동작을 재현합니다.
+    """
+    pages_text = []
+    doc = fitz.open(file_path)
+    for page_num in range(len(doc)):
+        pages_text.append(doc.load_page(page_num).get_text().strip())
+    doc.close()
+    if not any(text.strip() for text in pages_text):
+        with pdfplumber.open(file_path) as pdf:
+            for page in pdf.pages:
+                pages_text.append((page.extract_text() or "").strip())
+    return pages_text
+
+
+def timed(func, paths, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [func(path) for path in paths]
+        samples.append((time.perf_counter() - start) * 1000)
+    empty_pages = sum(1 for pages in results for text in pages if not text)
+    return statistics.median(samples), empty_pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=6)
+    parser.add_argument('--pages', type=int, default=150)
+    parser.add_argument('--blank-ratio', type=float, default=0.05)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_corpus(directory, args.documents, args.pages, args.blank_ratio, random.Random(args.seed))
+        results = [('legacy', *timed(legacy_parse, paths, args.repeat))]
+        for workers in args.workers:
+            if workers > 1:
+                # 워커 프로세스 시작 비용은 서버 시작 시 한 번이므로 측정에서 제외
+                get_pdf_process_pool(workers).submit(int).result()
+            results.append((
+                f'workers={workers}',
+                *timed(lambda path: extract_pdf_pages(path, workers=workers), paths, args.repeat)
+            ))
+            shutdown_pdf_process_pool()
+
+    total_pages = args.documents * args.pages
+    print(f"documents: {args.documents} x {args.pages} pages, cpu cores: {os.cpu_count()}")
+    print(f"{'mode':<11} {'median ms':>10} {'pages/s':>9} {'empty pages':>12}")
+    for name, median_ms, empty_pages in results:
+        print(f"{name:<11} {median_ms:>10.1f} {total_pages / (median_ms / 1000):>9.0f} {empty_pages:>12}")
+
+
+if __name__ == '__main__':
+    main()
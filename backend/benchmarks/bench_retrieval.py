@@ -0,0 +1,111 @@
+"""
+retrieve_context_for_cover_letter의 순차 검색과 배치 검색 지연 시간을 비교합니다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_retrieval.py --documents 300 --requests 50
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vector_store as vector_store_module
+from retrieval import InformationRetrieval
+from vector_store import VectorStore
+
+WORDS = [
+    "python", "backend", "frontend", "react", "데이터", "분석", "프로젝트", "경험", "설계",
+    "구현", "관리", "kubernetes", "api", "서비스", "개발", "기술", "운영", "모델", "검색",
+]
+JOB_TITLES = ["백엔드 개발자", "데이터 엔지니어", "프론트엔드 개발자", "ML 엔지니어"]
+COMPANIES = ["네이버", "카카오", "토스", "쿠팡", "배달의민족"]
+
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def populate(store: VectorStore, num_documents: int, rng: random.Random):
+    """
+    합성 PDF 청크와 Job Posting으로 벡터 스토어를 채웁니다.
+    """
+    documents = [
+        {
+            'filename': f"resume_{i % 10}.pdf",
+            'text': " ".join(rng.choice(WORDS) for _ in range(60)),
+            'page_number': i + 1
+        }
+        for i in range(num_documents)
+    ]
+    store.add_pdf_documents(documents)
+    for i, (title, company) in enumerate((t, c) for t in JOB_TITLES for c in COMPANIES):
+        store.add_job_posting({'id': f"job_{i}", 'jobTitle': title, 'companyName': company})
+
+
+def run(component: InformationRetrieval, requests, batched: bool):
+    """
+    요청 목록을 실행하고 요청별 타이밍을 수집합니다.
+    """
+    latencies = []
+    breakdowns = []
+    for job_title, company_name, question in requests:
+        start = time.perf_counter()
+        context = component.retrieve_context_for_cover_letter(
+            job_title, company_name, user_question=question, batched=batched
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        breakdowns.append(context['timings'])
+    return latencies, breakdowns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=300)
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    requests = [
+        (rng.choice(JOB_TITLES), rng.choice(COMPANIES), rng.choice([None, "리더십 경험을 강조해주세요"]))
+        for _ in range(args.requests)
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = VectorStore(persist_directory=temp_dir)
+        vector_store_module.vector_store = store
+        populate(store, args.documents, rng)
+        component = InformationRetrieval()
+
+        # 모델 로드와 워밍업은 측정에서 제외
+        component.retrieve_context_for_cover_letter(JOB_TITLES[0], COMPANIES[0], batched=True)
+
+        results = {}
+        for mode, batched in (('sequential', False), ('batched', True)):
+            results[mode] = run(component, requests, batched)
+
+    print(f"{'mode':<12} {'queries':>8} {'mean ms':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for mode, (latencies, breakdowns) in results.items():
+        queries = statistics.mean(b['num_queries'] for b in breakdowns)
+        print(
+            f"{mode:<12} {queries:>8.1f} {statistics.mean(latencies):>9.1f} "
+            f"{percentile(latencies, 0.5):>8.1f} {percentile(latencies, 0.95):>8.1f}"
+        )
+
+    batched_breakdowns = results['batched'][1]
+    print("\nbatched breakdown (mean ms):")
+    for key in ('encode_ms', 'job_query_ms', 'pdf_query_ms', 'chroma_round_trips', 'total_ms'):
+        print(f"  {key:<14} {statistics.mean(b[key] for b in batched_breakdowns):>8.2f}")
+
+    speedup = statistics.mean(results['sequential'][0]) / statistics.mean(results['batched'][0])
+    print(f"\nspeedup per generation request: {speedup:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+섹션을 반복 수정할 때의 저장 지연 시간과 문서 크기를 비교합니다.
+
+- embedded: 기존 방식. 이전 섹션 내용을 문서 안 version_history에 쌓고 indent=2로 전체 파일을 다시 씀
+- log: 현재 CoverLetterManager. 이전 내용은 별도 추가 전용 로그에 쓰고 본문은 작게 유지
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_section_history.py --edits 1000
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cover_letter_models import CoverLetterManager, CoverLetterSection, CoverLetterVersion, SectionVersion
+
+SECTION_TEXT = "저는 대규모 트래픽을 처리하는 백엔드 서비스를 설계하고 운영해 왔습니다. " * 8
+
+
+def make_cover_letter() -> CoverLetterVersion:
+    now = datetime.now().isoformat()
+    return CoverLetterVersion(
+        version_id="bench",
+        original_content=SECTION_TEXT,
+        sections={
+            name: CoverLetterSection(section_name=name, content=SECTION_TEXT)
+            for name in ('header', 'introduction', 'body', 'conclusion', 'signature')
+        },
+        created_at=now,
+        updated_at=now,
+        job_title="백엔드 개발자",
+        company_name="테스트 회사"
+    )
+
+
+def embedded_update(storage_dir: str, section_name: str, new_content: str):
+    """
+    기존 update_section 동작(히스토리를 문서 안에 누적, 전체 파일 재작성)을 재현합니다.
+    """
+    path = os.path.join(storage_dir, "bench.json")
+    with open(path, 'r', encoding='utf-8') as f:
+        cover_letter = CoverLetterVersion(**json.load(f))
+    section = cover_letter.sections[section_name]
+    section.version_history.append(SectionVersion(
+        version_id=str(uuid.uuid4()),
+        content=section.content,
+        created_at=datetime.now().isoformat(),
+        change_description=f"{section_name} 섹션 수정"
+    ))
+    section.content = new_content
+    section.is_edited = True
+    cover_letter.updated_at = datetime.now().isoformat()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(cover_letter.model_dump(), f, ensure_ascii=False, indent=2)
+
+
+def run(mode: str, edits: int):
+    """
+    같은 섹션을 edits번 수정하며 저장별 지연 시간을 측정합니다.
+    """
+    with tempfile.TemporaryDirectory() as storage_dir:
+        manager = CoverLetterManager(storage_dir=storage_dir)
+        manager.save_cover_letter(make_cover_letter())
+        if mode == 'embedded':
+            with open(os.path.join(storage_dir, "bench.json"), 'w', encoding='utf-8') as f:
+                json.dump(make_cover_letter().model_dump(), f, ensure_ascii=False, indent=2)
+
+        latencies = []
+        for i in range(edits):
+            new_content = f"{SECTION_TEXT} (수정 {i})"
+            start = time.perf_counter()
+            if mode == 'embedded':
+                embedded_update(storage_dir, 'body', new_content)
+            else:
+                manager.update_section("bench", 'body', new_content)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        document_bytes = os.path.getsize(os.path.join(storage_dir, "bench.json"))
+        start = time.perf_counter()
+        manager.load_cover_letter("bench")
+        load_ms = (time.perf_counter() - start) * 1000
+    return latencies, document_bytes, load_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--edits', type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'mode':<10} {'first100 ms':>12} {'last100 ms':>11} {'doc bytes':>11} {'load ms':>8}")
+    for mode in ('embedded', 'log'):
+        latencies, document_bytes, load_ms = run(mode, args.edits)
+        print(
+            f"{mode:<10} {statistics.mean(latencies[:100]):>12.2f} {statistics.mean(latencies[-100:]):>11.2f} "
+            f"{document_bytes:>11} {load_ms:>8.2f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+json(파일)과 sqlite 저장 백엔드에서 CoverLetterManager의 저장/수정/조회 처리량을 비교합니다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_storage_backends.py --versions 2000 --edits 2000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cover_letter_models import CoverLetterManager, CoverLetterSection, CoverLetterVersion
+from storage_backends import JsonDocumentBackend, SQLiteDocumentBackend, get_sqlite_database
+
+SECTION_TEXT = "저는 대규모 트래픽을 처리하는 백엔드 서비스를 설계하고 운영해 왔습니다. " * 8
+SECTIONS = ('header', 'introduction', 'body', 'conclusion', 'signature')
+
+
+def make_cover_letter(version_id: str) -> CoverLetterVersion:
+    now = "2025-08-01T09:00:00"
+    return CoverLetterVersion(
+        version_id=version_id,
+        original_content=SECTION_TEXT,
+        sections={name: CoverLetterSection(section_name=name, content=SECTION_TEXT) for name in SECTIONS},
+        created_at=now,
+        updated_at=now,
+        job_title="백엔드 개발자",
+        company_name="테스트 회사"
+    )
+
+
+def make_backend(name: str, directory: str):
+    if name == 'sqlite':
+        return SQLiteDocumentBackend(get_sqlite_database(os.path.join(directory, "storage.sqlite3")), "cover_letters")
+    return JsonDocumentBackend(os.path.join(directory, "cover_letters"))
+
+
+def run(name: str, versions: int, edits: int, seed: int):
+    """
+    versions개를 저장하고 무작위 섹션을 edits번 수정한 뒤 조회 시간을 측정합니다.
+    """
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        manager = CoverLetterManager(
+            storage_dir=os.path.join(directory, "cover_letters"),
+            backend=make_backend(name, directory)
+        )
+        start = time.perf_counter()
+        for i in range(versions):
+            manager.save_cover_letter(make_cover_letter(f"v{i:06d}"))
+        save_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(edits):
+            manager.update_section(f"v{rng.randrange(versions):06d}", rng.choice(SECTIONS), f"{SECTION_TEXT} ({i})")
+        edit_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(200):
+            manager.load_cover_letter(f"v{rng.randrange(versions):06d}")
+        load_ms = (time.perf_counter() - start) * 1000 / 200
+
+        start = time.perf_counter()
+        keys = manager.get_all_versions()
+        keys_ms = (time.perf_counter() - start) * 1000
+        assert len(keys) == versions
+    return versions / save_s, edits / edit_s, load_ms, keys_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--versions', type=int, default=2000)
+    parser.add_argument('--edits', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'backend':<8} {'saves/s':>9} {'edits/s':>9} {'load ms':>8} {'keys ms':>8}")
+    for name in ('json', 'sqlite'):
+        saves_per_s, edits_per_s, load_ms, keys_ms = run(name, args.versions, args.edits, args.seed)
+        print(f"{name:<8} {saves_per_s:>9.0f} {edits_per_s:>9.0f} {load_ms:>8.3f} {keys_ms:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+큰 합성 PDF 하나를 기존 방식(전체 파싱 후 한 번에 인코딩/저장)과
+스트리밍 방식(페이지 생성기 + 마이크로 배치 인코딩 + 배치별 저장)으로 수집하며
+첫 페이지가 검색 가능해질 때까지의 시간, 전체 시간, Python 힙 최대 사용량을 비교합니다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_stream_ingestion.py --pages 300 --batch-size 32
+"""
+import argparse
+import hashlib
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fitz
+from ingestion import PDFIngestionPipeline
+from pdf_extraction import count_pdf_pages, extract_pdf_pages, iter_pdf_pages
+from vector_store import VectorStore
+
+WORDS = "백엔드 서비스 설계 운영 트래픽 데이터 파이프라인 Python Kubernetes 성능 개선 장애 대응 협업 리뷰".split()
+
+
+def write_pdf(path: str, pages: int, rng: random.Random):
+    """
+    페이지마다 여러 문단이 있는 합성 PDF를 만듭니다.
+    """
+    doc = fitz.open()
+    for _ in range(pages):
+        lines = [" ".join(rng.choice(WORDS) for _ in range(12)) + "." for _ in range(45)]
+        doc.new_page().insert_text((40, 40), "\n".join(lines), fontsize=9, fontname="korea")
+    doc.save(path)
+    doc.close()
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def run(mode: str, pdf_path: str, batch_size: int):
+    """
+    새 벡터 스토어에 PDF 하나를 수집하고 (첫 검색 가능 ms, 전체 ms, 최대 힙 MB)를 반환합니다.
+    """
+    with tempfile.TemporaryDirectory() as persist_directory:
+        pipeline = PDFIngestionPipeline(vector_store=VectorStore(persist_directory=persist_directory))
+        tracemalloc.start()
+        start = time.perf_counter()
+        if mode == 'batch':
+            with open(pdf_path, 'rb') as f:
+                content = f.read()  # 기존 upload_pdf의 await file.read()
+            pages_text = extract_pdf_pages(pdf_path, workers=1)
+            pipeline.ingest(os.path.basename(pdf_path), pages_text)
+            del content
+            first_ms = total_ms = (time.perf_counter() - start) * 1000
+        else:
+            result = pipeline.ingest_stream(
+                os.path.basename(pdf_path),
+                iter_pdf_pages(pdf_path),
+                file_sha256(pdf_path),
+                count_pdf_pages(pdf_path),
+                batch_size=batch_size
+            )
+            first_ms = result['first_indexed_ms']
+            total_ms = (time.perf_counter() - start) * 1000
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return first_ms, total_ms, peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=300)
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        pdf_path = os.path.join(directory, "portfolio.pdf")
+        write_pdf(pdf_path, args.pages, random.Random(args.seed))
+        size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
+        results = [(mode, *run(mode, pdf_path, args.batch_size)) for mode in ('batch', 'stream')]
+
+    print(f"pages: {args.pages}, file: {size_mb:.1f} MB, batch size: {args.batch_size}")
+    print(f"{'mode':<7} {'first searchable ms':>20} {'total ms':>9} {'peak heap MB':>13}")
+    for mode, first_ms, total_ms, peak_mb in results:
+        print(f"{mode:<7} {first_ms:>20.0f} {total_ms:>9.0f} {peak_mb:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
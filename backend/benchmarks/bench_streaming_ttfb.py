@@ -0,0 +1,74 @@
+"""
+실행 중인 백엔드에서 일반 생성과 SSE 스트리밍 생성의 첫 바이트 도달 시간(TTFB)을 비교합니다.
+
+일반 생성은 전체 응답이 끝나야 첫 바이트가 오므로 TTFB가 곧 전체 지연 시간입니다.
+스트리밍은 첫 이벤트(metadata), 첫 token 이벤트, done 이벤트 도달 시간을 각각 측정합니다.
+
+사용법:
+    uvicorn main:app --port 8000 &
+    python benchmarks/bench_streaming_ttfb.py --base-url http://localhost:8000 --requests 5
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+PAYLOAD = {
+    'job_title': '백엔드 개발자',
+    'company_name': '테스트 회사',
+    'user_question': '협업 경험을 강조해주세요'
+}
+
+
+async def measure_blocking(client: httpx.AsyncClient):
+    start = time.perf_counter()
+    response = await client.post("/api/generate-cover-letter", json=PAYLOAD)
+    response.raise_for_status()
+    total = (time.perf_counter() - start) * 1000
+    return {'first_byte_ms': total, 'first_token_ms': total, 'total_ms': total}
+
+
+async def measure_streaming(client: httpx.AsyncClient):
+    timings = {}
+    start = time.perf_counter()
+    async with client.stream("POST", "/api/generate-cover-letter/stream", json=PAYLOAD) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            elapsed = (time.perf_counter() - start) * 1000
+            timings.setdefault('first_byte_ms', elapsed)
+            if line == "event: token":
+                timings.setdefault('first_token_ms', elapsed)
+            elif line == "event: error":
+                raise RuntimeError("스트리밍 생성 중 error 이벤트를 받았습니다.")
+    timings['total_ms'] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+async def run(base_url: str, num_requests: int):
+    results = {'blocking': [], 'streaming': []}
+    async with httpx.AsyncClient(base_url=base_url, timeout=300) as client:
+        for _ in range(num_requests):
+            results['blocking'].append(await measure_blocking(client))
+            results['streaming'].append(await measure_streaming(client))
+
+    print(f"{'mode':<10} {'first byte ms':>14} {'first token ms':>15} {'total ms':>10}")
+    for mode, samples in results.items():
+        print(
+            f"{mode:<10} {statistics.mean(s['first_byte_ms'] for s in samples):>14.1f} "
+            f"{statistics.mean(s['first_token_ms'] for s in samples):>15.1f} "
+            f"{statistics.mean(s['total_ms'] for s in samples):>10.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--requests', type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.requests))
+
+
+if __name__ == '__main__':
+    main()
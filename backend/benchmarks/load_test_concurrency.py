@@ -0,0 +1,77 @@
+"""
+실행 중인 백엔드에 동시 요청을 보내 요청이 직렬화되지 않는지 확인하는 부하 테스트입니다.
+
+N개의 Cover Letter 생성 요청을 동시에 보내면서 /health 지연 시간을 주기적으로 측정합니다.
+이벤트 루프가 막히지 않으면 전체 소요 시간은 개별 요청 지연의 합보다 훨씬 짧고,
+/health는 생성 도중에도 수 ms 안에 응답합니다.
+
+사용법:
+    uvicorn main:app --port 8000 &
+    python benchmarks/load_test_concurrency.py --base-url http://localhost:8000 --concurrency 5
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def timed_request(client: httpx.AsyncClient, method: str, url: str, **kwargs):
+    start = time.perf_counter()
+    response = await client.request(method, url, **kwargs)
+    return response.status_code, (time.perf_counter() - start) * 1000
+
+
+async def probe_health(client: httpx.AsyncClient, stop: asyncio.Event, interval: float):
+    latencies = []
+    while not stop.is_set():
+        _, latency = await timed_request(client, "GET", "/health")
+        latencies.append(latency)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def run(base_url: str, concurrency: int, interval: float):
+    payload = {
+        'job_title': '백엔드 개발자',
+        'company_name': '테스트 회사',
+        'user_question': '협업 경험을 강조해주세요'
+    }
+    async with httpx.AsyncClient(base_url=base_url, timeout=300) as client:
+        stop = asyncio.Event()
+        health_task = asyncio.create_task(probe_health(client, stop, interval))
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*[
+            timed_request(client, "POST", "/api/generate-cover-letter", json=payload)
+            for _ in range(concurrency)
+        ])
+        wall_ms = (time.perf_counter() - start) * 1000
+
+        stop.set()
+        health_latencies = await health_task
+
+    latencies = [latency for _, latency in results]
+    statuses = [status for status, _ in results]
+    print(f"generation requests: {concurrency} (status codes: {sorted(set(statuses))})")
+    print(f"  wall time          : {wall_ms:9.1f} ms")
+    print(f"  sum of latencies   : {sum(latencies):9.1f} ms")
+    print(f"  mean latency       : {statistics.mean(latencies):9.1f} ms")
+    print(f"  overlap factor     : {sum(latencies) / wall_ms:9.2f}x  (1.0x = fully serialized)")
+    print(f"/health probes during load: {len(health_latencies)}")
+    print(f"  mean latency       : {statistics.mean(health_latencies):9.1f} ms")
+    print(f"  max latency        : {max(health_latencies):9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--concurrency', type=int, default=5)
+    parser.add_argument('--health-interval', type=float, default=0.1)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.concurrency, args.health_interval))
+
+
+if __name__ == '__main__':
+    main()
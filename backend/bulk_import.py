@@ -0,0 +1,306 @@
+"""
+디렉토리의 이력서/포트폴리오 문서(PDF, TXT)와 Job Posting JSON 파일을 한 번에 가져옵니다.
+
+- PDF: 업로드와 같은 추출기(extract_pdf_pages)로 페이지별 텍스트를 추출해 pdf_documents 컬렉션에 저장
+- TXT: 폼 피드(\\f)로 페이지를 나눠 PDF와 같은 방식으로 저장
+- JSON: Job Posting 객체 하나 또는 객체 목록. Job Posting 저장소와 job_postings 컬렉션에 저장
+
+파일 파싱은 프로세스 풀에서 병렬로 하고, 인코딩과 저장은 큰 배치로 모아서 합니다.
+처리가 끝난 파일은 상태 파일(--state)에 (크기, 수정 시각)과 함께 기록되므로,
+중단된 뒤 다시 실행하면 끝난 파일은 건너뛰고 이어서 가져옵니다.
+문서 ID는 가져오기 루트 기준 상대 경로와 파일 내용으로, ID 없는 Job Posting의 ID는 상대 경로와 순번으로 만들므로 마지막 배치가 중복 저장되어도 덮어쓰기만 되고,
+내용이 바뀐 파일은 같은 경로의 이전 버전 청크만 교체됩니다.
+
+사용법 (backend 디렉토리에서):
+    python bulk_import.py ../data --workers 4 --batch-size 256
+    python bulk_import.py ../data --restart  # 상태 파일을 무시하고 전부 다시 가져오기
+"""
+import argparse
+import hashlib
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Any, Iterator, Tuple
+
+from import_sources import read_source, scan_directory
+from job_posting_store import JobPostingStore, get_job_posting_store
+from storage_backends import get_sqlite_database
+
+# 한 번에 인코딩/저장할 문서(청크) 수
+BULK_IMPORT_BATCH_SIZE = 256
+# 가져오기 진행 상태를 기록하는 SQLite 파일
+BULK_IMPORT_STATE_PATH = 'bulk_import_state.sqlite3'
+
+
+def normalize_job_posting(posting: Dict[str, Any], path: str, index: int, source_id: str = None) -> Dict[str, Any]:
+    """
+    JSON의 Job Posting에 API로 저장할 때와 같은 필드를 채웁니다.
+    ID가 없으면 source_id(가져오기 루트 기준 상대 경로)와 순번으로 만들어,
+    다른 위치에 마운트/체크아웃한 같은 데이터를 다시 가져와도 같은 ID가 되도록 합니다.
+    source_id가 없으면 파일 경로를 사용합니다.
+    """
+    if not posting.get('jobTitle') or not posting.get('companyName'):
+        raise ValueError("jobTitle과 companyName은 필수입니다.")
+    digest = hashlib.sha256(f"{source_id or os.path.abspath(path)}:{index}".encode('utf-8')).hexdigest()[:16]
+    return {
+        'id': posting.get('id') or f"job_import_{digest}",
+        'jobTitle': posting['jobTitle'],
+        'companyName': posting['companyName'],
+        'jobDescription': posting.get('jobDescription'),
+        'requirements': posting.get('requirements'),
+        'companyVision': posting.get('companyVision'),
+        'createdAt': posting.get('createdAt') or datetime.now().isoformat(),
+        'status': posting.get('status') or 'active',
+        'sourceFile': os.path.basename(path)
+    }
+
+
+class ImportState:
+    """가져오기가 끝난 파일을 기록하는 상태 테이블"""
+
+    def __init__(self, path: str = None):
+        self._db = get_sqlite_database(path or BULK_IMPORT_STATE_PATH)
+        with self._db.transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS imported_files (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    kind TEXT NOT NULL,
+                    documents INTEGER NOT NULL,
+                    imported_at TEXT NOT NULL
+                )
+                """
+            )
+
+    @staticmethod
+    def _stamp(path: str) -> Tuple[int, int]:
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def is_done(self, path: str) -> bool:
+        """파일이 바뀌지 않았고 이미 가져왔으면 True를 반환합니다."""
+        with self._db.lock:
+            row = self._db.connection.execute(
+                "SELECT size, mtime_ns FROM imported_files WHERE path = ?", (os.path.abspath(path),)
+            ).fetchone()
+        return row is not None and tuple(row) == self._stamp(path)
+
+    def mark_done(self, files: List[Tuple[str, str, int]]):
+        """(종류, 경로, 문서 수) 목록을 한 트랜잭션으로 기록합니다."""
+        imported_at = datetime.now().isoformat()
+        rows = [(os.path.abspath(path), *self._stamp(path), kind, documents, imported_at) for kind, path, documents in files]
+        with self._db.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO imported_files (path, size, mtime_ns, kind, documents, imported_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def reset(self):
+        """기록을 모두 지웁니다."""
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM imported_files")
+
+
+class BulkImporter:
+    def __init__(
+        self,
+        vector_store=None,
+        job_posting_store: JobPostingStore = None,
+        state: ImportState = None,
+        batch_size: int = None
+    ):
+        """
+        파싱된 파일을 모아 큰 배치로 인코딩하고 저장하는 가져오기 도구를 초기화합니다.
+        """
+        # 벡터 스토어/임베딩 모듈은 여기서 가져옴 (spawn 파싱 워커가 이 모듈을 다시 import할 때 모델 라이브러리를 로딩하지 않도록)
+        from ingestion import PDFIngestionPipeline
+        from vector_store import get_vector_store
+        self.vector_store = vector_store or get_vector_store()
+        self.job_posting_store = job_posting_store or get_job_posting_store()
+        self.pipeline = PDFIngestionPipeline(vector_store=self.vector_store)
+        self.state = state or ImportState()
+        self.batch_size = batch_size or BULK_IMPORT_BATCH_SIZE
+        self._documents = []
+        self._postings = []
+        self._files = []
+        self.stats = {'files': 0, 'documents': 0, 'job_postings': 0, 'batches': 0, 'failed': []}
+
+    def add(self, parsed: Dict[str, Any], source_id: str = None):
+        """
+        파싱된 파일 하나를 배치에 추가하고, 배치가 차면 저장합니다.
+        source_id는 문서와 Job Posting의 고정 식별자(가져오기 루트 기준 상대 경로)로, 없으면 파일 경로를 사용합니다.
+        파일명은 다른 디렉토리의 문서와 겹칠 수 있으므로 식별자로 쓰지 않습니다.
+        """
+        if 'error' in parsed:
+            self.stats['failed'].append({'path': parsed['path'], 'error': parsed['error']})
+            return
+        try:
+            if parsed['kind'] == 'job':
+                postings = [
+                    normalize_job_posting(posting, parsed['path'], index, source_id)
+                    for index, posting in enumerate(parsed['postings'])
+                ]
+                self._postings.extend(postings)
+                count = len(postings)
+            else:
+                documents = self._build_documents(
+                    os.path.basename(parsed['path']),
+                    parsed['pages'],
+                    parsed.get('sha256'),
+                    source_id or parsed['path']
+                )
+                self._documents.extend(documents)
+                count = len(documents)
+        except Exception as e:
+            self.stats['failed'].append({'path': parsed['path'], 'error': str(e)})
+            return
+        self._files.append((parsed['kind'], parsed['path'], count))
+        if len(self._documents) + len(self._postings) >= self.batch_size:
+            self.flush()
+
+    def _build_documents(
+        self,
+        filename: str,
+        pages_text: List[str],
+        file_digest: str = None,
+        source_id: str = None
+    ) -> List[Dict[str, Any]]:
+        """
+        업로드 수집(PDFIngestionPipeline.ingest)과 같은 청크와 내용 기반 ID를 만듭니다.
+        file_digest는 파일 바이트의 SHA-256으로, 업로드 경로와 같은 다이제스트를 사용합니다.
+        """
+        from vector_store import compute_content_digest, make_pdf_document_id
+        pages_text = [text.strip() for text in pages_text]
+        documents = self.pipeline.build_documents(filename, pages_text)
+        file_digest = file_digest or compute_content_digest(pages_text)
+        for doc in documents:
+            doc['file_digest'] = file_digest
+            doc['source_id'] = source_id
+            doc['content_hash'] = compute_content_digest([doc['text']])
+            doc['id'] = make_pdf_document_id(file_digest, doc['page_number'], doc.get('chunk_index', 0), source_id)
+        return documents
+
+    def flush(self):
+        """
+        모아 둔 문서와 Job Posting을 한 번에 인코딩/저장하고, 포함된 파일을 완료로 기록합니다.
+        """
+        if not self._files:
+            return
+        if self._documents:
+            # 같은 ID(같은 원본의 같은 내용)는 한 번만 저장
+            self._documents = list({doc['id']: doc for doc in self._documents}.values())
+            embeddings = self.pipeline.embedding_service.encode([doc['text'] for doc in self._documents]).tolist()
+            self.vector_store.add_pdf_documents(self._documents, embeddings=embeddings)
+            # 같은 원본(상대 경로)의 이전 버전 청크 정리. 이번 배치에 저장한 청크는 지우지 않음
+            batch_ids = [doc['id'] for doc in self._documents]
+            for source_id, file_digest in {(doc['source_id'], doc['file_digest']) for doc in self._documents}:
+                self.vector_store.delete_stale_pdf_documents(source_id, file_digest, keep_ids=batch_ids)
+        if self._postings:
+            self.job_posting_store.save_many(self._postings)
+            self.vector_store.add_job_postings(self._postings)
+        self.state.mark_done(self._files)
+
+        self.stats['files'] += len(self._files)
+        self.stats['documents'] += len(self._documents)
+        self.stats['job_postings'] += len(self._postings)
+        self.stats['batches'] += 1
+        self._documents, self._postings, self._files = [], [], []
+
+
+def iter_parsed(sources: List[Tuple[str, str]], workers: int) -> Iterator[Dict[str, Any]]:
+    """
+    파일을 순서대로 파싱한 결과를 내보냅니다. workers가 2 이상이면 프로세스 풀에서 미리 파싱하며,
+    인코딩이 밀려도 메모리가 늘지 않도록 미리 파싱하는 파일 수를 워커 수의 네 배로 제한합니다.
+    """
+    if workers <= 1:
+        for source in sources:
+            yield read_source(source)
+        return
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        futures = deque()
+        for source in sources:
+            futures.append(pool.submit(read_source, source))
+            if len(futures) >= workers * 4:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+
+
+def run_import(
+    directory: str,
+    workers: int = None,
+    batch_size: int = None,
+    state_path: str = None,
+    restart: bool = False,
+    importer: BulkImporter = None,
+    on_batch=None
+) -> Dict[str, Any]:
+    """
+    디렉토리를 가져오고 처리 결과와 처리량(docs/s)을 반환합니다.
+    """
+    importer = importer or BulkImporter(state=ImportState(state_path), batch_size=batch_size)
+    if restart:
+        importer.state.reset()
+    sources = scan_directory(directory)
+    pending = [source for source in sources if not importer.state.is_done(source[1])]
+
+    start = time.perf_counter()
+    batches = importer.stats['batches']
+    for parsed in iter_parsed(pending, workers or os.cpu_count() or 1):
+        # 가져오기 루트 기준 상대 경로를 문서 식별자로 사용 (다른 디렉토리의 같은 파일명과 구분)
+        importer.add(parsed, source_id=os.path.relpath(parsed['path'], directory).replace(os.sep, '/'))
+        if on_batch and importer.stats['batches'] != batches:
+            batches = importer.stats['batches']
+            on_batch(importer.stats, time.perf_counter() - start)
+    importer.flush()
+    elapsed = time.perf_counter() - start
+
+    stats = dict(importer.stats)
+    stored = stats['documents'] + stats['job_postings']
+    stats.update({
+        'found': len(sources),
+        'skipped': len(sources) - len(pending),
+        'elapsed_s': elapsed,
+        'docs_per_sec': stored / elapsed if elapsed > 0 else 0.0,
+        'files_per_sec': stats['files'] / elapsed if elapsed > 0 else 0.0
+    })
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('directory')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="파싱 프로세스 수")
+    parser.add_argument('--batch-size', type=int, default=BULK_IMPORT_BATCH_SIZE, help="한 번에 인코딩/저장할 문서 수")
+    parser.add_argument('--state', default=BULK_IMPORT_STATE_PATH, help="진행 상태 파일")
+    parser.add_argument('--restart', action='store_true', help="진행 상태를 지우고 처음부터 가져오기")
+    args = parser.parse_args()
+
+    def report(stats, elapsed):
+        stored = stats['documents'] + stats['job_postings']
+        print(f"  {stats['files']} files, {stored} docs, {stored / elapsed:.1f} docs/s")
+
+    stats = run_import(
+        args.directory,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        state_path=args.state,
+        restart=args.restart,
+        on_batch=report
+    )
+
+    print(f"files: {stats['found']} found, {stats['skipped']} already imported, {stats['files']} imported")
+    print(f"documents: {stats['documents']} chunks, {stats['job_postings']} job postings in {stats['batches']} batches")
+    for item in stats['failed']:
+        print(f"failed: {item}")
+    print(f"elapsed: {stats['elapsed_s']:.2f}s, {stats['docs_per_sec']:.1f} docs/s, {stats['files_per_sec']:.1f} files/s")
+
+
+if __name__ == '__main__':
+    main()
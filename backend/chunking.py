@@ -0,0 +1,152 @@
+from typing import List, Dict, Any, Optional, Callable
+import math
+import os
+import re
+
+# all-MiniLM-L6-v2는 최대 256 토큰까지 인코딩하므로 특수 토큰 여유분을 남깁니다.
+DEFAULT_CHUNK_MAX_TOKENS = int(os.getenv('CHUNK_MAX_TOKENS', '200'))
+DEFAULT_CHUNK_OVERLAP_TOKENS = int(os.getenv('CHUNK_OVERLAP_TOKENS', '40'))
+
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?。？！])\s+|\n\s*\n|\n(?=\s*[-•·▪*]\s)')
+_TOKEN_PATTERN = re.compile(r'[A-Za-z]+|\d+|[^\sA-Za-z\d]')
+
+
+def estimate_token_count(text: str) -> int:
+    """
+    WordPiece 토크나이저의 토큰 수를 근사합니다.
+    영문 단어는 약 4글자당 1토큰, 한글 등 그 외 문자는 글자당 1토큰으로 계산합니다.
+    """
+    count = 0
+    for token in _TOKEN_PATTERN.findall(text):
+        if token.isascii() and token.isalnum():
+            count += max(1, math.ceil(len(token) / 4))
+        else:
+            count += 1
+    return count
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    텍스트를 문장 단위로 분리합니다.
+    """
+    sentences = []
+    for part in _SENTENCE_BOUNDARY.split(text):
+        part = ' '.join(part.split())
+        if part:
+            sentences.append(part)
+    return sentences
+
+
+class TextChunker:
+    def __init__(
+        self,
+        max_tokens: int = DEFAULT_CHUNK_MAX_TOKENS,
+        overlap_tokens: int = DEFAULT_CHUNK_OVERLAP_TOKENS,
+        token_counter: Optional[Callable[[str], int]] = None
+    ):
+        """
+        문장 경계를 고려해 겹치는 청크를 만드는 청커를 초기화합니다.
+        """
+        if max_tokens <= 0:
+            raise ValueError("max_tokens는 0보다 커야 합니다.")
+        if overlap_tokens < 0 or overlap_tokens >= max_tokens:
+            raise ValueError("overlap_tokens는 0 이상이고 max_tokens보다 작아야 합니다.")
+
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.token_counter = token_counter or estimate_token_count
+
+    def _split_long_sentence(self, sentence: str) -> List[str]:
+        """
+        max_tokens를 넘는 문장을 단어 단위로 나눕니다.
+        """
+        pieces = []
+        current = []
+        current_tokens = 0
+        for word in sentence.split():
+            word_tokens = self.token_counter(word)
+            if current and current_tokens + word_tokens > self.max_tokens:
+                pieces.append(' '.join(current))
+                current = []
+                current_tokens = 0
+            current.append(word)
+            current_tokens += word_tokens
+        if current:
+            pieces.append(' '.join(current))
+        return pieces
+
+    def chunk_text(self, text: str) -> List[Dict[str, Any]]:
+        """
+        하나의 텍스트를 겹치는 청크 목록으로 나눕니다.
+        """
+        units = []
+        for sentence in split_sentences(text):
+            tokens = self.token_counter(sentence)
+            if tokens > self.max_tokens:
+                for piece in self._split_long_sentence(sentence):
+                    units.append((piece, self.token_counter(piece)))
+            else:
+                units.append((sentence, tokens))
+
+        chunks = []
+        current = []
+        current_tokens = 0
+        for unit in units:
+            if current and current_tokens + unit[1] > self.max_tokens:
+                chunks.append(current)
+
+                # 이전 청크의 마지막 문장들을 overlap 만큼 다음 청크로 이어붙임
+                overlap = []
+                overlap_tokens = 0
+                for previous in reversed(current):
+                    if overlap_tokens + previous[1] > self.overlap_tokens:
+                        break
+                    overlap.insert(0, previous)
+                    overlap_tokens += previous[1]
+                while overlap and overlap_tokens + unit[1] > self.max_tokens:
+                    overlap_tokens -= overlap.pop(0)[1]
+
+                current = overlap
+                current_tokens = overlap_tokens
+            current.append(unit)
+            current_tokens += unit[1]
+        if current:
+            chunks.append(current)
+
+        return [
+            {
+                'text': ' '.join(sentence for sentence, _ in chunk),
+                'token_count': sum(tokens for _, tokens in chunk),
+                'chunk_index': index
+            }
+            for index, chunk in enumerate(chunks)
+        ]
+
+    def chunk_page(self, page_text: str, page_number: int, page_count: int, filename: str = '') -> List[Dict[str, Any]]:
+        """
+        한 페이지의 텍스트를 청크로 나누고 부모 페이지와 파일 메타데이터를 붙입니다.
+        """
+        if not page_text.strip():
+            return []
+        page_chunks = self.chunk_text(page_text)
+        return [
+            {
+                'filename': filename,
+                'text': chunk['text'],
+                'pages': page_count,
+                'page_number': page_number,
+                'chunk_index': chunk['chunk_index'],
+                'chunk_count': len(page_chunks),
+                'token_count': chunk['token_count']
+            }
+            for chunk in page_chunks
+        ]
+
+    def chunk_pages(self, pages_text: List[str], filename: str = '') -> List[Dict[str, Any]]:
+        """
+        페이지별 텍스트를 청크로 나누고 부모 페이지와 파일 메타데이터를 유지합니다.
+        """
+        chunks = []
+        for page_index, page_text in enumerate(pages_text):
+            chunks.extend(self.chunk_page(page_text, page_index + 1, len(pages_text), filename=filename))
+        return chunks
@@ -0,0 +1,198 @@
+from typing import Dict, Any, Callable, List
+from collections import OrderedDict
+import os
+import threading
+
+# 메모리에 보관할 최근 Cover Letter 수 (0이면 캐시 사용 안 함)
+DEFAULT_COVER_LETTER_CACHE_SIZE = int(os.getenv('COVER_LETTER_CACHE_SIZE', '256'))
+# 섹션 수정 지연 저장 시간(ms). 첫 수정 후 이 시간 동안의 수정을 모아 한 번에 저장 (0이면 즉시 저장)
+DEFAULT_COVER_LETTER_WRITE_BACK_MS = int(os.getenv('COVER_LETTER_WRITE_BACK_MS', '0'))
+
+
+def copy_cover_letter(cover_letter):
+    """
+    캐시 내용과 호출하는 쪽이 서로의 수정에 영향을 받지 않도록 섹션까지 복사합니다.
+    필드가 모두 문자열/불리언이라 model_copy(deep=True)보다 두 배 이상 빠릅니다.
+    """
+    return cover_letter.model_copy(update={
+        'sections': {
+            name: section.model_copy(update={'version_history': list(section.version_history)})
+            for name, section in cover_letter.sections.items()
+        }
+    })
+
+
+class _CacheEntry:
+    __slots__ = ('cover_letter', 'stamp', 'dirty')
+
+    def __init__(self, cover_letter, stamp, dirty: bool):
+        self.cover_letter = cover_letter
+        self.stamp = stamp
+        self.dirty = dirty
+
+
+class CoverLetterCache:
+    """
+    최근 사용한 CoverLetterVersion을 보관하는 LRU 캐시.
+    저장소의 변경 표시(stamp)가 달라지면 다른 프로세스가 수정한 것으로 보고 다시 읽게 합니다.
+    write_back_ms가 0보다 크면 섹션 수정을 메모리에만 반영하고 flush_func로 모아서 저장합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = None,
+        write_back_ms: int = None,
+        flush_func: Callable[[], Any] = None
+    ):
+        self.max_entries = DEFAULT_COVER_LETTER_CACHE_SIZE if max_entries is None else max_entries
+        self.write_back_ms = DEFAULT_COVER_LETTER_WRITE_BACK_MS if write_back_ms is None else write_back_ms
+        # 지연 저장은 캐시에 보관된 내용을 쓰므로 캐시가 꺼져 있으면 사용하지 않음
+        if self.max_entries <= 0:
+            self.write_back_ms = 0
+        self.flush_func = flush_func
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._timer = None
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'stale': 0,
+            'evictions': 0,
+            'deferred_writes': 0,
+            'flushes': 0,
+            'flushed_versions': 0,
+            'flush_errors': 0,
+            'total_flush_ms': 0.0,
+            'max_flush_ms': 0.0
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @property
+    def write_back(self) -> bool:
+        return self.write_back_ms > 0
+
+    def get(self, version_id: str, stamp_func: Callable[[], Any]):
+        """
+        캐시된 Cover Letter의 복사본을 반환합니다. 없거나 저장소 내용이 바뀌었으면 None을 반환합니다.
+        아직 저장되지 않은 수정이 있는 항목은 저장소보다 최신이므로 stamp를 확인하지 않습니다.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(version_id)
+        if entry is not None and not entry.dirty and entry.stamp != stamp_func():
+            with self._lock:
+                if self._entries.get(version_id) is entry:
+                    del self._entries[version_id]
+                self._stats['stale'] += 1
+            entry = None
+        with self._lock:
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(version_id)
+            self._stats['hits'] += 1
+            return copy_cover_letter(entry.cover_letter)
+
+    def fill(self, version_id: str, cover_letter, stamp):
+        """
+        저장소에서 읽은 Cover Letter를 캐시에 넣습니다.
+        stamp는 읽기 전에 구한 값이어야 하며, 그 사이 다른 요청이 먼저 넣은 항목은 덮어쓰지 않습니다.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if version_id in self._entries:
+                return
+            self._entries[version_id] = _CacheEntry(copy_cover_letter(cover_letter), stamp, False)
+            self._evict_locked()
+
+    def defer(self, version_id: str, cover_letter):
+        """
+        수정된 Cover Letter를 메모리에만 반영하고 다음 flush 때 저장되도록 예약합니다.
+        """
+        with self._lock:
+            self._entries[version_id] = _CacheEntry(copy_cover_letter(cover_letter), None, True)
+            self._entries.move_to_end(version_id)
+            self._stats['deferred_writes'] += 1
+            self._schedule_flush_locked()
+            self._evict_locked()
+
+    def store(self, version_id: str, cover_letter, stamp):
+        """
+        저장소에 쓴 내용으로 캐시 항목을 갱신합니다. 지연 저장 대기 상태도 해제됩니다.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[version_id] = _CacheEntry(copy_cover_letter(cover_letter), stamp, False)
+            self._entries.move_to_end(version_id)
+            self._evict_locked()
+
+    def _evict_locked(self):
+        # 저장되지 않은 항목은 flush 전까지 내보내지 않음
+        for version_id in list(self._entries):
+            if len(self._entries) <= self.max_entries:
+                break
+            if not self._entries[version_id].dirty:
+                del self._entries[version_id]
+                self._stats['evictions'] += 1
+
+    def invalidate(self, version_id: str):
+        """캐시 항목을 제거합니다. 저장되지 않은 수정도 버려집니다."""
+        with self._lock:
+            self._entries.pop(version_id, None)
+
+    def dirty_ids(self) -> List[str]:
+        """저장되지 않은 수정이 있는 버전 ID 목록을 반환합니다."""
+        with self._lock:
+            return [version_id for version_id, entry in self._entries.items() if entry.dirty]
+
+    def pending(self, version_id: str):
+        """저장되지 않은 수정이 있으면 그 Cover Letter를, 없으면 None을 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(version_id)
+            if entry is None or not entry.dirty:
+                return None
+            return copy_cover_letter(entry.cover_letter)
+
+    def _schedule_flush_locked(self):
+        if self._timer is not None or self.flush_func is None:
+            return
+        self._timer = threading.Timer(self.write_back_ms / 1000, self._run_flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _run_flush(self):
+        with self._lock:
+            self._timer = None
+        self.flush_func()
+
+    def record_flush(self, elapsed_ms: float, versions: int, errors: int = 0):
+        """flush 한 번의 소요 시간과 저장한 버전 수를 기록합니다. 실패한 항목이 있으면 다시 예약합니다."""
+        with self._lock:
+            self._stats['flushes'] += 1
+            self._stats['flushed_versions'] += versions
+            self._stats['flush_errors'] += errors
+            self._stats['total_flush_ms'] += elapsed_ms
+            self._stats['max_flush_ms'] = max(self._stats['max_flush_ms'], elapsed_ms)
+            if errors:
+                self._schedule_flush_locked()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 적중률과 지연 저장 통계를 반환합니다.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+            stats['dirty'] = sum(1 for entry in self._entries.values() if entry.dirty)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        stats['avg_flush_ms'] = stats['total_flush_ms'] / stats['flushes'] if stats['flushes'] else 0.0
+        stats['max_entries'] = self.max_entries
+        stats['write_back_ms'] = self.write_back_ms
+        return stats
@@ -0,0 +1,105 @@
+from typing import List, Dict, Any, Optional, Tuple
+import base64
+import json
+from storage_backends import get_sqlite_database
+
+# 목록 조회 시 한 페이지의 최대 크기
+MAX_CATALOG_PAGE_SIZE = 200
+
+
+def encode_cursor(updated_at: str, version_id: str) -> str:
+    """
+    (updated_at, version_id) 위치를 불투명한 커서 문자열로 만듭니다.
+    """
+    raw = json.dumps([updated_at, version_id]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    커서 문자열을 (updated_at, version_id)로 되돌립니다.
+    """
+    try:
+        updated_at, version_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return str(updated_at), str(version_id)
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+
+
+class CoverLetterCatalog:
+    """Cover Letter 버전 요약(제목, 회사, 시각, 편집 섹션 수)을 보관하는 SQLite 카탈로그"""
+
+    def __init__(self, path: str):
+        self.path = path
+        # 같은 파일을 쓰는 다른 저장소와 WAL 모드 연결 하나를 공유
+        self._db = get_sqlite_database(path)
+        with self._db.transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS versions (
+                    version_id TEXT PRIMARY KEY,
+                    job_title TEXT NOT NULL,
+                    company_name TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    edited_sections INTEGER NOT NULL,
+                    total_sections INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_versions_updated_at ON versions (updated_at, version_id)")
+
+    def _upsert_rows(self, conn, summaries: List[Dict[str, Any]]):
+        conn.executemany(
+            "INSERT OR REPLACE INTO versions "
+            "(version_id, job_title, company_name, created_at, updated_at, edited_sections, total_sections) "
+            "VALUES (:version_id, :job_title, :company_name, :created_at, :updated_at, :edited_sections, :total_sections)",
+            summaries
+        )
+
+    def upsert(self, summaries: List[Dict[str, Any]]):
+        """버전 요약을 추가하거나 갱신합니다."""
+        with self._db.transaction() as conn:
+            self._upsert_rows(conn, summaries)
+
+    def remove(self, version_id: str):
+        """버전 요약을 삭제합니다."""
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM versions WHERE version_id = ?", (version_id,))
+
+    def replace_all(self, summaries: List[Dict[str, Any]]):
+        """카탈로그 전체를 주어진 요약으로 다시 만듭니다."""
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM versions")
+            self._upsert_rows(conn, summaries)
+
+    def count(self) -> int:
+        """카탈로그에 등록된 버전 수를 반환합니다."""
+        with self._db.lock:
+            return self._db.connection.execute("SELECT COUNT(*) FROM versions").fetchone()[0]
+
+    def list_page(self, limit: int = 50, cursor: str = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        최근 수정 순으로 한 페이지를 반환합니다.
+        다음 페이지가 있으면 next_cursor를, 없으면 None을 함께 반환합니다.
+        """
+        limit = max(1, min(limit, MAX_CATALOG_PAGE_SIZE))
+        query = "SELECT * FROM versions"
+        params = []
+        if cursor:
+            updated_at, version_id = decode_cursor(cursor)
+            query += " WHERE updated_at < ? OR (updated_at = ? AND version_id < ?)"
+            params = [updated_at, updated_at, version_id]
+        query += " ORDER BY updated_at DESC, version_id DESC LIMIT ?"
+        params.append(limit + 1)
+        with self._db.lock:
+            cursor_obj = self._db.connection.execute(query, params)
+            columns = [column[0] for column in cursor_obj.description]
+            rows = [dict(zip(columns, row)) for row in cursor_obj.fetchall()]
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]['updated_at'], rows[-1]['version_id'])
+        for row in rows:
+            row['has_edits'] = row['edited_sections'] > 0
+        return rows, next_cursor
@@ -1,8 +1,14 @@
 from pydantic import BaseModel
 from typing import Dict, List, Optional
 from datetime import datetime
-import json
+import atexit
 import os
+import time
+import uuid
+from cover_letter_cache import CoverLetterCache
+from cover_letter_catalog import CoverLetterCatalog
+from section_history import SectionHistoryLog
+from storage_backends import SQLiteDocumentBackend, create_document_backend
 
 class SectionVersion(BaseModel):
     """섹션 버전을 나타내는 모델"""
@@ -36,11 +42,13 @@ class CoverLetterEditRequest(BaseModel):
     version_id: str
     section_name: str
     new_content: str
+    expected_updated_at: Optional[str] = None  # 낙관적 동시성 검사용 (If-Match 헤더로도 전달 가능)
 
 class CoverLetterSaveRequest(BaseModel):
     """Cover Letter 저장 요청 모델"""
     version_id: str
     sections: Dict[str, str]  # section_name -> content
+    expected_updated_at: Optional[str] = None  # 낙관적 동시성 검사용 (If-Match 헤더로도 전달 가능)
 
 class SectionVersionRequest(BaseModel):
     """섹션 버전 관리 요청 모델"""
@@ -65,83 +73,287 @@ class CoverLetterResponse(BaseModel):
     company_name: str
     has_edits: bool
 
+class CoverLetterConflictError(Exception):
+    """다른 요청이 먼저 Cover Letter를 수정해 expected_updated_at이 맞지 않을 때 발생하는 예외"""
+    
+    def __init__(self, version_id: str, current_updated_at: str):
+        super().__init__(f"Cover Letter가 다른 요청에 의해 먼저 수정되었습니다 (현재 updated_at: {current_updated_at})")
+        self.version_id = version_id
+        self.current_updated_at = current_updated_at
+
 class CoverLetterManager:
     """Cover Letter 관리를 위한 클래스"""
     
-    def __init__(self, storage_dir: str = "cover_letters"):
+    def __init__(
+        self,
+        storage_dir: str = "cover_letters",
+        backend=None,
+        cache: CoverLetterCache = None,
+        auto_rebuild_catalog: bool = True
+    ):
+        """
+        auto_rebuild_catalog=False이면 카탈로그가 비어 있어도 생성 시 다시 만들지 않습니다
+        (마이그레이션처럼 호출자가 곧바로 rebuild_catalog를 부르는 경우).
+        """
         self.storage_dir = storage_dir
         os.makedirs(storage_dir, exist_ok=True)
+        
+        # 본문 저장 백엔드 (STORAGE_BACKEND 설정에 따라 JSON 파일 또는 SQLite)
+        self.backend = backend or create_document_backend("cover_letters", storage_dir)
+        
+        # 최근 사용한 Cover Letter 캐시 (설정 시 섹션 수정은 모아서 지연 저장)
+        self.cache = cache or CoverLetterCache()
+        self.cache.flush_func = self.flush
+        if self.cache.write_back:
+            atexit.register(self.flush)
+        
+        # 목록 조회용 버전 요약 카탈로그 (비어 있으면 저장된 본문에서 한 번에 가져옴)
+        if isinstance(self.backend, SQLiteDocumentBackend):
+            catalog_path = self.backend.database.path
+        else:
+            catalog_path = os.path.join(storage_dir, "catalog.sqlite3")
+        self.catalog = CoverLetterCatalog(catalog_path)
+        if auto_rebuild_catalog and self.catalog.count() == 0:
+            self.rebuild_catalog()
+        
+        # 섹션 히스토리는 본문과 분리된 추가 전용 로그에 보관
+        self.history = SectionHistoryLog(os.path.join(storage_dir, "history"))
+    
+    def version_lock(self, version_id: str):
+        """한 버전의 읽기-수정-쓰기 구간을 다른 스레드/프로세스와 겹치지 않게 잠급니다."""
+        return self.backend.lock(version_id)
+    
+    def _check_expected(self, cover_letter: CoverLetterVersion, expected_updated_at: Optional[str]):
+        """expected_updated_at이 주어졌고 현재 값과 다르면 충돌 예외를 발생시킵니다."""
+        if expected_updated_at is not None and cover_letter.updated_at != expected_updated_at:
+            raise CoverLetterConflictError(cover_letter.version_id, cover_letter.updated_at)
     
-    def _get_file_path(self, version_id: str) -> str:
-        """버전 ID에 해당하는 파일 경로를 반환합니다."""
-        return os.path.join(self.storage_dir, f"{version_id}.json")
+    def _summarize(self, cover_letter: CoverLetterVersion) -> Dict[str, object]:
+        """카탈로그에 저장할 버전 요약을 만듭니다."""
+        return {
+            'version_id': cover_letter.version_id,
+            'job_title': cover_letter.job_title,
+            'company_name': cover_letter.company_name,
+            'created_at': cover_letter.created_at,
+            'updated_at': cover_letter.updated_at,
+            'edited_sections': sum(1 for section in cover_letter.sections.values() if section.is_edited),
+            'total_sections': len(cover_letter.sections)
+        }
     
-    def save_cover_letter(self, cover_letter: CoverLetterVersion) -> bool:
-        """Cover Letter를 파일에 저장합니다."""
+    def rebuild_catalog(self) -> int:
+        """저장된 모든 Cover Letter로 카탈로그를 다시 만들고 등록된 수를 반환합니다."""
+        summaries = []
+        for version_id in self.get_all_versions():
+            cover_letter = self.load_cover_letter(version_id)
+            if cover_letter:
+                summaries.append(self._summarize(cover_letter))
+        self.catalog.replace_all(summaries)
+        return len(summaries)
+    
+    def list_versions(self, limit: int = 50, cursor: str = None):
+        """카탈로그에서 최근 수정 순으로 버전 요약 한 페이지와 다음 커서를 반환합니다."""
+        return self.catalog.list_page(limit=limit, cursor=cursor)
+    
+    def save_cover_letter(self, cover_letter: CoverLetterVersion, expected_updated_at: str = None) -> bool:
+        """Cover Letter를 저장합니다. expected_updated_at이 주어지면 저장된 값과 같을 때만 저장합니다."""
         try:
-            file_path = self._get_file_path(cover_letter.version_id)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(cover_letter.dict(), f, ensure_ascii=False, indent=2)
+            with self.version_lock(cover_letter.version_id):
+                if expected_updated_at is not None:
+                    current = self.load_cover_letter(cover_letter.version_id)
+                    if current:
+                        self._check_expected(current, expected_updated_at)
+                self._write_cover_letter(cover_letter)
             return True
+        except CoverLetterConflictError:
+            raise
         except Exception as e:
             print(f"Cover Letter 저장 실패: {str(e)}")
             return False
     
+    def _write_cover_letter(self, cover_letter: CoverLetterVersion, defer: bool = False):
+        """
+        잠금을 잡은 상태에서 본문을 백엔드에 원자적으로 저장하고 카탈로그를 갱신합니다.
+        defer이고 지연 저장이 켜져 있으면 캐시에만 반영하고 다음 flush 때 저장합니다.
+        """
+        self._migrate_legacy_history(cover_letter)
+        
+        if defer and self.cache.write_back:
+            self.cache.defer(cover_letter.version_id, cover_letter)
+            return
+        self._persist(cover_letter)
+    
+    def _migrate_legacy_history(self, cover_letter: CoverLetterVersion) -> bool:
+        """
+        예전 형식처럼 문서 안에 남아 있는 히스토리를 로그로 옮기고 본문에서 제거합니다.
+        새 히스토리 항목보다 먼저 옮겨야 로그의 순서가 유지됩니다. 옮긴 항목이 있으면 True를 반환합니다.
+        """
+        migrated = False
+        for section_name, section in cover_letter.sections.items():
+            if section.version_history:
+                self.history.append(
+                    cover_letter.version_id,
+                    section_name,
+                    [version.model_dump() for version in section.version_history]
+                )
+                section.version_history = []
+                migrated = True
+        return migrated
+    
+    def _persist(self, cover_letter: CoverLetterVersion):
+        """본문과 카탈로그를 저장하고 캐시를 저장된 내용으로 갱신합니다."""
+        self.backend.save(cover_letter.version_id, cover_letter.model_dump())
+        self.catalog.upsert([self._summarize(cover_letter)])
+        self.cache.store(cover_letter.version_id, cover_letter, self.backend.stamp(cover_letter.version_id))
+    
+    def flush(self) -> int:
+        """지연 저장 중인 수정을 모두 저장하고 저장한 버전 수를 반환합니다."""
+        start = time.perf_counter()
+        flushed = 0
+        errors = 0
+        for version_id in self.cache.dirty_ids():
+            try:
+                with self.version_lock(version_id):
+                    cover_letter = self.cache.pending(version_id)
+                    if cover_letter is None:
+                        continue
+                    self._persist(cover_letter)
+                    flushed += 1
+            except Exception as e:
+                errors += 1
+                print(f"Cover Letter 지연 저장 실패: {str(e)}")
+        if flushed or errors:
+            self.cache.record_flush((time.perf_counter() - start) * 1000, flushed, errors)
+        return flushed
+    
     def load_cover_letter(self, version_id: str) -> Optional[CoverLetterVersion]:
-        """Cover Letter를 파일에서 로드합니다."""
+        """Cover Letter를 로드합니다. 캐시에 있고 저장소 내용이 그대로면 다시 읽지 않습니다."""
         try:
-            file_path = self._get_file_path(version_id)
-            if not os.path.exists(file_path):
+            stamp_func = lambda: self.backend.stamp(version_id)
+            cached = self.cache.get(version_id, stamp_func)
+            if cached is not None:
+                return cached
+            stamp = stamp_func() if self.cache.enabled else None
+            data = self.backend.load(version_id)
+            if data is None:
                 return None
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return CoverLetterVersion(**data)
+            cover_letter = CoverLetterVersion(**data)
+            self.cache.fill(version_id, cover_letter, stamp)
+            return cover_letter
         except Exception as e:
             print(f"Cover Letter 로드 실패: {str(e)}")
             return None
     
-    def update_section(self, version_id: str, section_name: str, new_content: str, change_description: str = None) -> bool:
-        """특정 섹션을 업데이트하고 버전 히스토리에 추가합니다."""
+    def _new_section_version(self, content: str, change_description: str) -> SectionVersion:
+        """섹션 내용으로 새 히스토리 항목을 만듭니다."""
+        return SectionVersion(
+            version_id=str(uuid.uuid4()),
+            content=content,
+            created_at=datetime.now().isoformat(),
+            change_description=change_description
+        )
+    
+    def update_section(
+        self,
+        version_id: str,
+        section_name: str,
+        new_content: str,
+        change_description: str = None,
+        expected_updated_at: str = None
+    ) -> Optional[CoverLetterVersion]:
+        """
+        특정 섹션을 업데이트하고 이전 내용을 히스토리 로그에 추가합니다.
+        업데이트된 Cover Letter를 반환하고, Cover Letter나 섹션이 없으면 None을 반환합니다.
+        """
         try:
+            with self.version_lock(version_id):
+                cover_letter = self.load_cover_letter(version_id)
+                if not cover_letter:
+                    return None
+                self._check_expected(cover_letter, expected_updated_at)
+                self._migrate_legacy_history(cover_letter)
+                
+                # 섹션 업데이트
+                if section_name in cover_letter.sections:
+                    section = cover_letter.sections[section_name]
+                    
+                    # 현재 내용을 히스토리 로그에 추가
+                    if section.content != new_content:
+                        section_version = self._new_section_version(
+                            section.content, change_description or f"{section_name} 섹션 수정"
+                        )
+                        self.history.append(version_id, section_name, [section_version.model_dump()])
+                    
+                    # 새 내용으로 업데이트
+                    section.content = new_content
+                    section.is_edited = True
+                    section.edited_at = datetime.now().isoformat()
+                    cover_letter.updated_at = datetime.now().isoformat()
+                    
+                    self._write_cover_letter(cover_letter, defer=True)
+                    return cover_letter
+                return None
+        except CoverLetterConflictError:
+            raise
+        except Exception as e:
+            print(f"섹션 업데이트 실패: {str(e)}")
+            return None
+
+    def save_all_sections(
+        self,
+        version_id: str,
+        sections: Dict[str, str],
+        expected_updated_at: str = None
+    ) -> Optional[CoverLetterVersion]:
+        """여러 섹션을 한 번에 저장하고 저장된 Cover Letter를 반환합니다. 없으면 None을 반환합니다."""
+        with self.version_lock(version_id):
             cover_letter = self.load_cover_letter(version_id)
             if not cover_letter:
-                return False
+                return None
+            self._check_expected(cover_letter, expected_updated_at)
             
-            # 섹션 업데이트
-            if section_name in cover_letter.sections:
-                section = cover_letter.sections[section_name]
-                
-                # 현재 내용을 버전 히스토리에 추가
-                if section.content != new_content:
-                    section_version = SectionVersion(
-                        version_id=str(uuid.uuid4()),
-                        content=section.content,
-                        created_at=datetime.now().isoformat(),
-                        change_description=change_description or f"{section_name} 섹션 수정"
-                    )
-                    section.version_history.append(section_version)
+            # 모든 섹션 업데이트
+            for section_name, content in sections.items():
+                if section_name in cover_letter.sections:
+                    cover_letter.sections[section_name].content = content
+                    cover_letter.sections[section_name].is_edited = True
+                    cover_letter.sections[section_name].edited_at = datetime.now().isoformat()
+            
+            cover_letter.updated_at = datetime.now().isoformat()
+            self._write_cover_letter(cover_letter, defer=True)
+            return cover_letter
+
+    def add_section_version(self, version_id: str, section_name: str, change_description: str = None) -> Optional[SectionVersion]:
+        """섹션의 현재 내용을 히스토리에 새 버전으로 추가합니다. 본문 파일은 다시 쓰지 않습니다."""
+        try:
+            with self.version_lock(version_id):
+                cover_letter = self.load_cover_letter(version_id)
+                if not cover_letter or section_name not in cover_letter.sections:
+                    return None
                 
-                # 새 내용으로 업데이트
-                section.content = new_content
-                section.is_edited = True
-                section.edited_at = datetime.now().isoformat()
-                cover_letter.updated_at = datetime.now().isoformat()
+                # 예전 형식의 히스토리가 있으면 먼저 로그로 옮기고 본문에서 제거
+                if self._migrate_legacy_history(cover_letter):
+                    self._write_cover_letter(cover_letter)
                 
-                return self.save_cover_letter(cover_letter)
-            return False
+                section_version = self._new_section_version(
+                    cover_letter.sections[section_name].content,
+                    change_description or f"{section_name} 섹션 버전 저장"
+                )
+                self.history.append(version_id, section_name, [section_version.model_dump()])
+                return section_version
         except Exception as e:
-            print(f"섹션 업데이트 실패: {str(e)}")
-            return False
+            print(f"섹션 버전 저장 실패: {str(e)}")
+            return None
 
     def get_section_history(self, version_id: str, section_name: str) -> List[SectionVersion]:
-        """특정 섹션의 버전 히스토리를 반환합니다."""
+        """특정 섹션의 버전 히스토리를 오래된 순으로 반환합니다."""
         try:
             cover_letter = self.load_cover_letter(version_id)
             if not cover_letter or section_name not in cover_letter.sections:
                 return []
             
-            return cover_letter.sections[section_name].version_history
+            # 아직 로그로 옮겨지지 않은 예전 형식의 히스토리도 함께 반환
+            legacy = cover_letter.sections[section_name].version_history
+            return legacy + [SectionVersion(**entry) for entry in self.history.read(version_id, section_name)]
         except Exception as e:
             print(f"섹션 히스토리 조회 실패: {str(e)}")
             return []
@@ -149,38 +361,36 @@ class CoverLetterManager:
     def revert_section(self, version_id: str, section_name: str, target_version_id: str) -> bool:
         """특정 섹션을 이전 버전으로 되돌립니다."""
         try:
-            cover_letter = self.load_cover_letter(version_id)
-            if not cover_letter or section_name not in cover_letter.sections:
-                return False
-            
-            section = cover_letter.sections[section_name]
-            
-            # 타겟 버전 찾기
-            target_version = None
-            for version in section.version_history:
-                if version.version_id == target_version_id:
-                    target_version = version
-                    break
-            
-            if not target_version:
-                return False
-            
-            # 현재 내용을 히스토리에 추가
-            current_version = SectionVersion(
-                version_id=str(uuid.uuid4()),
-                content=section.content,
-                created_at=datetime.now().isoformat(),
-                change_description=f"{section_name} 섹션 되돌리기"
-            )
-            section.version_history.append(current_version)
-            
-            # 타겟 버전으로 되돌리기
-            section.content = target_version.content
-            section.is_edited = True
-            section.edited_at = datetime.now().isoformat()
-            cover_letter.updated_at = datetime.now().isoformat()
-            
-            return self.save_cover_letter(cover_letter)
+            with self.version_lock(version_id):
+                cover_letter = self.load_cover_letter(version_id)
+                if not cover_letter or section_name not in cover_letter.sections:
+                    return False
+                
+                section = cover_letter.sections[section_name]
+                
+                # 타겟 버전 찾기
+                target_version = None
+                for version in self.get_section_history(version_id, section_name):
+                    if version.version_id == target_version_id:
+                        target_version = version
+                        break
+                
+                if not target_version:
+                    return False
+                self._migrate_legacy_history(cover_letter)
+                
+                # 현재 내용을 히스토리 로그에 추가
+                current_version = self._new_section_version(section.content, f"{section_name} 섹션 되돌리기")
+                self.history.append(version_id, section_name, [current_version.model_dump()])
+                
+                # 타겟 버전으로 되돌리기
+                section.content = target_version.content
+                section.is_edited = True
+                section.edited_at = datetime.now().isoformat()
+                cover_letter.updated_at = datetime.now().isoformat()
+                
+                self._write_cover_letter(cover_letter)
+                return True
         except Exception as e:
             print(f"섹션 되돌리기 실패: {str(e)}")
             return False
@@ -188,8 +398,7 @@ class CoverLetterManager:
     def get_all_versions(self) -> List[str]:
         """모든 버전 ID를 반환합니다."""
         try:
-            files = [f for f in os.listdir(self.storage_dir) if f.endswith('.json')]
-            return [f.replace('.json', '') for f in files]
+            return self.backend.keys()
         except Exception as e:
             print(f"버전 목록 조회 실패: {str(e)}")
             return []
@@ -197,11 +406,13 @@ class CoverLetterManager:
     def delete_cover_letter(self, version_id: str) -> bool:
         """Cover Letter를 삭제합니다."""
         try:
-            file_path = self._get_file_path(version_id)
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                return True
-            return False
+            with self.version_lock(version_id):
+                self.cache.invalidate(version_id)
+                if self.backend.delete(version_id):
+                    self.catalog.remove(version_id)
+                    self.history.delete(version_id)
+                    return True
+                return False
         except Exception as e:
             print(f"Cover Letter 삭제 실패: {str(e)}")
             return False
@@ -1,9 +1,17 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, AsyncIterator, Tuple
 from retrieval import get_retrieval_component
 from llm_integration import get_llm_integration
+from executors import run_blocking
+from pipeline_stages import StageGraph
+import asyncio
 import json
+import os
+import time
 from datetime import datetime
 
+# 일괄 생성 시 동시에 처리할 요청 수
+BATCH_MAX_WORKERS = int(os.getenv('BATCH_MAX_WORKERS', '4'))
+
 class CoverLetterPipeline:
     def __init__(self):
         """
@@ -12,35 +20,34 @@ class CoverLetterPipeline:
         self.retrieval = get_retrieval_component()
         self.llm = get_llm_integration()
     
-    def generate_cover_letter(
+    async def agenerate_cover_letter(
         self,
         job_title: str,
         company_name: str,
         user_question: str = None,
         user_background: str = None,
         include_variations: bool = False,
-        num_variations: int = 3
+        num_variations: int = 3,
+        context: Dict[str, Any] = None,
+        cache_mode: str = None
     ) -> Dict[str, Any]:
         """
-        Cover Letter를 생성하는 메인 파이프라인입니다.
+        이벤트 루프를 막지 않는 Cover Letter 생성 파이프라인입니다.
+        검색은 스레드 풀에서, LLM 호출은 비동기 클라이언트로 수행합니다.
+        이미 검색한 context가 주어지면 검색 단계를 건너뜁니다.
         """
         try:
-            # 1단계: 관련 컨텍스트 검색
-            context = self.retrieval.retrieve_context_for_cover_letter(
-                job_title=job_title,
-                company_name=company_name,
-                user_question=user_question
-            )
+            # 1단계: 관련 컨텍스트 검색 (임베딩/Chroma는 블로킹 작업)
+            if context is None:
+                context = await self.aretrieve_context(job_title, company_name, user_question)
             
-            # 2단계: Job Posting 정보 추출
+            # 2~3단계: Job Posting 정보 추출 및 컨텍스트 결합
             job_description = self._extract_job_description(context['job_postings'])
-            
-            # 3단계: 관련 컨텍스트 결합
             relevant_context = self._combine_context(context)
             
             # 4단계: Cover Letter 생성
             if include_variations:
-                result = self.llm.generate_cover_letter_variations(
+                result = await self.llm.agenerate_cover_letter_variations(
                     job_title=job_title,
                     company_name=company_name,
                     job_description=job_description,
@@ -50,34 +57,118 @@ class CoverLetterPipeline:
                     num_variations=num_variations
                 )
             else:
-                result = self.llm.generate_cover_letter(
+                result = await self.llm.agenerate_cover_letter(
                     job_title=job_title,
                     company_name=company_name,
                     job_description=job_description,
                     user_question=user_question,
                     relevant_context=relevant_context,
-                    user_background=user_background
+                    user_background=user_background,
+                    cache_mode=cache_mode
                 )
             
             # 5단계: 결과에 컨텍스트 정보 추가
-            result['context_info'] = {
-                'job_postings_found': len(context['job_postings']),
-                'pdf_documents_found': len(context['pdf_documents']),
-                'avg_job_similarity': context['summary']['avg_job_similarity'],
-                'avg_pdf_similarity': context['summary']['avg_pdf_similarity']
-            }
-            
-            result['pipeline_info'] = {
-                'generated_at': datetime.now().isoformat(),
-                'pipeline_version': '1.0',
-                'components_used': ['retrieval', 'llm_integration']
-            }
-            
-            return result
+            return self._add_pipeline_info(result, context)
         
         except Exception as e:
             raise Exception(f"Cover Letter 파이프라인 실행 실패: {str(e)}")
     
+    async def astream_cover_letter(
+        self,
+        job_title: str,
+        company_name: str,
+        user_question: str = None,
+        user_background: str = None,
+        cache_mode: str = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Cover Letter 생성 과정을 (이벤트 이름, 데이터) 순서로 내보냅니다.
+        검색이 끝나면 'metadata', 모델 출력마다 'token', 마지막에 context_info를 담은 'done'을 보냅니다.
+        """
+        start = time.perf_counter()
+        context = await self.aretrieve_context(job_title, company_name, user_question)
+        retrieval_ms = round((time.perf_counter() - start) * 1000, 2)
+        
+        job_description = self._extract_job_description(context['job_postings'])
+        relevant_context = self._combine_context(context)
+        
+        yield 'metadata', {
+            'job_title': job_title,
+            'company_name': company_name,
+            'job_postings': [
+                {'id': job['id'], 'similarity_score': job['similarity_score'], 'metadata': job['metadata']}
+                for job in context['job_postings']
+            ],
+            'pdf_documents': [
+                {'id': doc['id'], 'similarity_score': doc['similarity_score'], 'metadata': doc['metadata']}
+                for doc in context['pdf_documents']
+            ],
+            'retrieval_timings': context.get('timings'),
+            'retrieval_ms': retrieval_ms
+        }
+        
+        parts = []
+        first_token_ms = None
+        stream_info = {}
+        async for delta in self.llm.astream_cover_letter(
+            job_title=job_title,
+            company_name=company_name,
+            job_description=job_description,
+            user_question=user_question,
+            relevant_context=relevant_context,
+            user_background=user_background,
+            cache_mode=cache_mode,
+            stream_info=stream_info
+        ):
+            if first_token_ms is None:
+                first_token_ms = round((time.perf_counter() - start) * 1000, 2)
+            parts.append(delta)
+            yield 'token', {'text': delta}
+        
+        # 일반 생성 엔드포인트와 같은 형식 (generation_info.cache, context_info, pipeline_info)
+        result = self.llm._build_generation_result(
+            ''.join(parts), job_title, company_name, relevant_context, cache_status=stream_info.get('cache_status')
+        )
+        result = self._add_pipeline_info(result, context)
+        result['pipeline_info']['streaming_timings'] = {
+            'retrieval_ms': retrieval_ms,
+            'first_token_ms': first_token_ms,
+            'total_ms': round((time.perf_counter() - start) * 1000, 2),
+            'token_events': len(parts)
+        }
+        yield 'done', result
+    
+    async def aretrieve_context(self, job_title: str, company_name: str, user_question: str = None) -> Dict[str, Any]:
+        """
+        스레드 풀에서 Cover Letter 생성용 컨텍스트를 검색합니다.
+        """
+        return await run_blocking(
+            self.retrieval.retrieve_context_for_cover_letter,
+            job_title=job_title,
+            company_name=company_name,
+            user_question=user_question
+        )
+    
+    def _add_pipeline_info(self, result: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        생성 결과에 컨텍스트 정보와 파이프라인 정보를 추가합니다.
+        """
+        result['context_info'] = {
+            'job_postings_found': len(context['job_postings']),
+            'pdf_documents_found': len(context['pdf_documents']),
+            'avg_job_similarity': context['summary']['avg_job_similarity'],
+            'avg_pdf_similarity': context['summary']['avg_pdf_similarity']
+        }
+        
+        result['pipeline_info'] = {
+            'generated_at': datetime.now().isoformat(),
+            'pipeline_version': '1.0',
+            'components_used': ['retrieval', 'llm_integration'],
+            'retrieval_timings': context.get('timings')
+        }
+        
+        return result
+    
     def _extract_job_description(self, job_postings: List[Dict[str, Any]]) -> str:
         """
         Job Posting에서 직무 설명을 추출합니다.
@@ -130,7 +221,7 @@ class CoverLetterPipeline:
         
         return combined[:5]  # 상위 5개만 반환
     
-    def analyze_and_generate(
+    async def aanalyze_and_generate(
         self,
         job_title: str,
         company_name: str,
@@ -139,85 +230,117 @@ class CoverLetterPipeline:
         user_background: str = None
     ) -> Dict[str, Any]:
         """
-        Job Posting을 분석하고 Cover Letter를 생성합니다.
+        Job Posting 분석과 컨텍스트 검색을 동시에 실행한 뒤 Cover Letter를 생성합니다.
+        단계별 실행 시간은 pipeline_info['stage_timings']에 기록됩니다.
         """
         try:
-            # 1단계: Job Posting 분석
-            analysis = self.llm.analyze_job_posting(job_description)
+            async def analyze(_):
+                return await self.llm.aanalyze_job_posting(job_description)
             
-            # 2단계: 관련 컨텍스트 검색
-            context = self.retrieval.retrieve_context_for_cover_letter(
-                job_title=job_title,
-                company_name=company_name,
-                user_question=user_question
-            )
+            async def retrieve(_):
+                return await self.aretrieve_context(job_title, company_name, user_question)
             
-            # 3단계: 관련 컨텍스트 결합
-            relevant_context = self._combine_context(context)
+            async def generate(inputs):
+                return await self.llm.agenerate_cover_letter(
+                    job_title=job_title,
+                    company_name=company_name,
+                    job_description=job_description,
+                    user_question=user_question,
+                    relevant_context=self._combine_context(inputs['retrieval']),
+                    user_background=user_background
+                )
             
-            # 4단계: Cover Letter 생성
-            result = self.llm.generate_cover_letter(
-                job_title=job_title,
-                company_name=company_name,
-                job_description=job_description,
-                user_question=user_question,
-                relevant_context=relevant_context,
-                user_background=user_background
-            )
+            # 분석과 검색은 서로 의존하지 않으므로 동시에 실행되고, 생성은 검색 결과만 기다림
+            graph = StageGraph()
+            graph.add_stage('analysis', analyze)
+            graph.add_stage('retrieval', retrieve)
+            graph.add_stage('generation', generate, depends_on=['retrieval'])
+            run = await graph.run()
             
-            # 5단계: 결과에 분석 정보 추가
-            result['job_analysis'] = analysis['analysis']
-            result['context_info'] = {
-                'job_postings_found': len(context['job_postings']),
-                'pdf_documents_found': len(context['pdf_documents']),
-                'avg_job_similarity': context['summary']['avg_job_similarity'],
-                'avg_pdf_similarity': context['summary']['avg_pdf_similarity']
-            }
+            context = run['results']['retrieval']
+            result = self._add_pipeline_info(run['results']['generation'], context)
+            result['job_analysis'] = run['results']['analysis']['analysis']
+            result['pipeline_info']['components_used'] = ['llm_analysis', 'retrieval', 'llm_integration']
+            result['pipeline_info']['stage_timings'] = run['timings']
             
             return result
         
         except Exception as e:
             raise Exception(f"분석 및 생성 파이프라인 실행 실패: {str(e)}")
     
-    def batch_generate_cover_letters(
+    async def abatch_generate_cover_letters(
         self,
-        requests: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+        requests: List[Dict[str, Any]],
+        max_workers: int = None,
+        on_progress: Callable[[int, str, Dict[str, Any]], None] = None
+    ) -> Dict[str, Any]:
         """
-        여러 Cover Letter를 일괄 생성합니다.
+        여러 Cover Letter를 워커 풀로 동시에 일괄 생성합니다.
+        같은 (직무, 회사, 질문) 조합은 컨텍스트 검색을 한 번만 수행하고 공유합니다.
+        on_progress(index, status, payload)로 항목별 진행 상황을 알립니다.
         """
         try:
-            results = []
+            if max_workers is None:
+                max_workers = BATCH_MAX_WORKERS
+            results = [None] * len(requests)
+            shared_contexts = {}
+            queue = asyncio.Queue()
+            for i in range(len(requests)):
+                queue.put_nowait(i)
+            
+            def notify(index: int, status: str, payload: Dict[str, Any] = None):
+                if on_progress:
+                    on_progress(index, status, payload or {})
             
-            for i, request in enumerate(requests):
-                try:
-                    result = self.generate_cover_letter(
-                        job_title=request['job_title'],
-                        company_name=request['company_name'],
-                        user_question=request.get('user_question'),
-                        user_background=request.get('user_background'),
-                        include_variations=request.get('include_variations', False),
-                        num_variations=request.get('num_variations', 3)
-                    )
+            async def get_shared_context(request: Dict[str, Any]) -> Dict[str, Any]:
+                key = (request['job_title'], request['company_name'], request.get('user_question'))
+                if key not in shared_contexts:
+                    shared_contexts[key] = asyncio.ensure_future(self.aretrieve_context(*key))
+                return await shared_contexts[key]
+            
+            async def worker():
+                while True:
+                    try:
+                        i = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    request = requests[i]
+                    notify(i, 'running')
+                    try:
+                        context = await get_shared_context(request)
+                        result = await self.agenerate_cover_letter(
+                            job_title=request['job_title'],
+                            company_name=request['company_name'],
+                            user_question=request.get('user_question'),
+                            user_background=request.get('user_background'),
+                            include_variations=request.get('include_variations', False),
+                            num_variations=request.get('num_variations', 3),
+                            context=context,
+                            cache_mode=request.get('cache')
+                        )
+                        result['request_index'] = i
+                        result['request_info'] = request
+                        results[i] = result
+                        notify(i, 'completed', result)
                     
-                    result['request_index'] = i
-                    result['request_info'] = request
-                    results.append(result)
-                
-                except Exception as e:
-                    # 개별 요청 실패 시 에러 정보 포함
-                    results.append({
-                        'request_index': i,
-                        'request_info': request,
-                        'error': str(e),
-                        'status': 'failed'
-                    })
+                    except Exception as e:
+                        # 개별 요청 실패 시 에러 정보 포함
+                        results[i] = {
+                            'request_index': i,
+                            'request_info': request,
+                            'error': str(e),
+                            'status': 'failed'
+                        }
+                        notify(i, 'failed', results[i])
+            
+            await asyncio.gather(*[worker() for _ in range(max(1, min(max_workers, len(requests))))])
             
             return {
                 'batch_results': results,
                 'total_requests': len(requests),
                 'successful': len([r for r in results if r.get('status') != 'failed']),
                 'failed': len([r for r in results if r.get('status') == 'failed']),
+                'shared_retrievals': len(requests) - len(shared_contexts),
                 'batch_completed_at': datetime.now().isoformat()
             }
         
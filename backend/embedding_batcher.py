@@ -0,0 +1,172 @@
+from typing import List, Dict, Any, Callable
+from collections import deque
+from concurrent.futures import Future
+import os
+import threading
+import time
+import numpy as np
+
+# 한 번의 encode 호출로 합칠 최대 텍스트 수 (이보다 큰 요청은 합치지 않고 바로 인코딩)
+DEFAULT_EMBEDDING_BATCH_MAX_SIZE = int(os.getenv('EMBEDDING_BATCH_MAX_SIZE', '32'))
+# 첫 요청이 도착한 뒤 다른 요청을 기다리는 최대 시간(ms). 0이면 이미 대기 중인 요청만 합침
+DEFAULT_EMBEDDING_BATCH_MAX_WAIT_MS = float(os.getenv('EMBEDDING_BATCH_MAX_WAIT_MS', '2'))
+
+
+class _DispatcherStopped(Exception):
+    """배치 스레드가 예기치 않게 종료되어 요청을 처리하지 못했음을 알리는 예외"""
+
+
+class _PendingRequest:
+    __slots__ = ('texts', 'future', 'enqueued_at')
+
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class EmbeddingMicroBatcher:
+    def __init__(
+        self,
+        encode_func: Callable[[List[str]], np.ndarray],
+        max_batch_size: int = None,
+        max_wait_ms: float = None
+    ):
+        """
+        여러 스레드에서 동시에 들어오는 작은 encode 요청을 한 번의 배치 호출로 합치는 마이크로 배처를 초기화합니다.
+        전용 스레드 하나가 대기 중인 요청을 max_batch_size까지 모아 encode_func를 한 번 호출하고
+        결과를 요청별로 나눠 돌려줍니다. 모델이 인코딩하는 동안 도착한 요청은 다음 배치로 합쳐집니다.
+        """
+        self.encode_func = encode_func
+        self.max_batch_size = max(1, max_batch_size or DEFAULT_EMBEDDING_BATCH_MAX_SIZE)
+        self.max_wait_seconds = max(0.0, DEFAULT_EMBEDDING_BATCH_MAX_WAIT_MS if max_wait_ms is None else max_wait_ms) / 1000
+        self._pending = deque()
+        # 큐에서 꺼냈지만 아직 결과를 전달하지 않은 배치 (배치 스레드가 죽었을 때 실패 처리할 대상)
+        self._in_flight = []
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stats = {
+            'requests': 0,
+            'direct_requests': 0,
+            'batches': 0,
+            'batched_texts': 0,
+            'max_batch_texts': 0,
+            'total_queue_ms': 0.0,
+            'dispatcher_failures': 0,
+            'fallback_requests': 0
+        }
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        텍스트 리스트를 임베딩 배열로 변환합니다. 작은 요청은 다른 요청과 합쳐서 인코딩합니다.
+        """
+        if not texts or len(texts) >= self.max_batch_size:
+            with self._condition:
+                self._stats['direct_requests'] += 1
+            return self.encode_func(texts)
+
+        request = _PendingRequest(list(texts))
+        with self._condition:
+            # fork된 자식 프로세스에는 배치 스레드가 없으므로 다시 시작
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+                self._thread.start()
+            self._pending.append(request)
+            self._stats['requests'] += 1
+            self._condition.notify()
+        try:
+            return request.future.result()
+        except _DispatcherStopped:
+            # 배치 스레드가 죽었으면 이 요청은 직접 인코딩 (스레드는 다음 요청 때 다시 시작)
+            with self._condition:
+                self._stats['fallback_requests'] += 1
+            return self.encode_func(texts)
+
+    def _take_batch(self) -> List[_PendingRequest]:
+        """
+        첫 요청이 들어올 때까지 기다린 뒤, max_wait 동안 max_batch_size까지 요청을 모아 꺼냅니다.
+        """
+        with self._condition:
+            while not self._pending:
+                self._condition.wait()
+            deadline = self._pending[0].enqueued_at + self.max_wait_seconds
+            while sum(len(request.texts) for request in self._pending) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch = []
+            size = 0
+            while self._pending and (not batch or size + len(self._pending[0].texts) <= self.max_batch_size):
+                request = self._pending.popleft()
+                batch.append(request)
+                size += len(request.texts)
+            self._in_flight = batch
+            return batch
+
+    def _run(self):
+        """
+        배치 스레드 본체입니다. 어떤 이유로든 종료되면 처리 중이던 배치와 대기 중인 요청을
+        모두 실패 처리해 호출자가 영원히 기다리지 않도록 합니다.
+        """
+        try:
+            while True:
+                self._process(self._take_batch())
+        except BaseException as e:
+            error = _DispatcherStopped(f"임베딩 배치 스레드 종료: {e!r}")
+            with self._condition:
+                orphaned = self._in_flight + list(self._pending)
+                self._in_flight = []
+                self._pending.clear()
+                if self._thread is threading.current_thread():
+                    self._thread = None
+                self._stats['dispatcher_failures'] += 1
+            for request in orphaned:
+                if not request.future.done():
+                    request.future.set_exception(error)
+
+    def _process(self, batch: List[_PendingRequest]):
+        """
+        한 배치를 인코딩하고 결과를 요청별로 나눠 전달합니다. 인코딩 오류는 배치의 모든 요청에 전달합니다.
+        """
+        started_at = time.perf_counter()
+        texts = [text for request in batch for text in request.texts]
+        try:
+            embeddings = self.encode_func(texts)
+            if len(embeddings) != len(texts):
+                raise ValueError(f"임베딩 수({len(embeddings)})가 텍스트 수({len(texts)})와 다릅니다.")
+
+            # 요청별로 결과를 나눠 전달
+            offset = 0
+            for request in batch:
+                request.future.set_result(np.array(embeddings[offset:offset + len(request.texts)]))
+                offset += len(request.texts)
+        except Exception as e:
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            with self._condition:
+                self._in_flight = []
+            return
+
+        with self._condition:
+            self._in_flight = []
+            self._stats['batches'] += 1
+            self._stats['batched_texts'] += len(texts)
+            self._stats['max_batch_texts'] = max(self._stats['max_batch_texts'], len(texts))
+            self._stats['total_queue_ms'] += sum((started_at - request.enqueued_at) * 1000 for request in batch)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        요청 수, 배치 수, 평균 배치 크기와 평균 대기 시간을 반환합니다.
+        """
+        with self._condition:
+            stats = dict(self._stats)
+            stats['pending'] = len(self._pending)
+        batched_requests = stats['requests'] - stats['pending']
+        stats['max_batch_size'] = self.max_batch_size
+        stats['max_wait_ms'] = self.max_wait_seconds * 1000
+        stats['avg_batch_texts'] = stats['batched_texts'] / stats['batches'] if stats['batches'] else 0.0
+        stats['avg_queue_ms'] = stats.pop('total_queue_ms') / batched_requests if batched_requests else 0.0
+        return stats
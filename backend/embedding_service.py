@@ -0,0 +1,147 @@
+from typing import List, Dict, Any, Optional
+from sentence_transformers import SentenceTransformer
+import numpy as np
+import os
+import threading
+import time
+from datetime import datetime
+from chunking import estimate_token_count
+from embedding_batcher import EmbeddingMicroBatcher
+
+DEFAULT_EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+
+def _get_resident_memory_mb() -> Optional[float]:
+    """
+    현재 프로세스의 상주 메모리(RSS)를 MB 단위로 반환합니다.
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            resident_pages = int(f.read().split()[1])
+        return round(resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024), 2)
+    except Exception:
+        pass
+
+    try:
+        import resource
+        # Linux에서는 KB, macOS에서는 바이트 단위의 최대 RSS
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        divisor = 1024 * 1024 if os.uname().sysname == 'Darwin' else 1024
+        return round(max_rss / divisor, 2)
+    except Exception:
+        return None
+
+
+class EmbeddingService:
+    def __init__(self, model_name: str = None):
+        """
+        프로세스 전역에서 공유하는 임베딩 서비스를 초기화합니다.
+        모델은 첫 사용 시 한 번만 로드됩니다.
+        """
+        self.model_name = model_name or os.getenv('EMBEDDING_MODEL_NAME', DEFAULT_EMBEDDING_MODEL)
+        self._model = None
+        self._lock = threading.Lock()
+
+        # 로드 통계
+        self.load_time_seconds = None
+        self.loaded_at = None
+        self.memory_before_load_mb = None
+        self.memory_after_load_mb = None
+        self.encode_calls = 0
+        self.encoded_texts = 0
+
+        # 동시에 들어오는 작은 encode 요청을 한 번의 모델 호출로 합치는 마이크로 배처
+        self.batcher = None
+        if os.getenv('EMBEDDING_MICRO_BATCHING', 'true').lower() == 'true':
+            self.batcher = EmbeddingMicroBatcher(self._encode_batch)
+
+    def get_model(self) -> SentenceTransformer:
+        """
+        SentenceTransformer 모델을 반환합니다. 필요하면 로드합니다.
+        """
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self.memory_before_load_mb = _get_resident_memory_mb()
+                    start = time.perf_counter()
+                    model = SentenceTransformer(self.model_name)
+                    self.load_time_seconds = round(time.perf_counter() - start, 3)
+                    self.memory_after_load_mb = _get_resident_memory_mb()
+                    self.loaded_at = datetime.now().isoformat()
+                    self._model = model
+        return self._model
+
+    def is_loaded(self) -> bool:
+        """
+        모델이 로드되었는지 여부를 반환합니다.
+        """
+        return self._model is not None
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        텍스트 리스트를 임베딩 배열로 변환합니다.
+        마이크로 배칭이 켜져 있으면 다른 스레드의 작은 요청과 합쳐서 모델을 한 번만 호출합니다.
+        """
+        if self.batcher is not None:
+            return self.batcher.encode(texts)
+        return self._encode_batch(texts)
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        모델을 한 번 호출하여 텍스트 리스트를 인코딩합니다.
+        """
+        model = self.get_model()
+        self.encode_calls += 1
+        self.encoded_texts += len(texts)
+        return model.encode(texts)
+
+    def count_tokens(self, text: str) -> int:
+        """
+        모델 토크나이저 기준 토큰 수를 반환합니다 (특수 토큰 제외).
+        토크나이저를 사용할 수 없으면 근사치를 반환합니다.
+        """
+        tokenizer = getattr(self.get_model(), 'tokenizer', None)
+        if tokenizer is None:
+            return estimate_token_count(text)
+        return len(tokenizer(text, add_special_tokens=False)['input_ids'])
+
+    def get_dimension(self) -> int:
+        """
+        임베딩 차원을 반환합니다.
+        """
+        return self.get_model().get_sentence_embedding_dimension()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        모델 로드 시간과 메모리 사용량 등 임베딩 서비스 통계를 반환합니다.
+        """
+        model_memory_mb = None
+        if self.memory_before_load_mb is not None and self.memory_after_load_mb is not None:
+            model_memory_mb = round(self.memory_after_load_mb - self.memory_before_load_mb, 2)
+
+        return {
+            'model_name': self.model_name,
+            'loaded': self.is_loaded(),
+            'loaded_at': self.loaded_at,
+            'load_time_seconds': self.load_time_seconds,
+            'memory_before_load_mb': self.memory_before_load_mb,
+            'memory_after_load_mb': self.memory_after_load_mb,
+            'model_memory_mb': model_memory_mb,
+            'resident_memory_mb': _get_resident_memory_mb(),
+            'pid': os.getpid(),
+            'encode_calls': self.encode_calls,
+            'encoded_texts': self.encoded_texts,
+            'micro_batching': self.batcher.get_stats() if self.batcher is not None else None
+        }
+
+# 전역 임베딩 서비스 인스턴스
+embedding_service = None
+
+def get_embedding_service():
+    """
+    전역 임베딩 서비스 인스턴스를 반환합니다.
+    """
+    global embedding_service
+    if embedding_service is None:
+        embedding_service = EmbeddingService()
+    return embedding_service
@@ -0,0 +1,40 @@
+from typing import Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import os
+
+# PDF 파싱, 임베딩, Chroma 쿼리처럼 이벤트 루프를 막는 작업을 실행할 스레드 수
+DEFAULT_BLOCKING_WORKERS = int(os.getenv('BLOCKING_WORKERS', str(min(8, (os.cpu_count() or 1) + 2))))
+
+# 전역 블로킹 작업 실행기 인스턴스
+blocking_executor = None
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """
+    전역 블로킹 작업 스레드 풀을 반환합니다.
+    """
+    global blocking_executor
+    if blocking_executor is None:
+        blocking_executor = ThreadPoolExecutor(
+            max_workers=DEFAULT_BLOCKING_WORKERS,
+            thread_name_prefix='blocking'
+        )
+    return blocking_executor
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """
+    블로킹 함수를 제한된 스레드 풀에서 실행하고 결과를 기다립니다.
+    이벤트 루프는 그동안 다른 요청(/health 등)을 처리할 수 있습니다.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_blocking_executor(), functools.partial(func, *args, **kwargs))
+
+def shutdown_blocking_executor():
+    """
+    스레드 풀을 종료합니다.
+    """
+    global blocking_executor
+    if blocking_executor is not None:
+        blocking_executor.shutdown(wait=False, cancel_futures=True)
+        blocking_executor = None
@@ -0,0 +1,185 @@
+from typing import List, Dict, Any, Optional
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+# 요청별 캐시 사용 방식: 'bypass'이면 캐시를 읽지 않고 새로 생성한 결과로 덮어씀
+CACHE_MODE_BYPASS = 'bypass'
+
+
+def make_generation_cache_key(
+    model_name: str,
+    temperature: float,
+    messages: List[Dict[str, str]],
+    max_tokens: int = None
+) -> str:
+    """
+    전체 프롬프트(메시지), 모델 이름, temperature로 캐시 키(sha256)를 만듭니다.
+    """
+    payload = json.dumps(
+        {'model': model_name, 'temperature': temperature, 'max_tokens': max_tokens, 'messages': messages},
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class GenerationResultCache:
+    def __init__(self, directory: str = None, max_bytes: int = None, enabled: bool = None):
+        """
+        LLM 생성 결과를 디스크에 보관하는 캐시를 초기화합니다.
+        같은 디렉토리를 쓰는 모든 워커 프로세스가 항목을 공유하므로 디렉토리 자체를 기준으로 조회하고,
+        전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은(mtime 기준) 항목부터 제거합니다.
+        같은 프롬프트로 다시 생성해도 같은 결과가 나오므로 기본값은 꺼져 있습니다.
+        """
+        self.directory = directory or os.getenv('GENERATION_CACHE_DIR', 'generation_cache')
+        self.max_bytes = max_bytes if max_bytes is not None else int(os.getenv('GENERATION_CACHE_MAX_BYTES', str(50 * 1024 * 1024)))
+        self.enabled = enabled if enabled is not None else os.getenv('GENERATION_CACHE_ENABLED', 'false').lower() == 'true'
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.writes = 0
+        self.evictions = 0
+        if self.enabled:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _scan(self) -> Dict[str, Dict[str, Any]]:
+        """
+        디스크에 있는 항목의 크기와 마지막 사용 시각(mtime)을 읽어옵니다.
+        다른 워커가 쓰거나 지운 항목도 반영됩니다.
+        """
+        entries = {}
+        try:
+            with os.scandir(self.directory) as it:
+                for item in it:
+                    if not item.name.endswith('.json'):
+                        continue
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    entries[item.name[:-5]] = {'size': stat.st_size, 'last_used': stat.st_mtime_ns}
+        except OSError:
+            pass
+        return entries
+
+    def get(self, key: str, cache_mode: str = None) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 항목을 반환합니다. 없거나 bypass 요청이면 None을 반환합니다.
+        다른 워커가 저장한 항목도 디스크에서 바로 찾습니다.
+        """
+        if not self.enabled:
+            return None
+        if cache_mode == CACHE_MODE_BYPASS:
+            with self._lock:
+                self.bypasses += 1
+            return None
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        # mtime을 마지막 사용 시각으로 사용 (모든 워커의 LRU 순서가 같도록)
+        now = time.time_ns()
+        try:
+            os.utime(self._path(key), ns=(now, now))
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, value: Dict[str, Any]):
+        """
+        항목을 저장하고 디렉토리 전체 크기가 한도를 넘으면 오래된 항목을 제거합니다.
+        """
+        if not self.enabled:
+            return
+        entry = dict(value, cached_at=datetime.now().isoformat())
+        data = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        if len(data) > self.max_bytes:
+            return
+        # 임시 파일에 쓴 뒤 이름을 바꿔 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 함
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        now = time.time_ns()
+        os.utime(temp_path, ns=(now, now))
+        os.replace(temp_path, self._path(key))
+        with self._lock:
+            self.writes += 1
+            self._evict()
+
+    def _evict(self):
+        """
+        디렉토리 전체 크기가 한도 이하가 될 때까지 가장 오래 사용되지 않은 항목을 삭제합니다.
+        """
+        entries = self._scan()
+        total_bytes = sum(entry['size'] for entry in entries.values())
+        if total_bytes <= self.max_bytes:
+            return
+        for key in sorted(entries, key=lambda k: entries[k]['last_used']):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                # 다른 워커가 이미 지운 항목
+                pass
+            else:
+                self.evictions += 1
+            total_bytes -= entries[key]['size']
+
+    def clear(self):
+        """
+        모든 캐시 항목을 삭제합니다.
+        """
+        with self._lock:
+            for key in self._scan():
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 적중률과 크기 통계를 반환합니다. 항목 수와 크기는 디렉토리 기준입니다.
+        """
+        entries = self._scan() if self.enabled else {}
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'directory': self.directory,
+                'entries': len(entries),
+                'size_bytes': sum(entry['size'] for entry in entries.values()),
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'bypasses': self.bypasses,
+                'writes': self.writes,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+# 전역 생성 결과 캐시 인스턴스
+generation_cache = None
+
+def get_generation_cache():
+    """
+    전역 생성 결과 캐시 인스턴스를 반환합니다.
+    """
+    global generation_cache
+    if generation_cache is None:
+        generation_cache = GenerationResultCache()
+    return generation_cache
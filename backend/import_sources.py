@@ -0,0 +1,55 @@
+from typing import List, Dict, Any, Tuple
+import hashlib
+import json
+import os
+from pdf_extraction import extract_pdf_pages
+
+# 확장자별 파일 종류
+SOURCE_KINDS = {'.pdf': 'pdf', '.txt': 'txt', '.json': 'job'}
+
+
+def scan_directory(directory: str) -> List[Tuple[str, str]]:
+    """
+    디렉토리(하위 디렉토리 포함)에서 가져올 파일의 (종류, 경로)를 경로 순으로 반환합니다.
+    """
+    sources = []
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            kind = SOURCE_KINDS.get(os.path.splitext(filename)[1].lower())
+            if kind:
+                sources.append((kind, os.path.join(root, filename)))
+    return sorted(sources, key=lambda source: source[1])
+
+
+def compute_file_digest(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    파일 바이트의 SHA-256 다이제스트를 반환합니다. 업로드 수집과 같은 문서 ID를 만드는 데 사용합니다.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_source(source: Tuple[str, str]) -> Dict[str, Any]:
+    """
+    파일 하나를 파싱합니다. 프로세스 풀 워커에서 실행되므로 무거운 모듈(벡터 스토어, 임베딩 모델)을
+    가져오지 않는 이 모듈에 둡니다.
+    실패한 파일은 예외 대신 error를 담아 반환합니다.
+    """
+    kind, path = source
+    try:
+        if kind == 'pdf':
+            # 파일 단위로 이미 병렬 처리하므로 페이지 병렬 추출은 쓰지 않음
+            pages = extract_pdf_pages(path, workers=1)
+            return {'kind': kind, 'path': path, 'pages': pages, 'sha256': compute_file_digest(path)}
+        if kind == 'txt':
+            with open(path, 'r', encoding='utf-8') as f:
+                pages = f.read().split('\f')
+            return {'kind': kind, 'path': path, 'pages': pages, 'sha256': compute_file_digest(path)}
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {'kind': kind, 'path': path, 'postings': data if isinstance(data, list) else [data]}
+    except Exception as e:
+        return {'kind': kind, 'path': path, 'error': str(e)}
@@ -0,0 +1,426 @@
+from typing import List, Dict, Any, Optional, Callable
+import json
+import os
+import queue
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime
+from ingestion import get_pdf_ingestion_pipeline
+from job_posting_store import get_job_posting_store
+from pdf_extraction import count_pdf_pages, iter_pdf_pages
+from storage_backends import get_sqlite_database
+from vector_store import get_vector_store
+
+# 백그라운드 수집 워커 스레드 수
+INGEST_WORKERS = int(os.getenv('INGEST_WORKERS', '2'))
+# 수집 작업 테이블을 저장하는 SQLite 파일
+INGEST_JOBS_DB = os.getenv('INGEST_JOBS_DB', 'ingest_jobs.sqlite3')
+# 작업이 끝날 때까지 업로드 파일을 보관하는 디렉토리
+INGEST_SPOOL_DIR = os.getenv('INGEST_SPOOL_DIR', os.path.join('uploads', 'ingest'))
+
+# 실행 중인 작업의 임대(lease) 시간(초). 워커가 살아 있는 동안 주기적으로 연장하며,
+# 만료된 작업만 다른 워커(또는 재시작한 서버)가 다시 가져감
+INGEST_JOB_LEASE_SECONDS = float(os.getenv('INGEST_JOB_LEASE_SECONDS', '60'))
+
+# 아직 끝나지 않은 작업 상태
+UNFINISHED_STATUSES = ('queued', 'running')
+
+_JSON_COLUMNS = ('payload', 'progress', 'result')
+
+
+class IngestJobStore:
+    """수집 작업의 상태, 진행률, 결과를 보관하는 SQLite 작업 테이블"""
+
+    def __init__(self, path: str = None):
+        self.path = path or INGEST_JOBS_DB
+        self._db = get_sqlite_database(self.path)
+        with self._db.transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ingest_jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    filename TEXT,
+                    status TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    progress TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    owner TEXT,
+                    lease_expires_at REAL
+                )
+                """
+            )
+            # 임대 컬럼이 없던 이전 작업 테이블에 추가
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(ingest_jobs)")}
+            for column, column_type in (('owner', 'TEXT'), ('lease_expires_at', 'REAL')):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE ingest_jobs ADD COLUMN {column} {column_type}")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_ingest_jobs_status ON ingest_jobs (status, created_at)")
+
+    def _row_to_job(self, cursor, row) -> Dict[str, Any]:
+        job = dict(zip([column[0] for column in cursor.description], row))
+        for column in _JSON_COLUMNS:
+            if job.get(column) is not None:
+                job[column] = json.loads(job[column])
+        return job
+
+    def create(self, kind: str, filename: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """대기 상태의 작업을 추가합니다."""
+        job = {
+            'id': f"ingest_{uuid.uuid4().hex[:12]}",
+            'kind': kind,
+            'filename': filename,
+            'status': 'queued',
+            'payload': payload,
+            'progress': {},
+            'result': None,
+            'error': None,
+            'attempts': 0,
+            'created_at': datetime.now().isoformat(),
+            'started_at': None,
+            'finished_at': None
+        }
+        with self._db.transaction() as conn:
+            conn.execute(
+                "INSERT INTO ingest_jobs (id, kind, filename, status, payload, progress, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job['id'], kind, filename, 'queued', json.dumps(payload, ensure_ascii=False), '{}', job['created_at'])
+            )
+        return job
+
+    def update(self, job_id: str, owner: str = None, **fields) -> bool:
+        """
+        작업의 일부 필드를 갱신합니다.
+        owner가 주어지면 그 워커가 아직 작업을 가지고 있을 때만 갱신하고, 갱신 여부를 반환합니다.
+        """
+        columns = []
+        values = []
+        for column, value in fields.items():
+            if column in _JSON_COLUMNS and value is not None:
+                value = json.dumps(value, ensure_ascii=False)
+            columns.append(f"{column} = ?")
+            values.append(value)
+        query = f"UPDATE ingest_jobs SET {', '.join(columns)} WHERE id = ?"
+        values.append(job_id)
+        if owner is not None:
+            query += " AND owner = ? AND status = 'running'"
+            values.append(owner)
+        with self._db.transaction() as conn:
+            return conn.execute(query, values).rowcount > 0
+
+    def claim(self, job_id: str, owner: str, lease_seconds: float = None) -> bool:
+        """
+        대기 중인 작업을 owner의 실행 중 작업으로 바꾸고 임대를 시작합니다.
+        한 번의 조건부 UPDATE로 처리하므로 여러 워커 프로세스 중 하나만 성공하며,
+        다른 워커가 먼저 가져갔으면 False를 반환합니다.
+        """
+        lease_seconds = INGEST_JOB_LEASE_SECONDS if lease_seconds is None else lease_seconds
+        with self._db.transaction() as conn:
+            return conn.execute(
+                "UPDATE ingest_jobs SET status = 'running', owner = ?, lease_expires_at = ?, started_at = ?, "
+                "attempts = attempts + 1 WHERE id = ? AND status = 'queued'",
+                (owner, time.time() + lease_seconds, datetime.now().isoformat(), job_id)
+            ).rowcount > 0
+
+    def renew_leases(self, owner: str, lease_seconds: float = None) -> int:
+        """owner가 실행 중인 작업의 임대를 연장하고 연장한 작업 수를 반환합니다."""
+        lease_seconds = INGEST_JOB_LEASE_SECONDS if lease_seconds is None else lease_seconds
+        with self._db.transaction() as conn:
+            return conn.execute(
+                "UPDATE ingest_jobs SET lease_expires_at = ? WHERE owner = ? AND status = 'running'",
+                (time.time() + lease_seconds, owner)
+            ).rowcount
+
+    def release_expired(self) -> int:
+        """
+        임대가 만료된(워커가 종료되었거나 멈춘) 실행 중 작업을 대기 상태로 되돌리고 그 수를 반환합니다.
+        임대가 남아 있는 작업은 다른 워커가 실행 중이므로 건드리지 않습니다.
+        """
+        with self._db.transaction() as conn:
+            return conn.execute(
+                "UPDATE ingest_jobs SET status = 'queued', owner = NULL, lease_expires_at = NULL "
+                "WHERE status = 'running' AND (lease_expires_at IS NULL OR lease_expires_at < ?)",
+                (time.time(),)
+            ).rowcount
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 하나를 반환합니다. 없으면 None을 반환합니다."""
+        with self._db.lock:
+            cursor = self._db.connection.execute("SELECT * FROM ingest_jobs WHERE id = ?", (job_id,))
+            row = cursor.fetchone()
+            return self._row_to_job(cursor, row) if row is not None else None
+
+    def list(self, status: str = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """최근 작업 목록을 반환합니다 (payload 제외)."""
+        query = "SELECT id, kind, filename, status, progress, error, created_at, started_at, finished_at FROM ingest_jobs"
+        params = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(max(1, limit))
+        with self._db.lock:
+            cursor = self._db.connection.execute(query, params)
+            return [self._row_to_job(cursor, row) for row in cursor.fetchall()]
+
+    def queued_ids(self) -> List[str]:
+        """대기 중인 작업 ID를 생성 순으로 반환합니다."""
+        with self._db.lock:
+            rows = self._db.connection.execute(
+                "SELECT id FROM ingest_jobs WHERE status = 'queued' ORDER BY created_at"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+
+class IngestJobQueue:
+    def __init__(self, store: IngestJobStore = None, workers: int = None, lease_seconds: float = None):
+        """
+        수집 작업을 워커 스레드 풀에서 실행하는 로컬 작업 큐를 초기화합니다.
+        작업 상태는 IngestJobStore에 저장되므로 서버가 재시작되어도 끝나지 않은 작업을 이어서 실행합니다.
+        여러 서버 프로세스가 같은 작업 테이블을 공유해도 작업은 임대를 가진 워커 하나만 실행합니다.
+        """
+        self.store = store or IngestJobStore()
+        self.workers = workers or INGEST_WORKERS
+        self.lease_seconds = INGEST_JOB_LEASE_SECONDS if lease_seconds is None else lease_seconds
+        # 작업 테이블에 기록되는 이 큐(프로세스)의 식별자
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.handlers = {}
+        self._queue = queue.Queue()
+        self._enqueued = set()
+        self._threads = []
+        self._heartbeat = None
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = {'completed': 0, 'failed': 0, 'total_run_ms': 0.0}
+
+    def register(self, kind: str, handler: Callable[[Dict[str, Any], Callable[..., None]], Dict[str, Any]]):
+        """
+        작업 종류별 처리 함수를 등록합니다.
+        처리 함수는 (payload, report_progress)를 받아 결과 딕셔너리를 반환합니다.
+        """
+        self.handlers[kind] = handler
+
+    def start(self) -> int:
+        """
+        워커 스레드와 임대 연장 스레드를 시작하고, 대기 중이거나 임대가 만료된 작업을 대기열에 넣습니다.
+        대기열에 넣은 작업 수를 반환합니다.
+        """
+        with self._lock:
+            if self._threads:
+                return 0
+            self._stopping.clear()
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f"ingest-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            self._heartbeat = threading.Thread(target=self._heartbeat_loop, name="ingest-heartbeat", daemon=True)
+            self._heartbeat.start()
+        return self._recover()
+
+    def _recover(self) -> int:
+        """
+        임대가 만료된 작업을 대기 상태로 되돌리고, 대기 중인 작업을 로컬 대기열에 넣습니다.
+        다른 프로세스도 같은 작업을 넣을 수 있지만 claim은 한 워커만 성공합니다.
+        """
+        self.store.release_expired()
+        recovered = 0
+        for job_id in self.store.queued_ids():
+            if self._enqueue(job_id):
+                recovered += 1
+        return recovered
+
+    def _enqueue(self, job_id: str) -> bool:
+        with self._lock:
+            if job_id in self._enqueued:
+                return False
+            self._enqueued.add(job_id)
+        self._queue.put(job_id)
+        return True
+
+    def _heartbeat_loop(self):
+        """
+        임대 시간의 1/3마다 실행 중인 작업의 임대를 연장하고,
+        종료된 다른 워커가 남긴 작업(임대 만료, 대기 중)을 가져옵니다.
+        """
+        interval = max(0.05, self.lease_seconds / 3)
+        while not self._stopping.wait(interval):
+            try:
+                self.store.renew_leases(self.worker_id, self.lease_seconds)
+                self._recover()
+            except Exception as e:
+                print(f"수집 작업 임대 연장 실패: {str(e)}")
+
+    def stop(self, timeout: float = 5.0):
+        """
+        실행 중인 작업이 끝나면 워커를 종료합니다. 대기 중인 작업은 다음 시작 때 이어서 실행됩니다.
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+            heartbeat, self._heartbeat = self._heartbeat, None
+        self._stopping.set()
+        if heartbeat is not None:
+            heartbeat.join(timeout)
+        # 아직 시작하지 않은 작업은 큐에서 빼서 워커가 종료 신호를 바로 받도록 함
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._enqueued.clear()
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+    def submit(self, kind: str, filename: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        작업을 작업 테이블에 저장하고 대기열에 넣은 뒤 바로 반환합니다.
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"지원하지 않는 수집 작업 종류입니다: {kind}")
+        self.start()
+        job = self.store.create(kind, filename, payload)
+        self._enqueue(job['id'])
+        return job
+
+    def _worker(self):
+        while True:
+            job_id = self._queue.get()
+            if job_id is None:
+                return
+            with self._lock:
+                self._enqueued.discard(job_id)
+            self._run(job_id)
+
+    def _run(self, job_id: str):
+        """
+        작업 하나를 실행하고 진행률과 결과를 작업 테이블에 기록합니다.
+        """
+        if not self.store.claim(job_id, self.worker_id, self.lease_seconds):
+            return
+        job = self.store.get(job_id)
+        start = time.perf_counter()
+        progress = dict(job['progress'] or {})
+
+        def report_progress(**fields):
+            progress.update(fields)
+            self.store.update(job_id, owner=self.worker_id, progress=progress)
+
+        try:
+            result = self.handlers[job['kind']](job['payload'], report_progress)
+            fields = {'status': 'completed', 'result': result}
+            outcome = 'completed'
+        except Exception as e:
+            fields = {'status': 'failed', 'error': str(e)}
+            outcome = 'failed'
+        # 임대가 만료되어 다른 워커가 가져간 작업이면 결과를 쓰지 않고, 그 워커가 읽을 업로드 파일도 남겨 둠
+        finished = self.store.update(
+            job_id, owner=self.worker_id, lease_expires_at=None, finished_at=datetime.now().isoformat(), **fields
+        )
+        if not finished:
+            return
+        # 작업이 끝나면 보관해 둔 업로드 파일 삭제
+        path = job['payload'].get('path')
+        if path and os.path.exists(path):
+            os.remove(path)
+        with self._lock:
+            self._stats[outcome] += 1
+            self._stats['total_run_ms'] += (time.perf_counter() - start) * 1000
+
+    def wait(self, job_id: str, timeout: float = 30.0, interval: float = 0.05) -> Optional[Dict[str, Any]]:
+        """
+        작업이 끝나거나 timeout이 지날 때까지 기다린 뒤 작업을 반환합니다.
+        """
+        deadline = time.time() + timeout
+        while True:
+            job = self.store.get(job_id)
+            if job is None or job['status'] not in UNFINISHED_STATUSES or time.time() >= deadline:
+                return job
+            time.sleep(interval)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        워커 수, 대기열 길이, 완료/실패 수와 평균 실행 시간을 반환합니다.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['workers'] = len(self._threads)
+        finished = stats['completed'] + stats['failed']
+        stats['queued'] = self._queue.qsize()
+        stats['avg_run_ms'] = stats['total_run_ms'] / finished if finished else 0.0
+        return stats
+
+
+def run_pdf_ingest_job(payload: Dict[str, Any], report_progress: Callable[..., None]) -> Dict[str, Any]:
+    """
+    업로드된 PDF를 스트리밍 방식으로 수집합니다. 페이지마다 진행률을 기록합니다.
+    """
+    page_count = count_pdf_pages(payload['path'])
+    report_progress(page_count=page_count, pages_processed=0, pages_indexed=0)
+
+    def pages():
+        for page_number, text in iter_pdf_pages(payload['path']):
+            yield page_number, text
+            report_progress(pages_processed=page_number)
+
+    result = get_pdf_ingestion_pipeline().ingest_stream(
+        payload['filename'],
+        pages(),
+        payload['sha256'],
+        page_count,
+        on_progress=lambda stats: report_progress(pages_indexed=stats['pages'], documents=stats['documents']),
+        source_id=payload.get('source_id')
+    )
+    if result['status'] == 'empty':
+        raise Exception("PDF에서 텍스트를 추출할 수 없습니다.")
+    report_progress(pages_indexed=page_count)
+    return {key: value for key, value in result.items() if key != 'vector_ids'}
+
+
+def run_job_posting_ingest_job(payload: Dict[str, Any], report_progress: Callable[..., None]) -> Dict[str, Any]:
+    """
+    Job Posting을 저장하고 벡터 스토어에 추가합니다.
+    업로드된 파일이 있으면 먼저 텍스트를 추출합니다 (PDF는 페이지마다 진행률 기록).
+    """
+    job_data = dict(payload['job_posting'])
+    path = payload.get('path')
+    if path:
+        if path.endswith('.pdf'):
+            page_count = count_pdf_pages(path)
+            report_progress(page_count=page_count, pages_processed=0)
+            texts = []
+            for page_number, text in iter_pdf_pages(path):
+                texts.append(text)
+                report_progress(pages_processed=page_number)
+            job_data['jobDescription'] = "\n".join(texts)
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                job_data['jobDescription'] = f.read()
+
+    get_job_posting_store().save(job_data)
+    get_vector_store().add_job_posting(job_data)
+    report_progress(indexed=True)
+    return {'job_posting': job_data}
+
+# 전역 수집 작업 큐 인스턴스
+ingest_job_queue = None
+
+def get_ingest_job_queue():
+    """
+    전역 수집 작업 큐 인스턴스를 반환합니다. 처음 호출될 때 워커를 시작합니다.
+    """
+    global ingest_job_queue
+    if ingest_job_queue is None:
+        ingest_job_queue = IngestJobQueue()
+        ingest_job_queue.register('pdf', run_pdf_ingest_job)
+        ingest_job_queue.register('job_posting', run_job_posting_ingest_job)
+        ingest_job_queue.start()
+    return ingest_job_queue
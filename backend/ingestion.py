@@ -0,0 +1,260 @@
+from typing import List, Dict, Any, Iterable, Tuple, Callable
+from vector_store import VectorStore, get_vector_store, compute_content_digest, make_pdf_document_id
+from embedding_service import get_embedding_service
+from chunking import TextChunker
+from datetime import datetime
+import os
+import time
+
+# 스트리밍 수집 시 한 번에 인코딩/저장하는 청크 수
+DEFAULT_INGEST_BATCH_SIZE = int(os.getenv('INGEST_BATCH_SIZE', '32'))
+
+class PDFIngestionPipeline:
+    def __init__(self, use_chunking: bool = None, chunker: TextChunker = None, vector_store: VectorStore = None):
+        """
+        PDF 수집(ingestion) 파이프라인을 초기화합니다.
+        페이지 텍스트를 청크로 나누고 한 번만 인코딩하여 벡터 스토어에 저장합니다.
+        """
+        self.vector_store = vector_store or get_vector_store()
+        self.embedding_service = get_embedding_service()
+        if use_chunking is None:
+            use_chunking = os.getenv('PDF_CHUNKING_ENABLED', 'true').lower() == 'true'
+        self.use_chunking = use_chunking
+        self.chunker = chunker or TextChunker(token_counter=self.embedding_service.count_tokens)
+
+    def build_page_documents(self, filename: str, page_number: int, text: str, page_count: int) -> List[Dict[str, Any]]:
+        """
+        한 페이지의 텍스트로 벡터 스토어 문서 목록을 구성합니다.
+        청킹이 켜져 있으면 페이지 대신 청크 단위 문서를 만듭니다.
+        """
+        if self.use_chunking:
+            return self.chunker.chunk_page(text, page_number, page_count, filename=filename)
+        if not text.strip():  # 빈 텍스트는 제외
+            return []
+        return [{
+            'filename': filename,
+            'text': text,
+            'pages': page_count,
+            'page_number': page_number
+        }]
+
+    def build_documents(self, filename: str, pages_text: List[str]) -> List[Dict[str, Any]]:
+        """
+        추출된 페이지 텍스트로 벡터 스토어 문서 목록을 구성합니다.
+        """
+        documents = []
+        for i, text in enumerate(pages_text):
+            documents.extend(self.build_page_documents(filename, i + 1, text, len(pages_text)))
+        return documents
+
+    def ingest(
+        self,
+        filename: str,
+        pages_text: List[str],
+        source_id: str = None,
+        file_digest: str = None
+    ) -> Dict[str, Any]:
+        """
+        페이지 텍스트를 임베딩하고 벡터 스토어에 추가합니다.
+        같은 내용을 다시 수집하면 인코딩과 저장을 건너뛰고,
+        변경된 문서는 바뀐 청크만 인코딩하여 갱신합니다.
+        저장 후 같은 문서의 현재 버전에 없는 청크를 삭제합니다. source_id(업로드/원본 식별자)가 주어지면
+        같은 식별자의 이전 버전 청크가, 없으면 같은 파일의 남은 청크(청커 설정 변경 등)가 대상입니다.
+        파일명은 서로 다른 문서끼리 겹칠 수 있으므로 이전 버전을 찾는 데 쓰지 않습니다.
+        file_digest는 업로드된 파일 바이트의 SHA-256으로, ingest_stream과 같은 문서 ID를 만듭니다.
+        파일이 없는 입력이면 페이지 텍스트로 계산합니다.
+        """
+        try:
+            documents = self.build_documents(filename, pages_text)
+            if not documents:
+                return {
+                    'documents': [],
+                    'embeddings': [],
+                    'embedding_dimension': 0,
+                    'vector_ids': [],
+                    'status': 'empty'
+                }
+
+            # 내용 기반 ID 부여 (파일이 있으면 스트리밍 수집과 같은 파일 바이트 다이제스트 사용)
+            file_digest = file_digest or compute_content_digest(pages_text)
+            for doc in documents:
+                doc['file_digest'] = file_digest
+                doc['source_id'] = source_id
+                doc['content_hash'] = compute_content_digest([doc['text']])
+                doc['id'] = make_pdf_document_id(
+                    file_digest, doc['page_number'], doc.get('chunk_index', 0), source_id
+                )
+            vector_ids = [doc['id'] for doc in documents]
+
+            # 변경 없는 재업로드(같은 ID에 같은 청크 내용)는 저장된 임베딩을 그대로 반환
+            # ID가 같아도 청커 설정이 바뀌어 청크 내용이 다르면 다시 저장
+            stored_hashes = self.vector_store.get_pdf_content_hashes(vector_ids)
+            if all(stored_hashes.get(doc['id']) == doc['content_hash'] for doc in documents):
+                stored = self.vector_store.get_pdf_embeddings(vector_ids)
+                embeddings = [stored[doc_id] for doc_id in vector_ids]
+                removed = self.vector_store.delete_stale_pdf_documents(source_id, file_digest, keep_ids=vector_ids)
+                status = 'updated' if removed else 'unchanged'
+                return self._build_result(documents, embeddings, vector_ids, status, 0, len(documents), removed)
+
+            # 이미 저장된 청크와 내용이 같은 청크는 임베딩을 재사용하고 나머지만 인코딩
+            previous_exists = bool(stored_hashes) or self.vector_store.has_pdf_source(source_id)
+            previous = self.vector_store.get_pdf_embeddings_for_hashes([doc['content_hash'] for doc in documents])
+            embeddings = [previous.get(doc['content_hash']) for doc in documents]
+            missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+            if missing:
+                encoded = self.embedding_service.encode([documents[i]['text'] for i in missing]).tolist()
+                for i, embedding in zip(missing, encoded):
+                    embeddings[i] = embedding
+
+            self.vector_store.add_pdf_documents(documents, embeddings=embeddings)
+            removed = self.vector_store.delete_stale_pdf_documents(source_id, file_digest, keep_ids=vector_ids)
+
+            status = 'updated' if previous_exists else 'created'
+            return self._build_result(
+                documents, embeddings, vector_ids, status,
+                len(missing), len(documents) - len(missing), removed
+            )
+
+        except Exception as e:
+            raise Exception(f"PDF 수집 실패: {str(e)}")
+
+    def ingest_stream(
+        self,
+        filename: str,
+        pages: Iterable[Tuple[int, str]],
+        file_digest: str,
+        page_count: int,
+        batch_size: int = None,
+        on_progress: Callable[[Dict[str, Any]], None] = None,
+        source_id: str = None
+    ) -> Dict[str, Any]:
+        """
+        (페이지 번호, 텍스트) 생성기를 받아 batch_size 청크씩 인코딩하고 바로 벡터 스토어에 추가합니다.
+        처리된 페이지는 문서 전체가 끝나기 전에 검색할 수 있고, 메모리에는 한 배치만 유지됩니다.
+        file_digest는 업로드된 파일 바이트의 다이제스트로, 문서 ID를 미리 정하는 데 사용합니다.
+        끝난 뒤 ingest와 같이 같은 문서의 현재 버전에 없는 청크를 삭제합니다.
+        """
+        batch_size = batch_size or DEFAULT_INGEST_BATCH_SIZE
+        start = time.perf_counter()
+        stats = {
+            'pages': 0,
+            'documents': 0,
+            'encoded_chunks': 0,
+            'reused_chunks': 0,
+            'unchanged_chunks': 0,
+            'replaced_chunks': 0,
+            'batches': 0,
+            'first_indexed_ms': None
+        }
+        vector_ids = []
+        pending = []
+        try:
+            previous_exists = self.vector_store.has_pdf_source(source_id)
+
+            def flush():
+                self._ingest_batch(pending, stats)
+                vector_ids.extend(doc['id'] for doc in pending)
+                pending.clear()
+                if stats['first_indexed_ms'] is None:
+                    stats['first_indexed_ms'] = (time.perf_counter() - start) * 1000
+                if on_progress:
+                    on_progress(dict(stats, page_count=page_count))
+
+            for page_number, text in pages:
+                for doc in self.build_page_documents(filename, page_number, text, page_count):
+                    doc['file_digest'] = file_digest
+                    doc['source_id'] = source_id
+                    doc['content_hash'] = compute_content_digest([doc['text']])
+                    doc['id'] = make_pdf_document_id(
+                        file_digest, doc['page_number'], doc.get('chunk_index', 0), source_id
+                    )
+                    pending.append(doc)
+                stats['pages'] += 1
+                if len(pending) >= batch_size:
+                    flush()
+            if pending:
+                flush()
+
+            removed = self.vector_store.delete_stale_pdf_documents(
+                source_id, file_digest, keep_ids=vector_ids
+            ) if vector_ids else 0
+        except Exception as e:
+            raise Exception(f"PDF 수집 실패: {str(e)}")
+
+        if not vector_ids:
+            status = 'empty'
+        elif stats['unchanged_chunks'] == len(vector_ids) and not removed:
+            status = 'unchanged'
+        else:
+            status = 'updated' if previous_exists or removed or stats['replaced_chunks'] else 'created'
+        return dict(
+            stats,
+            filename=filename,
+            page_count=page_count,
+            vector_ids=vector_ids,
+            status=status,
+            removed_chunks=removed,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            ingested_at=datetime.now().isoformat()
+        )
+
+    def _ingest_batch(self, documents: List[Dict[str, Any]], stats: Dict[str, Any]):
+        """
+        한 배치를 저장합니다. 같은 ID로 같은 내용이 저장된 청크는 건너뛰고,
+        이미 저장된 청크와 내용이 같은 청크는 임베딩을 재사용하며 나머지만 한 번에 인코딩합니다.
+        """
+        stored_hashes = self.vector_store.get_pdf_content_hashes([doc['id'] for doc in documents])
+        new_documents = [doc for doc in documents if stored_hashes.get(doc['id']) != doc['content_hash']]
+        stats['unchanged_chunks'] += len(documents) - len(new_documents)
+        stats['replaced_chunks'] += sum(1 for doc in new_documents if doc['id'] in stored_hashes)
+        stats['documents'] += len(documents)
+        if not new_documents:
+            return
+        previous = self.vector_store.get_pdf_embeddings_for_hashes([doc['content_hash'] for doc in new_documents])
+        embeddings = [previous.get(doc['content_hash']) for doc in new_documents]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            encoded = self.embedding_service.encode([new_documents[i]['text'] for i in missing]).tolist()
+            for i, embedding in zip(missing, encoded):
+                embeddings[i] = embedding
+        self.vector_store.add_pdf_documents(new_documents, embeddings=embeddings)
+        stats['encoded_chunks'] += len(missing)
+        stats['reused_chunks'] += len(new_documents) - len(missing)
+        stats['batches'] += 1
+
+    def _build_result(
+        self,
+        documents: List[Dict[str, Any]],
+        embeddings: List[List[float]],
+        vector_ids: List[str],
+        status: str,
+        encoded: int,
+        reused: int,
+        removed: int
+    ) -> Dict[str, Any]:
+        """
+        수집 결과 딕셔너리를 구성합니다.
+        """
+        return {
+            'documents': documents,
+            'embeddings': embeddings,
+            'embedding_dimension': len(embeddings[0]) if embeddings else 0,
+            'vector_ids': vector_ids,
+            'status': status,
+            'encoded_chunks': encoded,
+            'reused_chunks': reused,
+            'removed_chunks': removed,
+            'ingested_at': datetime.now().isoformat()
+        }
+
+# 전역 PDF 수집 파이프라인 인스턴스
+pdf_ingestion_pipeline = None
+
+def get_pdf_ingestion_pipeline():
+    """
+    전역 PDF 수집 파이프라인 인스턴스를 반환합니다.
+    """
+    global pdf_ingestion_pipeline
+    if pdf_ingestion_pipeline is None:
+        pdf_ingestion_pipeline = PDFIngestionPipeline()
+    return pdf_ingestion_pipeline
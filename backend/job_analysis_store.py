@@ -0,0 +1,96 @@
+from typing import Dict, Any, Optional
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+
+
+def compute_posting_hash(job_description: str) -> str:
+    """
+    Job Posting 텍스트의 내용 해시(sha256)를 계산합니다.
+    """
+    return hashlib.sha256(job_description.strip().encode('utf-8')).hexdigest()
+
+
+class JobAnalysisStore:
+    def __init__(self, directory: str = None):
+        """
+        Job Posting 분석 결과를 내용 해시별 JSON 파일로 보관하는 저장소를 초기화합니다.
+        기본 위치는 Job Posting JSON 옆의 job_postings/analyses 디렉토리입니다.
+        """
+        self.directory = directory or os.getenv('JOB_ANALYSIS_DIR', os.path.join('job_postings', 'analyses'))
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def _path(self, content_hash: str) -> str:
+        return os.path.join(self.directory, f"{content_hash}.json")
+
+    def get(self, job_description: str, model_name: str) -> Optional[Dict[str, Any]]:
+        """
+        같은 텍스트와 모델로 저장된 분석 결과를 반환합니다. 없으면 None을 반환합니다.
+        """
+        path = self._path(compute_posting_hash(job_description))
+        entry = None
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None
+        with self._lock:
+            if entry is None or entry.get('model') != model_name:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return entry
+
+    def put(self, job_description: str, model_name: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        분석 결과를 저장하고 저장된 항목을 반환합니다.
+        """
+        content_hash = compute_posting_hash(job_description)
+        entry = {
+            'content_hash': content_hash,
+            'model': model_name,
+            'analysis': analysis,
+            'analyzed_at': datetime.now().isoformat()
+        }
+        # 임시 파일에 쓴 뒤 이름을 바꿔 반쯤 쓰인 파일을 읽지 않도록 함
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self._path(content_hash))
+        with self._lock:
+            self.writes += 1
+        return entry
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        분석 결과 재사용 통계를 반환합니다.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'directory': self.directory,
+                'hits': self.hits,
+                'misses': self.misses,
+                'writes': self.writes,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+# 전역 Job Posting 분석 저장소 인스턴스
+job_analysis_store = None
+
+def get_job_analysis_store():
+    """
+    전역 Job Posting 분석 저장소 인스턴스를 반환합니다.
+    """
+    global job_analysis_store
+    if job_analysis_store is None:
+        job_analysis_store = JobAnalysisStore()
+    return job_analysis_store
@@ -0,0 +1,179 @@
+from typing import List, Dict, Any, Optional, Tuple
+import json
+import os
+from storage_backends import JsonDocumentBackend, get_sqlite_database, resolve_storage_backend
+
+# Job Posting JSON 파일이 저장되는 디렉토리
+JOB_POSTINGS_DIR = os.getenv('JOB_POSTINGS_DIR', 'job_postings')
+
+# 목록 조회 시 정렬 방향
+SORT_ORDERS = {'asc': 'ASC', 'desc': 'DESC'}
+
+
+class JobPostingStore:
+    def __init__(self, directory: str = None, index_path: str = None, backend: str = None):
+        """
+        Job Posting 저장소를 초기화합니다.
+        json 백엔드에서는 원본이 기존처럼 디렉토리의 JSON 파일이고, 목록/필터/정렬은 SQLite 인덱스로 처리합니다.
+        인덱스가 새로 만들어지면 기존 JSON 파일을 한 번에 가져옵니다.
+        sqlite 백엔드에서는 SQLITE_DB_PATH의 job_postings 테이블이 원본이며 JSON 파일을 쓰지 않습니다.
+        """
+        self.backend = resolve_storage_backend(backend)
+        self.directory = directory or JOB_POSTINGS_DIR
+        os.makedirs(self.directory, exist_ok=True)
+        if self.backend == 'sqlite':
+            self.files = None
+            self.index_path = index_path or get_sqlite_database().path
+        else:
+            self.files = JsonDocumentBackend(self.directory, indent=2)
+            self.index_path = index_path or os.path.join(self.directory, 'index.sqlite3')
+        is_new_index = not os.path.exists(self.index_path)
+        self._db = get_sqlite_database(self.index_path)
+        with self._db.transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS job_postings (
+                    id TEXT PRIMARY KEY,
+                    job_title TEXT NOT NULL,
+                    company_name TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    status TEXT,
+                    data TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_postings_created_at ON job_postings (created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_postings_company ON job_postings (company_name)")
+        if is_new_index and self.files is not None:
+            self.import_directory()
+
+    def _upsert_rows(self, conn, postings: List[Dict[str, Any]]):
+        """
+        인덱스에 Job Posting 행을 추가하거나 갱신합니다. 호출하는 쪽에서 트랜잭션을 열어야 합니다.
+        """
+        conn.executemany(
+            "INSERT OR REPLACE INTO job_postings (id, job_title, company_name, created_at, status, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    posting['id'],
+                    posting.get('jobTitle') or '',
+                    posting.get('companyName') or '',
+                    posting.get('createdAt') or '',
+                    posting.get('status'),
+                    json.dumps(posting, ensure_ascii=False)
+                )
+                for posting in postings
+            ]
+        )
+
+    def save(self, job_posting: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Job Posting을 저장하고 인덱스를 갱신합니다.
+        """
+        if self.files is not None:
+            self.files.save(job_posting['id'], job_posting)
+        with self._db.transaction() as conn:
+            self._upsert_rows(conn, [job_posting])
+        return job_posting
+
+    def save_many(self, job_postings: List[Dict[str, Any]]) -> int:
+        """
+        여러 Job Posting을 저장하고 인덱스를 한 트랜잭션으로 갱신합니다.
+        """
+        if self.files is not None:
+            self.files.save_many({posting['id']: posting for posting in job_postings})
+        with self._db.transaction() as conn:
+            self._upsert_rows(conn, job_postings)
+        return len(job_postings)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Job Posting 하나를 반환합니다. 없으면 None을 반환합니다.
+        """
+        with self._db.lock:
+            row = self._db.connection.execute("SELECT data FROM job_postings WHERE id = ?", (job_id,)).fetchone()
+        if row is not None:
+            return json.loads(row[0])
+        # 인덱스에 없는 파일(수동으로 추가된 경우)은 읽어서 인덱스에 등록
+        if self.files is None:
+            return None
+        job_posting = self.files.load(job_id)
+        if job_posting is None:
+            return None
+        with self._db.transaction() as conn:
+            self._upsert_rows(conn, [job_posting])
+        return job_posting
+
+    def list(
+        self,
+        offset: int = 0,
+        limit: int = None,
+        company: str = None,
+        title: str = None,
+        sort: str = 'desc'
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        조건에 맞는 Job Posting 목록(createdAt 정렬)과 전체 개수를 반환합니다.
+        company/title은 대소문자를 구분하지 않는 부분 일치로 필터링합니다.
+        """
+        if sort not in SORT_ORDERS:
+            raise ValueError(f"지원하지 않는 정렬 방향입니다: {sort}")
+        conditions = []
+        params = []
+        if company:
+            conditions.append("company_name LIKE ?")
+            params.append(f"%{company}%")
+        if title:
+            conditions.append("job_title LIKE ?")
+            params.append(f"%{title}%")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._db.lock:
+            total = self._db.connection.execute(f"SELECT COUNT(*) FROM job_postings {where}", params).fetchone()[0]
+            rows = self._db.connection.execute(
+                f"SELECT data FROM job_postings {where} ORDER BY created_at {SORT_ORDERS[sort]}, id LIMIT ? OFFSET ?",
+                params + [limit if limit is not None else -1, max(0, offset)]
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows], total
+
+    def import_directory(self) -> Dict[str, Any]:
+        """
+        디렉토리의 모든 Job Posting JSON 파일을 한 번에 읽어 인덱스를 다시 만듭니다.
+        sqlite 백엔드에서는 테이블이 원본이므로 지우지 않고 파일 내용을 추가/갱신만 합니다.
+        """
+        postings = []
+        skipped = []
+        for filename in os.listdir(self.directory):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, filename), 'r', encoding='utf-8') as f:
+                    posting = json.load(f)
+                posting.setdefault('id', filename[:-5])
+                postings.append(posting)
+            except (OSError, ValueError) as e:
+                skipped.append({'filename': filename, 'error': str(e)})
+        with self._db.transaction() as conn:
+            if self.files is not None:
+                conn.execute("DELETE FROM job_postings")
+            self._upsert_rows(conn, postings)
+        return {'imported': len(postings), 'skipped': skipped}
+
+    def count(self) -> int:
+        """
+        인덱스에 등록된 Job Posting 수를 반환합니다.
+        """
+        with self._db.lock:
+            return self._db.connection.execute("SELECT COUNT(*) FROM job_postings").fetchone()[0]
+
+# 전역 Job Posting 저장소 인스턴스
+job_posting_store = None
+
+def get_job_posting_store():
+    """
+    전역 Job Posting 저장소 인스턴스를 반환합니다.
+    """
+    global job_posting_store
+    if job_posting_store is None:
+        job_posting_store = JobPostingStore()
+    return job_posting_store
@@ -1,8 +1,16 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 import os
 import json
 from datetime import datetime
+import asyncio
 import openai
+from rate_limiter import get_llm_rate_limiter
+from generation_cache import get_generation_cache, make_generation_cache_key, CACHE_MODE_BYPASS
+from executors import run_blocking
+from job_analysis_store import get_job_analysis_store
+
+# 프롬프트에 포함할 PDF 컨텍스트(청크)의 최대 글자 수
+PDF_CONTEXT_MAX_CHARS = int(os.getenv('PDF_CONTEXT_MAX_CHARS', '1200'))
 
 class LLMIntegration:
     def __init__(self, model_name: str = "gpt-4o-mini", temperature: float = 0.7):
@@ -17,27 +25,90 @@ class LLMIntegration:
         if not api_key:
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
         
-        # OpenAI 클라이언트 초기화
-        self.client = openai.OpenAI(api_key=api_key)
+        # OpenAI 비동기 클라이언트 초기화
+        self.async_client = openai.AsyncOpenAI(api_key=api_key)
+        
+        # 모든 LLM 호출이 공유하는 전역 속도 제한기
+        self.rate_limiter = get_llm_rate_limiter()
+        
+        # 동일한 프롬프트의 생성 결과를 재사용하는 디스크 캐시
+        self.generation_cache = get_generation_cache()
+        
+        # 같은 Job Posting 텍스트의 분석 결과를 재사용하는 저장소
+        self.analysis_store = get_job_analysis_store()
+        
+        # 변형 생성 동시 실행 수와 변형별 타임아웃(초)
+        self.variation_concurrency = int(os.getenv('LLM_VARIATION_CONCURRENCY', '3'))
+        self.variation_timeout = float(os.getenv('LLM_VARIATION_TIMEOUT', '60'))
     
-    def generate_cover_letter(
+    async def agenerate_cover_letter(
         self,
         job_title: str,
         company_name: str,
         job_description: str,
         user_question: str = None,
         relevant_context: List[Dict[str, Any]] = None,
-        user_background: str = None
+        user_background: str = None,
+        cache_mode: str = None
     ) -> Dict[str, Any]:
         """
-        Cover Letter를 생성합니다.
+        비동기 클라이언트로 Cover Letter를 생성합니다 (이벤트 루프를 막지 않음).
         """
         try:
-            # 시스템 프롬프트 구성
-            system_prompt = self._build_cover_letter_system_prompt()
+            messages = self._build_cover_letter_messages(
+                job_title=job_title,
+                company_name=company_name,
+                job_description=job_description,
+                user_question=user_question,
+                relevant_context=relevant_context,
+                user_background=user_background
+            )
             
-            # 사용자 프롬프트 구성
-            user_prompt = self._build_cover_letter_user_prompt(
+            # 동일한 프롬프트/모델/temperature의 결과가 캐시에 있으면 재사용
+            cache_key = make_generation_cache_key(self.model_name, self.temperature, messages, 2000)
+            cached = await run_blocking(self.generation_cache.get, cache_key, cache_mode)
+            if cached is not None:
+                return self._build_generation_result(
+                    cached['response_content'], job_title, company_name, relevant_context, cache_status='hit'
+                )
+            
+            # OpenAI API 비동기 호출
+            await self.rate_limiter.acquire()
+            response = await self.async_client.chat.completions.create(
+                model=self.model_name,
+                max_tokens=2000,
+                temperature=self.temperature,
+                messages=messages
+            )
+            
+            response_content = response.choices[0].message.content
+            await run_blocking(self.generation_cache.put, cache_key, {'response_content': response_content})
+            return self._build_generation_result(
+                response_content, job_title, company_name, relevant_context, cache_status=self._cache_status(cache_mode)
+            )
+        
+        except Exception as e:
+            raise Exception(f"Cover Letter 생성 실패: {str(e)}")
+    
+    async def astream_cover_letter(
+        self,
+        job_title: str,
+        company_name: str,
+        job_description: str,
+        user_question: str = None,
+        relevant_context: List[Dict[str, Any]] = None,
+        user_background: str = None,
+        cache_mode: str = None,
+        stream_info: Dict[str, Any] = None
+    ) -> AsyncIterator[str]:
+        """
+        Cover Letter를 스트리밍으로 생성하고 모델이 만든 텍스트 조각을 순서대로 내보냅니다.
+        stream_info가 주어지면 생성 결과 캐시 사용 여부를 stream_info['cache_status']에 기록합니다.
+        """
+        if stream_info is None:
+            stream_info = {}
+        try:
+            messages = self._build_cover_letter_messages(
                 job_title=job_title,
                 company_name=company_name,
                 job_description=job_description,
@@ -46,41 +117,119 @@ class LLMIntegration:
                 user_background=user_background
             )
             
-            # OpenAI API 호출
-            response = self.client.chat.completions.create(
+            # 캐시에 있으면 저장된 전체 응답을 한 번에 내보냄
+            cache_key = make_generation_cache_key(self.model_name, self.temperature, messages, 2000)
+            cached = await run_blocking(self.generation_cache.get, cache_key, cache_mode)
+            if cached is not None:
+                stream_info['cache_status'] = 'hit'
+                yield cached['response_content']
+                return
+            stream_info['cache_status'] = self._cache_status(cache_mode)
+            
+            # OpenAI API 비동기 스트리밍 호출
+            await self.rate_limiter.acquire()
+            stream = await self.async_client.chat.completions.create(
                 model=self.model_name,
                 max_tokens=2000,
                 temperature=self.temperature,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system_prompt
-                    },
-                    {
-                        "role": "user",
-                        "content": user_prompt
-                    }
-                ]
+                messages=messages,
+                stream=True
             )
             
-            # 응답 파싱
-            cover_letter = self._parse_cover_letter_response(response.choices[0].message.content)
+            parts = []
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
             
-            return {
-                'cover_letter': cover_letter,
-                'generation_info': {
-                    'model': self.model_name,
-                    'temperature': self.temperature,
-                    'generated_at': datetime.now().isoformat(),
-                    'job_title': job_title,
-                    'company_name': company_name,
-                    'context_used': len(relevant_context) if relevant_context else 0
-                },
-                'status': 'success'
-            }
+            await run_blocking(self.generation_cache.put, cache_key, {'response_content': ''.join(parts)})
         
         except Exception as e:
-            raise Exception(f"Cover Letter 생성 실패: {str(e)}")
+            raise Exception(f"Cover Letter 스트리밍 생성 실패: {str(e)}")
+    
+    def _build_cover_letter_messages(
+        self,
+        job_title: str,
+        company_name: str,
+        job_description: str,
+        user_question: str = None,
+        relevant_context: List[Dict[str, Any]] = None,
+        user_background: str = None,
+        system_prompt: str = None
+    ) -> List[Dict[str, str]]:
+        """
+        Cover Letter 생성을 위한 chat 메시지 목록을 구성합니다.
+        """
+        # 시스템 프롬프트 구성
+        if system_prompt is None:
+            system_prompt = self._build_cover_letter_system_prompt()
+        
+        # 사용자 프롬프트 구성
+        user_prompt = self._build_cover_letter_user_prompt(
+            job_title=job_title,
+            company_name=company_name,
+            job_description=job_description,
+            user_question=user_question,
+            relevant_context=relevant_context,
+            user_background=user_background
+        )
+        
+        return self._build_messages(system_prompt, user_prompt)
+    
+    def _build_messages(self, system_prompt: str, user_prompt: str) -> List[Dict[str, str]]:
+        """
+        시스템/사용자 프롬프트로 chat 메시지 목록을 구성합니다.
+        """
+        return [
+            {
+                "role": "system",
+                "content": system_prompt
+            },
+            {
+                "role": "user",
+                "content": user_prompt
+            }
+        ]
+    
+    def _build_generation_result(
+        self,
+        response_content: str,
+        job_title: str,
+        company_name: str,
+        relevant_context: List[Dict[str, Any]] = None,
+        cache_status: str = None
+    ) -> Dict[str, Any]:
+        """
+        LLM 응답으로 Cover Letter 생성 결과를 구성합니다.
+        cache_status는 생성 결과 캐시 사용 여부('hit', 'miss', 'bypass', 'disabled')입니다.
+        """
+        # 응답 파싱
+        cover_letter = self._parse_cover_letter_response(response_content)
+        
+        return {
+            'cover_letter': cover_letter,
+            'generation_info': {
+                'model': self.model_name,
+                'temperature': self.temperature,
+                'generated_at': datetime.now().isoformat(),
+                'job_title': job_title,
+                'company_name': company_name,
+                'context_used': len(relevant_context) if relevant_context else 0,
+                'cache': cache_status
+            },
+            'status': 'success'
+        }
+    
+    def _cache_status(self, cache_mode: str = None) -> str:
+        """
+        캐시를 거치지 않고 생성한 결과의 캐시 상태를 반환합니다.
+        """
+        if not self.generation_cache.enabled:
+            return 'disabled'
+        return CACHE_MODE_BYPASS if cache_mode == CACHE_MODE_BYPASS else 'miss'
     
     def _build_cover_letter_system_prompt(self) -> str:
         """
@@ -193,9 +342,14 @@ z 옵션은 사용자가 직접 입력
             if pdf_contexts:
                 prompt_parts.append("📄 업로드된 PDF 문서 내용:")
                 for i, context in enumerate(pdf_contexts[:2], 1):  # 최대 2개 PDF
+                    # 청크 단위로 저장된 문서는 이미 길이가 제한되어 있으므로 청크 전체를 사용
                     content = context.get('content', '')
+                    if len(content) > PDF_CONTEXT_MAX_CHARS:
+                        content = content[:PDF_CONTEXT_MAX_CHARS] + "..."
                     similarity = context.get('similarity_score', 0)
-                    prompt_parts.append(f"PDF {i} (유사도: {similarity:.2f}): {content[:300]}...")
+                    page_number = (context.get('metadata') or {}).get('page_number')
+                    source = f", {page_number}페이지" if page_number else ""
+                    prompt_parts.append(f"PDF {i} (유사도: {similarity:.2f}{source}): {content}")
             
             if job_contexts:
                 prompt_parts.append("💼 Job Posting 정보:")
@@ -228,7 +382,7 @@ z 옵션은 사용자가 직접 입력
         
         return content
     
-    def generate_cover_letter_variations(
+    async def agenerate_cover_letter_variations(
         self,
         job_title: str,
         company_name: str,
@@ -239,79 +393,168 @@ z 옵션은 사용자가 직접 입력
         num_variations: int = 3
     ) -> Dict[str, Any]:
         """
-        여러 버전의 Cover Letter를 생성합니다.
+        비동기 클라이언트로 여러 버전의 Cover Letter를 동시에 생성합니다.
+        동시 실행 수는 variation_concurrency, 버전별 제한 시간은 variation_timeout입니다.
         """
         try:
-            variations = []
+            user_prompt = self._build_cover_letter_user_prompt(
+                job_title=job_title,
+                company_name=company_name,
+                job_description=job_description,
+                user_question=user_question,
+                relevant_context=relevant_context,
+                user_background=user_background
+            )
             
-            for i in range(num_variations):
-                # 각 버전마다 다른 temperature 사용
-                temp_variation = self.temperature + (i * 0.1)
-                
-                # 시스템 프롬프트에 버전별 지침 추가
-                system_prompt = self._build_cover_letter_system_prompt()
-                if i == 1:
-                    system_prompt += "\n\n이번 버전은 더 창의적이고 독창적인 접근을 시도해주세요."
-                elif i == 2:
-                    system_prompt += "\n\n이번 버전은 더 보수적이고 전통적인 스타일로 작성해주세요."
-                
-                # 사용자 프롬프트
-                user_prompt = self._build_cover_letter_user_prompt(
-                    job_title=job_title,
-                    company_name=company_name,
-                    job_description=job_description,
-                    user_question=user_question,
-                    relevant_context=relevant_context,
-                    user_background=user_background
-                )
-                
-                # OpenAI API 호출
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    max_tokens=2000,
-                    temperature=temp_variation,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": system_prompt
-                        },
-                        {
-                            "role": "user",
-                            "content": user_prompt
-                        }
-                    ]
-                )
-                
-                cover_letter = self._parse_cover_letter_response(response.choices[0].message.content)
-                
-                variations.append({
-                    'version': i + 1,
-                    'cover_letter': cover_letter,
-                    'temperature': temp_variation,
-                    'style': ['기본', '창의적', '보수적'][i]
-                })
+            semaphore = asyncio.Semaphore(max(1, self.variation_concurrency))
             
-            return {
-                'variations': variations,
-                'generation_info': {
-                    'model': self.model_name,
-                    'num_variations': num_variations,
-                    'generated_at': datetime.now().isoformat(),
-                    'job_title': job_title,
-                    'company_name': company_name
-                },
-                'status': 'success'
-            }
+            async def request(index: int) -> Dict[str, Any]:
+                async with semaphore:
+                    return await asyncio.wait_for(
+                        self._arequest_variation(index, user_prompt),
+                        timeout=self.variation_timeout
+                    )
+            
+            outcomes = await asyncio.gather(
+                *[request(i) for i in range(num_variations)],
+                return_exceptions=True
+            )
+            
+            return self._build_variations_result(list(outcomes), num_variations, job_title, company_name)
         
         except Exception as e:
             raise Exception(f"Cover Letter 변형 생성 실패: {str(e)}")
     
-    def analyze_job_posting(self, job_description: str) -> Dict[str, Any]:
+    async def _arequest_variation(self, index: int, user_prompt: str) -> Dict[str, Any]:
+        """
+        비동기 클라이언트로 변형 하나를 생성합니다.
+        """
+        temp_variation = self.temperature + (index * 0.1)
+        await self.rate_limiter.acquire()
+        response = await self.async_client.chat.completions.create(
+            model=self.model_name,
+            max_tokens=2000,
+            temperature=temp_variation,
+            messages=self._build_messages(self._build_variation_system_prompt(index), user_prompt),
+            timeout=self.variation_timeout
+        )
+        return self._build_variation(index, response.choices[0].message.content, temp_variation)
+    
+    def _build_variation_system_prompt(self, index: int) -> str:
+        """
+        버전별 지침이 추가된 시스템 프롬프트를 구성합니다.
+        """
+        system_prompt = self._build_cover_letter_system_prompt()
+        if index == 1:
+            system_prompt += "\n\n이번 버전은 더 창의적이고 독창적인 접근을 시도해주세요."
+        elif index == 2:
+            system_prompt += "\n\n이번 버전은 더 보수적이고 전통적인 스타일로 작성해주세요."
+        return system_prompt
+    
+    def _build_variation(self, index: int, response_content: str, temperature: float) -> Dict[str, Any]:
         """
-        Job Posting을 분석하여 주요 요구사항을 추출합니다.
+        LLM 응답으로 Cover Letter 변형 하나를 구성합니다.
+        """
+        styles = ['기본', '창의적', '보수적']
+        return {
+            'version': index + 1,
+            'cover_letter': self._parse_cover_letter_response(response_content),
+            'temperature': temperature,
+            'style': styles[index] if index < len(styles) else styles[0]
+        }
+    
+    def _build_variations_result(
+        self,
+        outcomes: List[Any],
+        num_variations: int,
+        job_title: str,
+        company_name: str
+    ) -> Dict[str, Any]:
+        """
+        버전별 결과(성공한 변형 또는 예외)로 Cover Letter 변형 생성 결과를 구성합니다.
+        모든 버전이 실패한 경우에만 예외를 발생시킵니다.
+        """
+        variations = []
+        failed_variations = []
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                error = '시간 초과' if isinstance(outcome, asyncio.TimeoutError) else str(outcome)
+                failed_variations.append({'version': index + 1, 'error': error})
+            else:
+                variations.append(outcome)
+        
+        if not variations:
+            errors = ', '.join(failure['error'] for failure in failed_variations)
+            raise Exception(f"모든 변형 생성 실패: {errors}")
+        
+        return {
+            'variations': variations,
+            'failed_variations': failed_variations,
+            'generation_info': {
+                'model': self.model_name,
+                'num_variations': num_variations,
+                'generated_at': datetime.now().isoformat(),
+                'job_title': job_title,
+                'company_name': company_name
+            },
+            'status': 'success' if not failed_variations else 'partial'
+        }
+    
+    async def aanalyze_job_posting(self, job_description: str, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        비동기 클라이언트로 Job Posting을 분석합니다.
+        같은 텍스트의 분석 결과가 저장되어 있으면 LLM을 호출하지 않고 재사용합니다.
         """
         try:
-            system_prompt = """당신은 Job Posting 분석 전문가입니다. 
+            if use_cache:
+                stored = await run_blocking(self.analysis_store.get, job_description, self.model_name)
+                if stored is not None:
+                    return self._build_stored_analysis_result(stored)
+            
+            # OpenAI API 비동기 호출
+            await self.rate_limiter.acquire()
+            response = await self.async_client.chat.completions.create(
+                model=self.model_name,
+                max_tokens=1500,
+                temperature=self.temperature,
+                messages=self._build_analysis_messages(job_description)
+            )
+            
+            result = self._build_analysis_result(response.choices[0].message.content)
+            return await run_blocking(self._store_analysis_result, job_description, result)
+
+        except Exception as e:
+            raise Exception(f"Job Posting 분석 실패: {str(e)}")
+    
+    def _store_analysis_result(self, job_description: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        JSON으로 파싱된 분석 결과만 저장하고 내용 해시를 결과에 추가합니다.
+        """
+        result['cached'] = False
+        analysis = result['analysis']
+        if not (isinstance(analysis, dict) and analysis.get('parsing_error')):
+            stored = self.analysis_store.put(job_description, self.model_name, result['analysis'])
+            result['content_hash'] = stored['content_hash']
+            result['analyzed_at'] = stored['analyzed_at']
+        return result
+    
+    def _build_stored_analysis_result(self, stored: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        저장된 분석 결과로 분석 응답을 구성합니다.
+        """
+        return {
+            'analysis': stored['analysis'],
+            'status': 'success',
+            'cached': True,
+            'content_hash': stored['content_hash'],
+            'analyzed_at': stored['analyzed_at']
+        }
+    
+    def _build_analysis_messages(self, job_description: str) -> List[Dict[str, str]]:
+        """
+        Job Posting 분석을 위한 chat 메시지 목록을 구성합니다.
+        """
+        system_prompt = """당신은 Job Posting 분석 전문가입니다. 
 제공된 Job Posting을 분석하여 다음 정보를 추출해주세요:
 
 1. 주요 기술 스택
@@ -322,42 +565,28 @@ z 옵션은 사용자가 직접 입력
 
 JSON 형식으로 응답해주세요."""
 
-            user_prompt = f"다음 Job Posting을 분석해주세요:\n\n{job_description}"
+        user_prompt = f"다음 Job Posting을 분석해주세요:\n\n{job_description}"
 
-            # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                max_tokens=1500,
-                temperature=self.temperature,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system_prompt
-                    },
-                    {
-                        "role": "user",
-                        "content": user_prompt
-                    }
-                ]
-            )
-            
-            # JSON 파싱 시도
-            try:
-                analysis = json.loads(response.choices[0].message.content)
-            except:
-                # JSON 파싱 실패 시 텍스트로 반환
-                analysis = {
-                    'raw_analysis': response.choices[0].message.content,
-                    'parsing_error': True
-                }
-
-            return {
-                'analysis': analysis,
-                'status': 'success'
+        return self._build_messages(system_prompt, user_prompt)
+    
+    def _build_analysis_result(self, response_content: str) -> Dict[str, Any]:
+        """
+        LLM 응답으로 Job Posting 분석 결과를 구성합니다.
+        """
+        # JSON 파싱 시도
+        try:
+            analysis = json.loads(response_content)
+        except:
+            # JSON 파싱 실패 시 텍스트로 반환
+            analysis = {
+                'raw_analysis': response_content,
+                'parsing_error': True
             }
 
-        except Exception as e:
-            raise Exception(f"Job Posting 분석 실패: {str(e)}")
+        return {
+            'analysis': analysis,
+            'status': 'success'
+        }
 
 # 전역 LLM 통합 인스턴스
 llm_integration = None
@@ -1,19 +1,29 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Header, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import fitz  # PyMuPDF
-import pdfplumber
 import os
 import tempfile
 import json
+import hashlib
 from typing import List, Dict, Any, Optional
-from sentence_transformers import SentenceTransformer
-import numpy as np
 from pydantic import BaseModel
 from datetime import datetime
 import uuid
-from vector_store import get_vector_store
+from contextlib import asynccontextmanager
+from vector_store import get_vector_store, build_job_posting_text
+from embedding_service import get_embedding_service
+from ingestion import get_pdf_ingestion_pipeline
+from query_probes import get_query_probe_table
+from executors import run_blocking, shutdown_blocking_executor
+from pdf_extraction import extract_pdf_pages, count_pdf_pages, iter_pdf_pages, shutdown_pdf_process_pool
 from cover_letter_pipeline import get_cover_letter_pipeline
+from batch_engine import get_batch_engine
+from rate_limiter import get_llm_rate_limiter
+from generation_cache import get_generation_cache
+from job_analysis_store import get_job_analysis_store
+from job_posting_store import get_job_posting_store
+from ingest_jobs import INGEST_SPOOL_DIR, get_ingest_job_queue
 from cover_letter_models import (
     CoverLetterVersion, 
     CoverLetterSection, 
@@ -22,6 +32,7 @@ from cover_letter_models import (
     CoverLetterResponse,
     SectionVersionRequest,
     RevertSectionRequest,
+    CoverLetterConflictError,
     cover_letter_manager
 )
 
@@ -30,7 +41,33 @@ from cover_letter_models import (
 from dotenv import load_dotenv
 load_dotenv()
 
-app = FastAPI(title="LangChain Test API", version="1.0.0")
+def precompute_query_probes():
+    """
+    고정 검색어 임베딩을 서버 시작 시 미리 계산합니다.
+    """
+    if os.getenv('PRECOMPUTE_QUERY_PROBES', 'true').lower() != 'true':
+        return
+    try:
+        get_query_probe_table().precompute()
+    except Exception as e:
+        print(f"고정 검색어 임베딩 사전 계산 실패: {str(e)}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    서버 시작/종료 시 필요한 작업을 수행합니다.
+    """
+    precompute_query_probes()
+    # 이전 실행에서 끝나지 않은 수집 작업을 이어서 실행
+    get_ingest_job_queue()
+    yield
+    get_ingest_job_queue().stop()
+    # 지연 저장 중인 Cover Letter 수정을 종료 전에 저장
+    cover_letter_manager.flush()
+    shutdown_blocking_executor()
+    shutdown_pdf_process_pool()
+
+app = FastAPI(title="LangChain Test API", version="1.0.0", lifespan=lifespan)
 
 # CORS 설정
 app.add_middleware(
@@ -46,15 +83,14 @@ UPLOAD_DIR = "uploads"
 JOB_POSTINGS_DIR = "job_postings"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 os.makedirs(JOB_POSTINGS_DIR, exist_ok=True)
+os.makedirs(INGEST_SPOOL_DIR, exist_ok=True)
 
-# 임베딩 모델 초기화 (한 번만 로드)
-embedding_model = None
+# 스트리밍 업로드 시 한 번에 읽어 디스크에 쓰는 크기 (바이트)
+UPLOAD_CHUNK_SIZE = int(os.getenv('UPLOAD_CHUNK_SIZE', str(1024 * 1024)))
 
+# 임베딩 모델은 embedding_service에서 프로세스당 한 번만 로드
 def get_embedding_model():
-    global embedding_model
-    if embedding_model is None:
-        embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-    return embedding_model
+    return get_embedding_service().get_model()
 
 # Pydantic 모델
 class JobPosting(BaseModel):
@@ -81,6 +117,13 @@ class CoverLetterRequest(BaseModel):
     user_background: Optional[str] = None
     include_variations: bool = False
     num_variations: int = 3
+    cache: Optional[str] = None  # 'bypass'이면 생성 결과 캐시를 읽지 않음
+
+class QueryProbesRequest(BaseModel):
+    probes: List[str]
+
+class BatchGenerateRequest(BaseModel):
+    requests: List[CoverLetterRequest]
 
 @app.get("/")
 async def root():
@@ -97,14 +140,56 @@ async def get_vector_store_stats():
     """
     try:
         vector_store = get_vector_store()
-        stats = vector_store.get_collection_stats()
+        stats = await run_blocking(vector_store.get_collection_stats)
         return {
             "status": "success",
-            "stats": stats
+            "stats": stats,
+            "embedding": get_embedding_service().get_stats(),
+            "query_embedding_cache": vector_store.query_cache.get_stats()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"벡터 스토어 통계 조회 실패: {str(e)}")
 
+@app.get("/retrieval/probes")
+async def get_query_probes():
+    """
+    고정 검색어 목록과 사전 계산 상태를 반환합니다.
+    """
+    return get_query_probe_table().get_stats()
+
+@app.put("/retrieval/probes")
+async def update_query_probes(request: QueryProbesRequest):
+    """
+    고정 검색어 목록을 교체하고 임베딩을 다시 계산합니다.
+    """
+    try:
+        return await run_blocking(get_query_probe_table().set_probes, request.probes)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"고정 검색어 갱신 실패: {str(e)}")
+
+def parse_generation_target(request: dict):
+    """
+    생성 요청에서 (직무 제목, 회사명)을 추출합니다.
+    프론트엔드에서 job_posting 필드로 전송하는 경우를 처리합니다.
+    """
+    # 프론트엔드에서 job_posting으로 전송하는 경우 처리
+    if 'job_posting' in request:
+        job_posting = request['job_posting']
+        lines = job_posting.split('\n')
+        job_title = lines[0] if lines else 'Unknown Position'
+        company_name = lines[1] if len(lines) > 1 else 'Unknown Company'
+    else:
+        # 기존 CoverLetterRequest 형식 처리
+        job_title = request.get('job_title', 'Unknown Position')
+        company_name = request.get('company_name', 'Unknown Company')
+    return job_title, company_name
+
+def format_sse_event(event: str, data: Dict[str, Any]) -> str:
+    """
+    Server-Sent Events 형식의 이벤트 문자열을 만듭니다.
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
 @app.post("/generate-cover-letter")
 @app.post("/api/generate-cover-letter")
 async def generate_cover_letter(request: dict):
@@ -113,26 +198,18 @@ async def generate_cover_letter(request: dict):
     프론트엔드에서 job_posting 필드로 전송하는 경우를 처리합니다.
     """
     try:
-        # 프론트엔드에서 job_posting으로 전송하는 경우 처리
-        if 'job_posting' in request:
-            job_posting = request['job_posting']
-            lines = job_posting.split('\n')
-            job_title = lines[0] if lines else 'Unknown Position'
-            company_name = lines[1] if len(lines) > 1 else 'Unknown Company'
-        else:
-            # 기존 CoverLetterRequest 형식 처리
-            job_title = request.get('job_title', 'Unknown Position')
-            company_name = request.get('company_name', 'Unknown Company')
+        job_title, company_name = parse_generation_target(request)
         
         pipeline = get_cover_letter_pipeline()
         
-        result = pipeline.generate_cover_letter(
+        result = await pipeline.agenerate_cover_letter(
             job_title=job_title,
             company_name=company_name,
             user_question=request.get('user_question'),
             user_background=request.get('user_background'),
             include_variations=request.get('include_variations', False),
-            num_variations=request.get('num_variations', 3)
+            num_variations=request.get('num_variations', 3),
+            cache_mode=request.get('cache')
         )
         
         return result
@@ -140,6 +217,35 @@ async def generate_cover_letter(request: dict):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Cover Letter 생성 실패: {str(e)}")
 
+@app.post("/generate-cover-letter/stream")
+@app.post("/api/generate-cover-letter/stream")
+async def stream_cover_letter(request: dict):
+    """
+    Cover Letter를 Server-Sent Events로 스트리밍 생성합니다.
+    검색 메타데이터(metadata) → 텍스트 조각(token) → context_info를 포함한 최종 결과(done) 순서로 전송합니다.
+    """
+    job_title, company_name = parse_generation_target(request)
+    pipeline = get_cover_letter_pipeline()
+    
+    async def event_stream():
+        try:
+            async for event, data in pipeline.astream_cover_letter(
+                job_title=job_title,
+                company_name=company_name,
+                user_question=request.get('user_question'),
+                user_background=request.get('user_background'),
+                cache_mode=request.get('cache')
+            ):
+                yield format_sse_event(event, data)
+        except Exception as e:
+            yield format_sse_event('error', {'detail': f"Cover Letter 생성 실패: {str(e)}"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/analyze-job-posting")
 async def analyze_job_posting(job_description: str):
     """
@@ -149,12 +255,38 @@ async def analyze_job_posting(job_description: str):
         from llm_integration import get_llm_integration
         llm = get_llm_integration()
         
-        result = llm.analyze_job_posting(job_description)
+        result = await llm.aanalyze_job_posting(job_description)
         return result
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Job Posting 분석 실패: {str(e)}")
 
+@app.post("/batch/generate", status_code=202)
+async def submit_batch_generation(request: BatchGenerateRequest):
+    """
+    여러 Cover Letter 생성을 백그라운드 작업으로 등록하고 작업 ID를 반환합니다.
+    진행 상황과 결과는 /batch/{job_id}로 조회합니다.
+    """
+    try:
+        if not request.requests:
+            raise HTTPException(status_code=400, detail="생성 요청이 비어 있습니다.")
+        return get_batch_engine().submit([item.model_dump() for item in request.requests])
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"일괄 생성 작업 등록 실패: {str(e)}")
+
+@app.get("/batch/{job_id}")
+async def get_batch_generation(job_id: str, include_items: bool = True):
+    """
+    일괄 생성 작업의 진행 상황과 항목별 결과를 반환합니다.
+    """
+    job = get_batch_engine().get_job(job_id, include_items=include_items)
+    if job is None:
+        raise HTTPException(status_code=404, detail="일괄 생성 작업을 찾을 수 없습니다.")
+    return job
+
 @app.get("/pipeline/stats")
 async def get_pipeline_stats():
     """
@@ -163,27 +295,75 @@ async def get_pipeline_stats():
     try:
         pipeline = get_cover_letter_pipeline()
         stats = pipeline.get_pipeline_stats()
+        stats['llm_rate_limiter'] = get_llm_rate_limiter().get_stats()
+        stats['generation_cache'] = get_generation_cache().get_stats()
+        stats['job_analysis_store'] = get_job_analysis_store().get_stats()
+        stats['cover_letter_cache'] = cover_letter_manager.cache.get_stats()
+        stats['ingest_jobs'] = get_ingest_job_queue().get_stats()
         return stats
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파이프라인 통계 조회 실패: {str(e)}")
 
+def accepted_ingest_job(job: Dict[str, Any], **extra) -> JSONResponse:
+    """
+    백그라운드 수집 작업을 등록했을 때의 202 응답을 만듭니다.
+    """
+    return JSONResponse(status_code=202, content={
+        "job_id": job['id'],
+        "kind": job['kind'],
+        "filename": job['filename'],
+        "status": job['status'],
+        "status_url": f"/ingest/jobs/{job['id']}",
+        **extra
+    })
+
 @app.post("/upload-pdf")
 @app.post("/api/upload-pdf")
-async def upload_pdf(file: UploadFile = File(...)):
+async def upload_pdf(
+    file: UploadFile = File(...),
+    include_embeddings: bool = True,
+    background: bool = False,
+    source_id: Optional[str] = None,
+    x_client_id: Optional[str] = Header(None)
+):
     """
     PDF 파일을 업로드하고 텍스트를 추출합니다.
+    include_embeddings=false이면 응답에서 임베딩 벡터를 제외합니다.
+    source_id는 문서의 고정 식별자(예: 사용자별 이력서 ID)로, 같은 source_id로 다시 업로드하면
+    이전 버전의 청크를 교체합니다. 없으면 프론트엔드가 보내는 X-Client-Id와 파일명으로 정하고,
+    둘 다 없으면 파일명이 같은 다른 문서를 건드리지 않도록 새 청크만 추가합니다.
+    background=true이면 파일만 저장하고 202와 작업 ID를 바로 반환하며,
+    수집 진행 상황은 /ingest/jobs/{job_id}에서 페이지 단위로 확인할 수 있습니다.
     """
     if not file.filename.endswith('.pdf'):
         raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다.")
+    source_id = resolve_source_id(source_id, x_client_id, file.filename)
+    
+    if background:
+        try:
+            upload = await save_upload_in_chunks(file, INGEST_SPOOL_DIR, '.pdf')
+            job = await run_blocking(
+                get_ingest_job_queue().submit,
+                'pdf',
+                file.filename,
+                {
+                    'path': upload['path'],
+                    'filename': file.filename,
+                    'sha256': upload['sha256'],
+                    'size': upload['size'],
+                    'source_id': source_id
+                }
+            )
+            return accepted_ingest_job(job)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"PDF 수집 작업 등록 중 오류가 발생했습니다: {str(e)}")
     
     temp_file_path = None
     try:
-        # 임시 파일로 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf', dir=UPLOAD_DIR) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # 임시 파일로 저장 (/upload-pdf/stream, 백그라운드 수집과 같은 파일 바이트 다이제스트 계산)
+        upload = await save_upload_in_chunks(file, UPLOAD_DIR, '.pdf')
+        temp_file_path = upload['path']
         
         # PDF 파싱
         extracted_text = await parse_pdf(temp_file_path)
@@ -191,24 +371,10 @@ async def upload_pdf(file: UploadFile = File(...)):
         if not extracted_text or not any(text.strip() for text in extracted_text):
             raise HTTPException(status_code=400, detail="PDF에서 텍스트를 추출할 수 없습니다.")
         
-        # 텍스트를 임베딩으로 변환
-        embeddings = await generate_embeddings(extracted_text)
-        
-        # 벡터 스토어에 저장
-        vector_store = get_vector_store()
-        documents = []
-        for i, text in enumerate(extracted_text):
-            if text.strip():  # 빈 텍스트는 제외
-                documents.append({
-                    'filename': file.filename,
-                    'text': text,
-                    'pages': len(extracted_text),
-                    'page_number': i + 1
-                })
-        
-        vector_ids = []
-        if documents:
-            vector_ids = vector_store.add_pdf_documents(documents)
+        # 임베딩 생성 및 벡터 스토어 저장 (페이지당 한 번만 인코딩)
+        ingestion = await run_blocking(
+            get_pdf_ingestion_pipeline().ingest, file.filename, extracted_text, source_id, upload['sha256']
+        )
         
         # 임시 파일 삭제
         if temp_file_path and os.path.exists(temp_file_path):
@@ -216,11 +382,13 @@ async def upload_pdf(file: UploadFile = File(...)):
         
         return {
             "filename": file.filename,
+            "source_id": source_id,
             "text": extracted_text,
             "pages": len(extracted_text),
-            "embeddings": embeddings,
-            "embedding_dimension": len(embeddings[0]) if embeddings else 0,
-            "vector_ids": vector_ids,
+            "embeddings": ingestion['embeddings'] if include_embeddings else None,
+            "embedding_dimension": ingestion['embedding_dimension'],
+            "vector_ids": ingestion['vector_ids'],
+            "ingestion_status": ingestion['status'],
             "status": "success"
         }
     
@@ -235,10 +403,97 @@ async def upload_pdf(file: UploadFile = File(...)):
             os.unlink(temp_file_path)
         raise HTTPException(status_code=500, detail=f"PDF 파싱 중 오류가 발생했습니다: {str(e)}")
 
+def resolve_source_id(source_id: Optional[str], client_id: Optional[str], filename: str) -> Optional[str]:
+    """
+    업로드 문서의 고정 식별자를 정합니다.
+    source_id가 없으면 브라우저별 클라이언트 ID(X-Client-Id)와 파일명으로 만들어,
+    같은 사용자가 같은 이름으로 다시 올린 이력서가 이전 버전 청크를 교체하도록 합니다.
+    """
+    if source_id:
+        return source_id
+    if client_id:
+        return f"{client_id}/{filename}"
+    return None
+
+async def save_upload_in_chunks(file: UploadFile, directory: str, suffix: str) -> Dict[str, Any]:
+    """
+    업로드 파일을 UPLOAD_CHUNK_SIZE 단위로 읽어 임시 파일에 쓰고 경로, SHA-256, 크기를 반환합니다.
+    파일 전체를 메모리에 올리지 않습니다.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=directory)
+    try:
+        with temp_file:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                size += len(chunk)
+                await run_blocking(temp_file.write, chunk)
+    except BaseException:
+        os.unlink(temp_file.name)
+        raise
+    return {'path': temp_file.name, 'sha256': digest.hexdigest(), 'size': size}
+
+@app.post("/upload-pdf/stream")
+@app.post("/api/upload-pdf/stream")
+async def upload_pdf_stream(
+    file: UploadFile = File(...),
+    source_id: Optional[str] = None,
+    x_client_id: Optional[str] = Header(None)
+):
+    """
+    PDF 파일을 스트리밍 방식으로 업로드하고 인덱싱합니다.
+    업로드는 조각 단위로 디스크에 쓰고, 페이지를 하나씩 추출해 INGEST_BATCH_SIZE 청크씩 인코딩/저장하므로
+    문서 크기와 관계없이 메모리 사용량이 일정하며 처리된 페이지는 바로 검색됩니다.
+    응답에는 추출 텍스트와 임베딩 대신 수집 요약만 포함됩니다.
+    source_id는 /upload-pdf와 같이 이전 버전 청크를 교체할 문서 식별자입니다.
+    """
+    if not file.filename.endswith('.pdf'):
+        raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다.")
+    source_id = resolve_source_id(source_id, x_client_id, file.filename)
+    
+    upload = None
+    try:
+        upload = await save_upload_in_chunks(file, UPLOAD_DIR, '.pdf')
+        page_count = await run_blocking(count_pdf_pages, upload['path'])
+        result = await run_blocking(
+            get_pdf_ingestion_pipeline().ingest_stream,
+            file.filename,
+            iter_pdf_pages(upload['path']),
+            upload['sha256'],
+            page_count,
+            source_id=source_id
+        )
+        if result['status'] == 'empty':
+            raise HTTPException(status_code=400, detail="PDF에서 텍스트를 추출할 수 없습니다.")
+        
+        return {
+            "filename": file.filename,
+            "source_id": source_id,
+            "size": upload['size'],
+            "pages": page_count,
+            "vector_ids": result['vector_ids'],
+            "ingestion_status": result['status'],
+            "ingestion": {key: value for key, value in result.items() if key != 'vector_ids'},
+            "status": "success"
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"PDF 파싱 중 오류가 발생했습니다: {str(e)}")
+    finally:
+        if upload and os.path.exists(upload['path']):
+            os.unlink(upload['path'])
+
 @app.post("/submit-job-posting")
-async def submit_job_posting(job_posting: JobPosting):
+async def submit_job_posting(job_posting: JobPosting, background: bool = False):
     """
     텍스트로 입력된 Job Posting을 저장합니다.
+    background=true이면 저장과 인덱싱을 백그라운드 작업으로 넘기고 202와 작업 ID를 바로 반환합니다.
     """
     try:
         # 고유 ID 생성
@@ -256,14 +511,18 @@ async def submit_job_posting(job_posting: JobPosting):
             "status": "active"
         }
         
-        # 파일로 저장
-        file_path = os.path.join(JOB_POSTINGS_DIR, f"{job_id}.json")
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(job_data, f, ensure_ascii=False, indent=2)
+        if background:
+            job = await run_blocking(
+                get_ingest_job_queue().submit, 'job_posting', job_posting.jobTitle, {'job_posting': job_data}
+            )
+            return accepted_ingest_job(job, job_posting_id=job_id)
+        
+        # 파일로 저장하고 목록 인덱스 갱신
+        await run_blocking(get_job_posting_store().save, job_data)
         
         # 벡터 스토어에 저장
         vector_store = get_vector_store()
-        vector_store.add_job_posting(job_data)
+        await run_blocking(vector_store.add_job_posting, job_data)
         
         return JobPostingResponse(**job_data)
     
@@ -274,10 +533,12 @@ async def submit_job_posting(job_posting: JobPosting):
 async def upload_job_posting(
     file: UploadFile = File(...),
     jobTitle: str = Form(...),
-    companyName: str = Form(...)
+    companyName: str = Form(...),
+    background: bool = False
 ):
     """
     파일로 업로드된 Job Posting을 처리합니다.
+    background=true이면 파일만 저장하고 텍스트 추출과 인덱싱을 백그라운드 작업으로 넘겨 202를 반환합니다.
     """
     try:
         # 파일 확장자 확인
@@ -287,6 +548,26 @@ async def upload_job_posting(
         # 고유 ID 생성
         job_id = f"job_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hash(jobTitle)}"
         
+        if background:
+            suffix = '.txt' if file.filename.endswith('.txt') else '.pdf'
+            upload = await save_upload_in_chunks(file, INGEST_SPOOL_DIR, suffix)
+            job_data = {
+                "id": job_id,
+                "jobTitle": jobTitle,
+                "companyName": companyName,
+                "jobDescription": None,
+                "requirements": None,
+                "companyVision": None,
+                "createdAt": datetime.now().isoformat(),
+                "status": "active",
+                "sourceFile": file.filename
+            }
+            job = await run_blocking(
+                get_ingest_job_queue().submit, 'job_posting', file.filename,
+                {'path': upload['path'], 'job_posting': job_data}
+            )
+            return accepted_ingest_job(job, job_posting_id=job_id)
+        
         # 파일 내용 추출
         content = await file.read()
         
@@ -318,58 +599,137 @@ async def upload_job_posting(
             "sourceFile": file.filename
         }
         
-        # 파일로 저장
-        file_path = os.path.join(JOB_POSTINGS_DIR, f"{job_id}.json")
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(job_data, f, ensure_ascii=False, indent=2)
+        # 파일로 저장하고 목록 인덱스 갱신
+        await run_blocking(get_job_posting_store().save, job_data)
         
         # 벡터 스토어에 저장
         vector_store = get_vector_store()
-        vector_store.add_job_posting(job_data)
+        await run_blocking(vector_store.add_job_posting, job_data)
         
         return JobPostingResponse(**job_data)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Job Posting 업로드 중 오류가 발생했습니다: {str(e)}")
 
+@app.get("/ingest/jobs")
+@app.get("/api/ingest/jobs")
+async def list_ingest_jobs(status: Optional[str] = None, limit: int = 50):
+    """
+    최근 수집 작업 목록을 반환합니다. status로 필터링할 수 있습니다.
+    """
+    try:
+        jobs = await run_blocking(get_ingest_job_queue().store.list, status=status, limit=limit)
+        return {"jobs": jobs, "count": len(jobs)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"수집 작업 목록 조회 실패: {str(e)}")
+
+@app.get("/ingest/jobs/{job_id}")
+@app.get("/api/ingest/jobs/{job_id}")
+async def get_ingest_job(job_id: str):
+    """
+    수집 작업의 상태와 페이지 단위 진행률, 결과를 반환합니다.
+    """
+    job = await run_blocking(get_ingest_job_queue().store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="수집 작업을 찾을 수 없습니다.")
+    progress = job['progress'] or {}
+    if progress.get('page_count'):
+        job['progress']['percent'] = round(
+            100 * progress.get('pages_indexed', progress.get('pages_processed', 0)) / progress['page_count'], 1
+        )
+    job.pop('payload', None)
+    return job
+
 @app.get("/job-postings")
-async def get_job_postings():
+async def get_job_postings(
+    offset: int = 0,
+    limit: Optional[int] = 100,
+    company: Optional[str] = None,
+    title: Optional[str] = None,
+    sort: str = "desc"
+):
     """
-    저장된 모든 Job Posting을 조회합니다.
+    저장된 Job Posting을 createdAt 순으로 조회합니다.
+    company/title로 부분 일치 필터링, offset/limit으로 페이지 단위 조회가 가능합니다.
+    다음 페이지가 있으면 next_offset에 다음 요청의 offset을, 없으면 None을 반환합니다.
     """
     try:
-        job_postings = []
-        for filename in os.listdir(JOB_POSTINGS_DIR):
-            if filename.endswith('.json'):
-                file_path = os.path.join(JOB_POSTINGS_DIR, filename)
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    job_data = json.load(f)
-                    job_postings.append(JobPostingResponse(**job_data))
+        if sort not in ("asc", "desc"):
+            raise HTTPException(status_code=400, detail="sort는 asc 또는 desc만 가능합니다.")
+        
+        job_postings, total = await run_blocking(
+            get_job_posting_store().list,
+            offset=offset,
+            limit=limit,
+            company=company,
+            title=title,
+            sort=sort
+        )
         
-        return {"job_postings": job_postings, "count": len(job_postings)}
+        return {
+            "job_postings": job_postings,
+            "count": len(job_postings),
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "next_offset": offset + len(job_postings) if offset + len(job_postings) < total else None
+        }
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Job Posting 조회 중 오류가 발생했습니다: {str(e)}")
 
+@app.post("/job-postings/reindex")
+async def reindex_job_postings():
+    """
+    job_postings 디렉토리의 JSON 파일을 한 번에 읽어 목록 인덱스를 다시 만듭니다.
+    """
+    try:
+        return await run_blocking(get_job_posting_store().import_directory)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Job Posting 인덱스 재구성 실패: {str(e)}")
+
 @app.get("/job-postings/{job_id}")
 async def get_job_posting(job_id: str):
     """
     특정 Job Posting을 조회합니다.
     """
     try:
-        file_path = os.path.join(JOB_POSTINGS_DIR, f"{job_id}.json")
-        if not os.path.exists(file_path):
+        job_data = await run_blocking(get_job_posting_store().get, job_id)
+        if job_data is None:
             raise HTTPException(status_code=404, detail="Job Posting을 찾을 수 없습니다.")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            job_data = json.load(f)
-            return JobPostingResponse(**job_data)
+        return JobPostingResponse(**job_data)
     
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Job Posting 조회 중 오류가 발생했습니다: {str(e)}")
 
+@app.post("/job-postings/{job_id}/analyze")
+async def analyze_saved_job_posting(job_id: str, refresh: bool = False):
+    """
+    저장된 Job Posting을 분석합니다.
+    텍스트가 바뀌지 않았으면 job_postings/analyses에 저장된 결과를 재사용합니다.
+    """
+    try:
+        job_data = await run_blocking(get_job_posting_store().get, job_id)
+        if job_data is None:
+            raise HTTPException(status_code=404, detail="Job Posting을 찾을 수 없습니다.")
+        
+        from llm_integration import get_llm_integration
+        llm = get_llm_integration()
+        
+        result = await llm.aanalyze_job_posting(build_job_posting_text(job_data), use_cache=not refresh)
+        result['job_id'] = job_id
+        return result
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Job Posting 분석 실패: {str(e)}")
+
 @app.post("/search")
 async def search_documents(query: str, collection: str = "pdf_documents", n_results: int = 5):
     """
@@ -377,7 +737,7 @@ async def search_documents(query: str, collection: str = "pdf_documents", n_resu
     """
     try:
         vector_store = get_vector_store()
-        results = vector_store.search_similar_documents(query, collection, n_results)
+        results = await run_blocking(vector_store.search_similar_documents, query, collection, n_results)
         
         return {
             "query": query,
@@ -392,37 +752,17 @@ async def search_documents(query: str, collection: str = "pdf_documents", n_resu
 async def parse_pdf(file_path: str) -> List[str]:
     """
     PDF 파일을 파싱하여 텍스트를 추출합니다.
-    PyMuPDF와 pdfplumber를 모두 사용하여 더 나은 결과를 얻습니다.
+    파싱은 스레드 풀에서 실행되어 이벤트 루프를 막지 않습니다.
     """
-    pages_text = []
-    
-    try:
-        # PyMuPDF로 파싱 시도
-        doc = fitz.open(file_path)
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            text = page.get_text()
-            pages_text.append(text.strip())
-        doc.close()
-        
-        # 텍스트가 충분하지 않으면 pdfplumber로 재시도
-        if not any(text.strip() for text in pages_text):
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text() or ""
-                    pages_text.append(text.strip())
-    
-    except Exception as e:
-        # PyMuPDF 실패 시 pdfplumber로 재시도
-        try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text() or ""
-                    pages_text.append(text.strip())
-        except Exception as e2:
-            raise Exception(f"PDF 파싱 실패: {str(e)}, {str(e2)}")
-    
-    return pages_text
+    return await run_blocking(parse_pdf_sync, file_path)
+
+def parse_pdf_sync(file_path: str) -> List[str]:
+    """
+    PDF 파일을 파싱하여 페이지별 텍스트를 추출합니다.
+    PyMuPDF로 추출하고 텍스트가 없는 페이지만 pdfplumber로 다시 추출하며,
+    페이지가 많은 PDF는 프로세스 풀에서 페이지 구간별로 병렬 추출합니다.
+    """
+    return extract_pdf_pages(file_path)
 
 async def generate_embeddings(texts: List[str]) -> List[List[float]]:
     """
@@ -432,7 +772,7 @@ async def generate_embeddings(texts: List[str]) -> List[List[float]]:
         return []
     
     try:
-        model = get_embedding_model()
+        service = get_embedding_service()
         # 빈 텍스트 필터링
         non_empty_texts = [text for text in texts if text.strip()]
         
@@ -440,7 +780,7 @@ async def generate_embeddings(texts: List[str]) -> List[List[float]]:
             return []
         
         # 임베딩 생성
-        embeddings = model.encode(non_empty_texts)
+        embeddings = await run_blocking(service.encode, non_empty_texts)
         
         # numpy 배열을 리스트로 변환
         return embeddings.tolist()
@@ -474,17 +814,24 @@ async def get_pdf_info(filename: str):
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
     
     try:
-        doc = fitz.open(file_path)
-        info = {
+        return await run_blocking(read_pdf_info_sync, file_path, filename)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"파일 정보 읽기 실패: {str(e)}")
+
+def read_pdf_info_sync(file_path: str, filename: str) -> Dict[str, Any]:
+    """
+    PDF 파일을 열어 페이지 수, 크기, 메타데이터를 읽습니다.
+    """
+    doc = fitz.open(file_path)
+    try:
+        return {
             "filename": filename,
             "pages": len(doc),
             "size": os.path.getsize(file_path),
             "metadata": doc.metadata
         }
+    finally:
         doc.close()
-        return info
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"파일 정보 읽기 실패: {str(e)}")
 
 def parse_cover_letter_sections(cover_letter: str) -> Dict[str, CoverLetterSection]:
     """
@@ -532,6 +879,25 @@ def parse_cover_letter_sections(cover_letter: str) -> Dict[str, CoverLetterSecti
 
 # Cover Letter 편집 관련 API 엔드포인트들
 
+def resolve_expected_updated_at(expected_updated_at: Optional[str], if_match: Optional[str]) -> Optional[str]:
+    """
+    요청 본문의 expected_updated_at 또는 If-Match 헤더(ETag)에서 기대하는 updated_at을 꺼냅니다.
+    """
+    if expected_updated_at is not None:
+        return expected_updated_at
+    if if_match and if_match.strip() != '*':
+        return if_match.strip().removeprefix('W/').strip('"')
+    return None
+
+def conflict_exception(error: CoverLetterConflictError) -> HTTPException:
+    """
+    낙관적 동시성 충돌을 409 응답으로 변환합니다.
+    """
+    return HTTPException(
+        status_code=409,
+        detail={"message": str(error), "current_updated_at": error.current_updated_at}
+    )
+
 class CoverLetterSaveRequest(BaseModel):
     cover_letter: str
     job_title: str
@@ -560,7 +926,7 @@ async def save_cover_letter_for_editing(request: CoverLetterSaveRequest):
             user_question=request.user_question
         )
         
-        success = cover_letter_manager.save_cover_letter(cover_letter_version)
+        success = await run_blocking(cover_letter_manager.save_cover_letter, cover_letter_version)
         if not success:
             raise HTTPException(status_code=500, detail="Cover Letter 저장 실패")
         
@@ -571,20 +937,36 @@ async def save_cover_letter_for_editing(request: CoverLetterSaveRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Cover Letter 저장 실패: {str(e)}")
 
+@app.get("/cover-letter/versions")
+async def get_all_cover_letter_versions(limit: int = 50, cursor: Optional[str] = None):
+    """
+    Cover Letter 버전 요약을 최근 수정 순으로 반환합니다.
+    다음 페이지는 응답의 next_cursor를 cursor로 전달해 조회합니다.
+    """
+    try:
+        versions, next_cursor = await run_blocking(cover_letter_manager.list_versions, limit, cursor)
+        return {"versions": versions, "next_cursor": next_cursor}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"버전 목록 조회 실패: {str(e)}")
+
 @app.get("/cover-letter/{version_id}")
-async def get_cover_letter(version_id: str):
+async def get_cover_letter(version_id: str, response: Response):
     """
     저장된 Cover Letter를 조회합니다.
+    ETag 헤더(updated_at)를 수정 요청의 If-Match로 보내면 동시 수정을 감지할 수 있습니다.
     """
     try:
-        cover_letter = cover_letter_manager.load_cover_letter(version_id)
+        cover_letter = await run_blocking(cover_letter_manager.load_cover_letter, version_id)
         if not cover_letter:
             raise HTTPException(status_code=404, detail="Cover Letter를 찾을 수 없습니다.")
         
         # 편집 여부 확인
         has_edits = any(section.is_edited for section in cover_letter.sections.values())
+        response.headers["ETag"] = f'"{cover_letter.updated_at}"'
         
-        response = CoverLetterResponse(
+        return CoverLetterResponse(
             version_id=cover_letter.version_id,
             content=cover_letter.original_content,
             sections=cover_letter.sections,
@@ -594,103 +976,89 @@ async def get_cover_letter(version_id: str):
             company_name=cover_letter.company_name,
             has_edits=has_edits
         )
-        
-        return response
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Cover Letter 조회 실패: {str(e)}")
 
 @app.put("/cover-letter/{version_id}/section")
-async def update_cover_letter_section(request: CoverLetterEditRequest):
+async def update_cover_letter_section(
+    request: CoverLetterEditRequest,
+    response: Response,
+    if_match: Optional[str] = Header(None)
+):
     """
     Cover Letter의 특정 섹션을 업데이트합니다.
+    expected_updated_at 또는 If-Match가 현재 값과 다르면 409를 반환합니다.
+    새 updated_at을 본문과 ETag 헤더로 반환하므로 다음 수정 요청의 If-Match로 그대로 보낼 수 있습니다.
     """
     try:
-        success = cover_letter_manager.update_section(
+        cover_letter = await run_blocking(
+            cover_letter_manager.update_section,
             request.version_id,
             request.section_name,
-            request.new_content
+            request.new_content,
+            expected_updated_at=resolve_expected_updated_at(request.expected_updated_at, if_match)
         )
         
-        if not success:
+        if not cover_letter:
             raise HTTPException(status_code=404, detail="Cover Letter 또는 섹션을 찾을 수 없습니다.")
         
+        response.headers["ETag"] = f'"{cover_letter.updated_at}"'
         return {
             "message": "섹션이 성공적으로 업데이트되었습니다.",
             "version_id": request.version_id,
-            "section_name": request.section_name
+            "section_name": request.section_name,
+            "updated_at": cover_letter.updated_at
         }
+    except CoverLetterConflictError as e:
+        raise conflict_exception(e)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"섹션 업데이트 실패: {str(e)}")
 
 @app.put("/cover-letter/{version_id}/save-all")
-async def save_all_sections(request: CLSaveRequest):
+async def save_all_sections(
+    request: CLSaveRequest,
+    response: Response,
+    if_match: Optional[str] = Header(None)
+):
     """
     Cover Letter의 모든 섹션을 한 번에 저장합니다.
+    expected_updated_at 또는 If-Match가 현재 값과 다르면 409를 반환합니다.
+    새 updated_at을 본문과 ETag 헤더로 반환합니다.
     """
     try:
-        cover_letter = cover_letter_manager.load_cover_letter(request.version_id)
+        cover_letter = await run_blocking(
+            cover_letter_manager.save_all_sections,
+            request.version_id,
+            request.sections,
+            expected_updated_at=resolve_expected_updated_at(request.expected_updated_at, if_match)
+        )
         if not cover_letter:
             raise HTTPException(status_code=404, detail="Cover Letter를 찾을 수 없습니다.")
         
-        # 모든 섹션 업데이트
-        for section_name, content in request.sections.items():
-            if section_name in cover_letter.sections:
-                cover_letter.sections[section_name].content = content
-                cover_letter.sections[section_name].is_edited = True
-                cover_letter.sections[section_name].edited_at = datetime.now().isoformat()
-        
-        cover_letter.updated_at = datetime.now().isoformat()
-        
-        success = cover_letter_manager.save_cover_letter(cover_letter)
-        if not success:
-            raise HTTPException(status_code=500, detail="Cover Letter 저장 실패")
-        
+        response.headers["ETag"] = f'"{cover_letter.updated_at}"'
         return {
             "message": "모든 섹션이 성공적으로 저장되었습니다.",
-            "version_id": request.version_id
+            "version_id": request.version_id,
+            "updated_at": cover_letter.updated_at
         }
+    except CoverLetterConflictError as e:
+        raise conflict_exception(e)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"섹션 저장 실패: {str(e)}")
 
-@app.get("/cover-letter/versions")
-async def get_all_cover_letter_versions():
-    """
-    모든 Cover Letter 버전 목록을 반환합니다.
-    """
-    try:
-        version_ids = cover_letter_manager.get_all_versions()
-        versions = []
-        
-        for version_id in version_ids:
-            cover_letter = cover_letter_manager.load_cover_letter(version_id)
-            if cover_letter:
-                has_edits = any(section.is_edited for section in cover_letter.sections.values())
-                versions.append({
-                    "version_id": version_id,
-                    "job_title": cover_letter.job_title,
-                    "company_name": cover_letter.company_name,
-                    "created_at": cover_letter.created_at,
-                    "updated_at": cover_letter.updated_at,
-                    "has_edits": has_edits
-                })
-        
-        return {"versions": versions}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"버전 목록 조회 실패: {str(e)}")
-
 @app.delete("/cover-letter/{version_id}")
 async def delete_cover_letter(version_id: str):
     """
     Cover Letter를 삭제합니다.
     """
     try:
-        success = cover_letter_manager.delete_cover_letter(version_id)
+        success = await run_blocking(cover_letter_manager.delete_cover_letter, version_id)
         if not success:
             raise HTTPException(status_code=404, detail="Cover Letter를 찾을 수 없습니다.")
         
@@ -708,7 +1076,7 @@ async def get_section_history(version_id: str, section_name: str):
     특정 섹션의 버전 히스토리를 조회합니다.
     """
     try:
-        history = cover_letter_manager.get_section_history(version_id, section_name)
+        history = await run_blocking(cover_letter_manager.get_section_history, version_id, section_name)
         return {
             "version_id": version_id,
             "section_name": section_name,
@@ -723,24 +1091,14 @@ async def create_section_version(request: SectionVersionRequest):
     섹션의 현재 상태를 새로운 버전으로 저장합니다.
     """
     try:
-        cover_letter = cover_letter_manager.load_cover_letter(request.version_id)
-        if not cover_letter or request.section_name not in cover_letter.sections:
-            raise HTTPException(status_code=404, detail="Cover Letter 또는 섹션을 찾을 수 없습니다.")
-        
-        section = cover_letter.sections[request.section_name]
-        
-        # 현재 내용을 새로운 버전으로 저장
-        section_version = SectionVersion(
-            version_id=str(uuid.uuid4()),
-            content=section.content,
-            created_at=datetime.now().isoformat(),
-            change_description=request.change_description or f"{request.section_name} 섹션 버전 저장"
+        section_version = await run_blocking(
+            cover_letter_manager.add_section_version,
+            request.version_id,
+            request.section_name,
+            request.change_description
         )
-        section.version_history.append(section_version)
-        
-        success = cover_letter_manager.save_cover_letter(cover_letter)
-        if not success:
-            raise HTTPException(status_code=500, detail="버전 저장 실패")
+        if not section_version:
+            raise HTTPException(status_code=404, detail="Cover Letter 또는 섹션을 찾을 수 없습니다.")
         
         return {
             "message": "섹션 버전이 성공적으로 저장되었습니다.",
@@ -758,7 +1116,8 @@ async def revert_section(request: RevertSectionRequest):
     특정 섹션을 이전 버전으로 되돌립니다.
     """
     try:
-        success = cover_letter_manager.revert_section(
+        success = await run_blocking(
+            cover_letter_manager.revert_section,
             request.version_id,
             request.section_name,
             request.target_version_id
@@ -789,7 +1148,8 @@ async def update_section_with_description(
     섹션을 업데이트하고 변경 설명과 함께 버전 히스토리에 추가합니다.
     """
     try:
-        success = cover_letter_manager.update_section(
+        success = await run_blocking(
+            cover_letter_manager.update_section,
             version_id,
             section_name,
             new_content,
@@ -815,7 +1175,7 @@ async def get_save_status(version_id: str):
     Cover Letter의 저장 상태를 확인합니다.
     """
     try:
-        cover_letter = cover_letter_manager.load_cover_letter(version_id)
+        cover_letter = await run_blocking(cover_letter_manager.load_cover_letter, version_id)
         if not cover_letter:
             raise HTTPException(status_code=404, detail="Cover Letter를 찾을 수 없습니다.")
         
@@ -845,7 +1205,7 @@ async def debug_pdf_contents():
     """
     try:
         vector_store = get_vector_store()
-        results = vector_store.collections['pdf_documents'].get()
+        results = await run_blocking(vector_store.collections['pdf_documents'].get)
         
         pdf_contents = []
         for i, doc_id in enumerate(results['ids']):
@@ -871,7 +1231,7 @@ async def test_retrieval(query: str, n_results: int = 3):
     try:
         from retrieval import get_retrieval_component
         retrieval = get_retrieval_component()
-        results = retrieval.retrieve_relevant_pdf_documents(query, n_results)
+        results = await run_blocking(retrieval.retrieve_relevant_pdf_documents, query, n_results)
         
         return {
             "query": query,
@@ -882,7 +1242,7 @@ async def test_retrieval(query: str, n_results: int = 3):
         raise HTTPException(status_code=500, detail=f"검색 테스트 실패: {str(e)}")
 
 @app.get("/pdf-files")
-async def get_pdf_files():
+def get_pdf_files():
     """
     업로드된 PDF 파일 목록을 반환합니다.
     """
@@ -909,7 +1269,7 @@ async def get_pdf_files():
         raise HTTPException(status_code=500, detail=f"PDF 파일 목록 조회 중 오류: {str(e)}")
 
 @app.get("/debug/vector-store-stats")
-async def get_vector_store_stats():
+def get_debug_vector_store_stats():
     """
     벡터 스토어의 통계 정보를 확인합니다.
     """
@@ -949,7 +1309,8 @@ async def analyze_context_for_cover_letter(
     try:
         from retrieval import get_retrieval_component
         retrieval = get_retrieval_component()
-        context = retrieval.retrieve_context_for_cover_letter(
+        context = await run_blocking(
+            retrieval.retrieve_context_for_cover_letter,
             job_title=job_title,
             company_name=company_name,
             user_question=user_question
@@ -993,7 +1354,8 @@ async def debug_context_api(request: dict):
         
         from retrieval import get_retrieval_component
         retrieval = get_retrieval_component()
-        context = retrieval.retrieve_context_for_cover_letter(
+        context = await run_blocking(
+            retrieval.retrieve_context_for_cover_letter,
             job_title=job_title,
             company_name=company_name,
             user_question=None
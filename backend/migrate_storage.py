@@ -0,0 +1,81 @@
+"""
+기존 JSON 파일 레이아웃(cover_letters/*.json, job_postings/*.json)을 SQLite 저장 백엔드로 옮깁니다.
+여러 번 실행해도 같은 결과가 되며(키 기준 덮어쓰기), 원본 파일은 지우지 않습니다.
+섹션 히스토리 로그(cover_letters/history)는 두 백엔드가 같이 쓰므로 그대로 둡니다.
+
+사용법 (backend 디렉토리에서):
+    python migrate_storage.py --db storage.sqlite3
+    STORAGE_BACKEND=sqlite SQLITE_DB_PATH=storage.sqlite3 uvicorn main:app
+"""
+import argparse
+import os
+import time
+from typing import Dict, Any
+
+from cover_letter_models import CoverLetterManager
+from job_posting_store import JobPostingStore
+from storage_backends import JsonDocumentBackend, SQLiteDocumentBackend, get_sqlite_database
+
+# 한 트랜잭션으로 옮길 Cover Letter 수
+MIGRATION_BATCH_SIZE = 500
+
+
+def migrate_cover_letters(source_dir: str, db_path: str) -> Dict[str, Any]:
+    """
+    Cover Letter JSON 파일을 SQLite 테이블로 옮기고 카탈로그를 다시 만듭니다.
+    """
+    source = JsonDocumentBackend(source_dir)
+    target = SQLiteDocumentBackend(get_sqlite_database(db_path), "cover_letters")
+    migrated = 0
+    skipped = []
+    batch = {}
+    for key in source.keys():
+        try:
+            batch[key] = source.load(key)
+        except (OSError, ValueError) as e:
+            skipped.append({'key': key, 'error': str(e)})
+            continue
+        if len(batch) >= MIGRATION_BATCH_SIZE:
+            target.save_many(batch)
+            migrated += len(batch)
+            batch = {}
+    if batch:
+        target.save_many(batch)
+        migrated += len(batch)
+    # 다시 실행해도 최신 요약이 되도록 항상 카탈로그를 다시 만듦 (생성자의 자동 재구성과 중복되지 않게 끔)
+    manager = CoverLetterManager(storage_dir=source_dir, backend=target, auto_rebuild_catalog=False)
+    cataloged = manager.rebuild_catalog()
+    return {'migrated': migrated, 'cataloged': cataloged, 'skipped': skipped}
+
+
+def migrate_job_postings(source_dir: str, db_path: str) -> Dict[str, Any]:
+    """
+    Job Posting JSON 파일을 SQLite job_postings 테이블로 옮깁니다.
+    """
+    store = JobPostingStore(directory=source_dir, index_path=db_path, backend='sqlite')
+    result = store.import_directory()
+    return {'migrated': result['imported'], 'total': store.count(), 'skipped': result['skipped']}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--db', default=os.getenv('SQLITE_DB_PATH', 'storage.sqlite3'))
+    parser.add_argument('--cover-letters', default='cover_letters')
+    parser.add_argument('--job-postings', default=os.getenv('JOB_POSTINGS_DIR', 'job_postings'))
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cover_letters = migrate_cover_letters(args.cover_letters, args.db)
+    job_postings = migrate_job_postings(args.job_postings, args.db)
+    elapsed = time.perf_counter() - start
+
+    print(f"database: {args.db} (journal_mode={get_sqlite_database(args.db).journal_mode()})")
+    print(f"cover letters: {cover_letters['migrated']} migrated, {cover_letters['cataloged']} cataloged")
+    print(f"job postings: {job_postings['migrated']} migrated, {job_postings['total']} total")
+    for item in cover_letters['skipped'] + job_postings['skipped']:
+        print(f"skipped: {item}")
+    print(f"elapsed: {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
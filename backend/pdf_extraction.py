@@ -0,0 +1,178 @@
+from typing import Iterator, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import os
+import threading
+import fitz  # PyMuPDF
+import pdfplumber
+
+# 페이지 병렬 추출에 사용할 프로세스 수 (1이면 현재 프로세스에서 순차 추출)
+DEFAULT_PDF_EXTRACT_WORKERS = int(os.getenv('PDF_EXTRACT_WORKERS', str(min(4, os.cpu_count() or 1))))
+# 이 페이지 수 이상인 PDF만 프로세스 풀로 나눠 추출 (작은 PDF는 프로세스 간 전달 비용이 더 큼)
+DEFAULT_PDF_PARALLEL_MIN_PAGES = int(os.getenv('PDF_PARALLEL_MIN_PAGES', '32'))
+# 작업 하나가 맡는 최소 페이지 수
+MIN_PAGES_PER_TASK = 8
+# 스트리밍 추출 시 한 번에 읽는 페이지 수
+DEFAULT_PDF_STREAM_WINDOW_PAGES = int(os.getenv('PDF_STREAM_WINDOW_PAGES', '8'))
+
+
+def _extract_pdfplumber_pages(file_path: str, page_numbers: List[int]) -> List[str]:
+    """
+    pdfplumber로 지정한 페이지만 추출합니다.
+    """
+    texts = []
+    with pdfplumber.open(file_path) as pdf:
+        for page_number in page_numbers:
+            texts.append((pdf.pages[page_number].extract_text() or "").strip())
+    return texts
+
+
+def extract_page_range(file_path: str, start: int, end: int) -> List[str]:
+    """
+    [start, end) 페이지를 PyMuPDF로 추출하고, 텍스트가 비어 있는 페이지만 pdfplumber로 다시 추출합니다.
+    프로세스 풀 워커에서 실행되므로 모듈 수준 함수로 둡니다.
+    """
+    texts = []
+    doc = fitz.open(file_path)
+    try:
+        for page_number in range(start, end):
+            try:
+                texts.append(doc.load_page(page_number).get_text().strip())
+            except Exception:
+                texts.append("")
+    finally:
+        doc.close()
+
+    empty_pages = [start + i for i, text in enumerate(texts) if not text]
+    if empty_pages:
+        try:
+            for page_number, text in zip(empty_pages, _extract_pdfplumber_pages(file_path, empty_pages)):
+                texts[page_number - start] = text
+        except Exception:
+            # pdfplumber도 읽지 못한 페이지는 빈 텍스트로 둠
+            pass
+    return texts
+
+
+def split_page_ranges(page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """
+    페이지를 워커 수의 두 배 정도의 연속 구간으로 나눕니다 (느린 페이지가 한 워커에 몰리지 않도록).
+    """
+    size = max(MIN_PAGES_PER_TASK, -(-page_count // (workers * 2)))
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+# 전역 PDF 추출 프로세스 풀 인스턴스
+pdf_process_pool = None
+pdf_process_pool_lock = threading.Lock()
+
+def get_pdf_process_pool(workers: int = None) -> ProcessPoolExecutor:
+    """
+    전역 PDF 추출 프로세스 풀을 반환합니다.
+    서버의 스레드(이벤트 루프, 스레드 풀)를 복제하지 않도록 spawn 방식으로 워커를 만듭니다.
+    """
+    global pdf_process_pool
+    with pdf_process_pool_lock:
+        if pdf_process_pool is None:
+            pdf_process_pool = ProcessPoolExecutor(
+                max_workers=workers or DEFAULT_PDF_EXTRACT_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return pdf_process_pool
+
+def discard_pdf_process_pool(pool: ProcessPoolExecutor):
+    """
+    워커가 비정상 종료되어 더 쓸 수 없는 풀을 버립니다. 다음 get_pdf_process_pool 호출 때 새 풀을 만듭니다.
+    다른 스레드가 이미 새 풀로 바꿨으면 그대로 둡니다.
+    """
+    global pdf_process_pool
+    with pdf_process_pool_lock:
+        if pdf_process_pool is pool:
+            pdf_process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def shutdown_pdf_process_pool():
+    """
+    프로세스 풀을 종료합니다.
+    """
+    global pdf_process_pool
+    with pdf_process_pool_lock:
+        pool, pdf_process_pool = pdf_process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def count_pdf_pages(file_path: str) -> int:
+    """
+    PDF의 페이지 수를 반환합니다.
+    """
+    try:
+        doc = fitz.open(file_path)
+        page_count = len(doc)
+        doc.close()
+        return page_count
+    except Exception as e:
+        try:
+            with pdfplumber.open(file_path) as pdf:
+                return len(pdf.pages)
+        except Exception as e2:
+            raise Exception(f"PDF 파싱 실패: {str(e)}, {str(e2)}")
+
+
+def iter_pdf_pages(file_path: str, window_pages: int = None) -> Iterator[Tuple[int, str]]:
+    """
+    (페이지 번호(1부터), 텍스트)를 페이지 순서대로 하나씩 내보내는 생성기입니다.
+    window_pages 페이지씩만 읽으므로 문서 크기와 관계없이 메모리 사용량이 일정합니다.
+    """
+    window_pages = window_pages or DEFAULT_PDF_STREAM_WINDOW_PAGES
+    page_count = count_pdf_pages(file_path)
+    for start in range(0, page_count, window_pages):
+        end = min(start + window_pages, page_count)
+        try:
+            texts = extract_page_range(file_path, start, end)
+        except Exception:
+            # PyMuPDF가 열지 못하는 파일은 pdfplumber로 구간을 추출
+            texts = _extract_pdfplumber_pages(file_path, list(range(start, end)))
+        for offset, text in enumerate(texts):
+            yield start + offset + 1, text
+
+
+def extract_pdf_pages(file_path: str, workers: int = None, min_parallel_pages: int = None) -> List[str]:
+    """
+    PDF의 페이지별 텍스트를 페이지 순서대로 반환합니다.
+    페이지가 많으면 페이지 구간을 프로세스 풀에 나눠 병렬로 추출합니다.
+    PyMuPDF가 파일을 열지 못하면 전체를 pdfplumber로 추출합니다.
+    """
+    workers = DEFAULT_PDF_EXTRACT_WORKERS if workers is None else workers
+    min_parallel_pages = DEFAULT_PDF_PARALLEL_MIN_PAGES if min_parallel_pages is None else min_parallel_pages
+
+    try:
+        doc = fitz.open(file_path)
+        page_count = len(doc)
+        doc.close()
+    except Exception as e:
+        try:
+            with pdfplumber.open(file_path) as pdf:
+                return [(page.extract_text() or "").strip() for page in pdf.pages]
+        except Exception as e2:
+            raise Exception(f"PDF 파싱 실패: {str(e)}, {str(e2)}")
+
+    if workers <= 1 or page_count < max(min_parallel_pages, 2):
+        return extract_page_range(file_path, 0, page_count)
+
+    # 워커가 비정상 종료되면(BrokenProcessPool) 풀을 새로 만들어 한 번 더 시도
+    for attempt in range(2):
+        pool = get_pdf_process_pool(workers)
+        try:
+            futures = [
+                pool.submit(extract_page_range, file_path, start, end)
+                for start, end in split_page_ranges(page_count, workers)
+            ]
+            pages_text = []
+            for future in futures:
+                pages_text.extend(future.result())
+            return pages_text
+        except BrokenProcessPool as e:
+            discard_pdf_process_pool(pool)
+            if attempt == 1:
+                raise Exception(f"PDF 파싱 실패: 추출 프로세스가 비정상 종료되었습니다 ({str(e)})")
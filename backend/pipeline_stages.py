@@ -0,0 +1,72 @@
+from typing import Any, Awaitable, Callable, Dict, List
+import asyncio
+import time
+
+
+class StageGraph:
+    def __init__(self):
+        """
+        의존 관계가 있는 파이프라인 단계(stage) 그래프를 초기화합니다.
+        서로 의존하지 않는 단계는 동시에 실행됩니다.
+        """
+        self.stages = {}
+
+    def add_stage(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Awaitable[Any]],
+        depends_on: List[str] = None
+    ) -> 'StageGraph':
+        """
+        단계를 추가합니다. func는 선행 단계 결과 dict({단계 이름: 결과})를 받는 코루틴 함수입니다.
+        """
+        depends_on = list(depends_on or [])
+        for dependency in depends_on:
+            if dependency not in self.stages:
+                raise ValueError(f"알 수 없는 선행 단계입니다: {dependency}")
+        self.stages[name] = {'func': func, 'depends_on': depends_on}
+        return self
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        모든 단계를 의존 순서대로 실행하고 {'results', 'timings'}를 반환합니다.
+        한 단계가 실패하면 나머지 단계를 취소하고 예외를 그대로 올립니다.
+        """
+        start = time.perf_counter()
+        results = {}
+        timings = {}
+        tasks = {}
+
+        async def run_stage(name: str):
+            stage = self.stages[name]
+            await asyncio.gather(*[tasks[dependency] for dependency in stage['depends_on']])
+            stage_start = time.perf_counter()
+            results[name] = await stage['func']({dependency: results[dependency] for dependency in stage['depends_on']})
+            stage_end = time.perf_counter()
+            timings[name] = {
+                'depends_on': stage['depends_on'],
+                'started_ms': round((stage_start - start) * 1000, 2),
+                'finished_ms': round((stage_end - start) * 1000, 2),
+                'duration_ms': round((stage_end - stage_start) * 1000, 2)
+            }
+
+        # 단계는 선행 단계 뒤에만 추가할 수 있으므로 삽입 순서가 곧 위상 정렬 순서
+        for name in self.stages:
+            tasks[name] = asyncio.ensure_future(run_stage(name))
+        try:
+            await asyncio.gather(*tasks.values())
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        total_ms = round((time.perf_counter() - start) * 1000, 2)
+        return {
+            'results': results,
+            'timings': {
+                'stages': timings,
+                'total_ms': total_ms,
+                'sum_of_stages_ms': round(sum(t['duration_ms'] for t in timings.values()), 2)
+            }
+        }
@@ -0,0 +1,121 @@
+from typing import List, Dict, Any, Optional, Tuple
+from embedding_service import get_embedding_service
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime
+
+# 컨텍스트 검색 시 항상 함께 사용하는 고정 검색어(probe) 기본값
+DEFAULT_QUERY_PROBES = ["경험", "프로젝트", "기술", "개발", "관리", "분석", "설계", "구현"]
+
+
+def load_probes_from_env() -> List[str]:
+    """
+    RETRIEVAL_PROBES 환경 변수(쉼표 구분)에서 검색어 목록을 읽습니다.
+    """
+    value = os.getenv('RETRIEVAL_PROBES')
+    if not value:
+        return list(DEFAULT_QUERY_PROBES)
+    return [probe.strip() for probe in value.split(',') if probe.strip()]
+
+
+class QueryProbeTable:
+    def __init__(self, probes: List[str] = None):
+        """
+        고정 검색어의 임베딩을 미리 계산해 두는 테이블을 초기화합니다.
+        임베딩 모델이 바뀌면 자동으로 다시 계산합니다.
+        """
+        self.embedding_service = get_embedding_service()
+        self.probes = list(probes) if probes is not None else load_probes_from_env()
+        self._embeddings = {}
+        self._model_name = None
+        self._stamp = None
+        self._lock = threading.Lock()
+        self.computed_at = None
+        self.compute_time_ms = None
+
+    def _current_stamp(self, probes: List[str] = None) -> Tuple[str, int, str]:
+        """
+        (모델 이름, 임베딩 차원, 검색어 목록 해시)를 반환합니다.
+        모델 이름은 설정값이라 바뀌지 않을 수 있으므로, 실제 모델의 차원과 검색어 내용까지 비교합니다.
+        """
+        digest = hashlib.sha256()
+        for probe in self.probes if probes is None else probes:
+            digest.update(probe.encode('utf-8'))
+            digest.update(b'\x00')
+        return (self.embedding_service.model_name, self.embedding_service.get_dimension(), digest.hexdigest())
+
+    def _is_stale(self) -> bool:
+        """
+        테이블이 현재 모델/검색어 목록과 맞지 않는지 확인합니다.
+        """
+        return self._stamp is None or self._stamp != self._current_stamp()
+
+    def precompute(self, probes: List[str] = None) -> Dict[str, Any]:
+        """
+        모든 검색어 임베딩을 한 번의 encode 호출로 계산합니다.
+        probes가 주어지면 계산이 끝난 뒤 검색어 목록을 교체합니다.
+        """
+        probes = list(self.probes if probes is None else probes)
+        start = time.perf_counter()
+        embeddings = self.embedding_service.encode(probes).tolist() if probes else []
+        with self._lock:
+            self.probes = probes
+            self._embeddings = dict(zip(probes, embeddings))
+            self._model_name = self.embedding_service.model_name
+            self._stamp = self._current_stamp(probes)
+            self.compute_time_ms = round((time.perf_counter() - start) * 1000, 2)
+            self.computed_at = datetime.now().isoformat()
+        return self.get_stats()
+
+    def snapshot(self) -> Tuple[List[str], List[List[float]]]:
+        """
+        (검색어 목록, 같은 순서의 임베딩 목록)을 반환합니다. 필요하면 다시 계산합니다.
+        """
+        if self._is_stale():
+            self.precompute()
+        with self._lock:
+            probes = list(self.probes)
+            return probes, [self._embeddings[probe] for probe in probes]
+
+    def set_probes(self, probes: List[str]) -> Dict[str, Any]:
+        """
+        검색어 목록을 교체하고 임베딩을 다시 계산합니다.
+        """
+        return self.precompute([probe.strip() for probe in probes if probe.strip()])
+
+    def invalidate(self):
+        """
+        미리 계산된 임베딩을 무효화합니다.
+        """
+        with self._lock:
+            self._embeddings = {}
+            self._model_name = None
+            self._stamp = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        검색어 테이블 상태를 반환합니다.
+        """
+        return {
+            'probes': self.probes,
+            'model_name': self._model_name,
+            # 모델이 아직 로드되지 않았으면 통계 조회 때문에 로드하지 않음
+            'computed': self.embedding_service.is_loaded() and not self._is_stale(),
+            'embedding_dimension': self._stamp[1] if self._stamp else None,
+            'computed_at': self.computed_at,
+            'compute_time_ms': self.compute_time_ms
+        }
+
+# 전역 검색어 테이블 인스턴스
+query_probe_table = None
+
+def get_query_probe_table():
+    """
+    전역 검색어 테이블 인스턴스를 반환합니다.
+    """
+    global query_probe_table
+    if query_probe_table is None:
+        query_probe_table = QueryProbeTable()
+    return query_probe_table
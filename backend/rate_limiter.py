@@ -0,0 +1,76 @@
+from typing import Dict, Any
+import asyncio
+import os
+import threading
+import time
+
+class RateLimiter:
+    def __init__(self, requests_per_minute: float = 0, burst: int = 1):
+        """
+        토큰 버킷 방식의 요청 속도 제한기를 초기화합니다.
+        requests_per_minute가 0 이하이면 제한하지 않습니다.
+        스레드/이벤트 루프에 관계없이 프로세스 전역에서 공유할 수 있습니다.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.burst = max(1, burst)
+        self._rate = requests_per_minute / 60.0
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait_seconds = 0.0
+
+    def _reserve(self) -> float:
+        """
+        토큰 하나를 예약하고 기다려야 하는 시간(초)을 반환합니다.
+        """
+        with self._lock:
+            self.acquired += 1
+            if self._rate <= 0:
+                return 0.0
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self._rate
+            self.throttled += 1
+            self.total_wait_seconds += wait
+            return wait
+
+    async def acquire(self):
+        """
+        요청 한 건을 보낼 수 있을 때까지 비동기로 기다립니다.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        속도 제한 통계를 반환합니다.
+        """
+        return {
+            'requests_per_minute': self.requests_per_minute,
+            'burst': self.burst,
+            'acquired': self.acquired,
+            'throttled': self.throttled,
+            'total_wait_seconds': round(self.total_wait_seconds, 3)
+        }
+
+# 전역 LLM 속도 제한기 인스턴스
+llm_rate_limiter = None
+
+def get_llm_rate_limiter():
+    """
+    모든 LLM 호출이 공유하는 전역 속도 제한기를 반환합니다.
+    """
+    global llm_rate_limiter
+    if llm_rate_limiter is None:
+        llm_rate_limiter = RateLimiter(
+            requests_per_minute=float(os.getenv('LLM_REQUESTS_PER_MINUTE', '300')),
+            burst=int(os.getenv('LLM_RATE_LIMIT_BURST', '10'))
+        )
+    return llm_rate_limiter
@@ -1,6 +1,10 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from vector_store import get_vector_store
+from embedding_service import get_embedding_service
+from query_probes import get_query_probe_table
 import json
+import os
+import time
 from datetime import datetime
 
 class InformationRetrieval:
@@ -9,6 +13,30 @@ class InformationRetrieval:
         정보 검색 컴포넌트를 초기화합니다.
         """
         self.vector_store = get_vector_store()
+        self.embedding_service = get_embedding_service()
+        self.query_probes = get_query_probe_table()
+        self.batched = os.getenv('RETRIEVAL_BATCHED', 'true').lower() == 'true'
+    
+    def _format_results(self, results: Dict[str, Any], n_results: int = None) -> List[Dict[str, Any]]:
+        """
+        벡터 스토어 검색 결과를 랭킹된 문서 목록으로 변환합니다.
+        """
+        formatted = []
+        for i, (doc, metadata, distance) in enumerate(zip(
+            results['documents'], 
+            results['metadatas'], 
+            results['distances']
+        )):
+            if n_results is not None and i >= n_results:
+                break
+            formatted.append({
+                'id': results['ids'][i],
+                'content': doc,
+                'metadata': metadata,
+                'similarity_score': 1 - distance,  # 거리를 유사도 점수로 변환
+                'rank': i + 1
+            })
+        return formatted
     
     def retrieve_relevant_job_postings(self, query: str, n_results: int = 3) -> List[Dict[str, Any]]:
         """
@@ -16,22 +44,7 @@ class InformationRetrieval:
         """
         try:
             results = self.vector_store.search_job_postings(query, n_results)
-            
-            relevant_postings = []
-            for i, (doc, metadata, distance) in enumerate(zip(
-                results['documents'], 
-                results['metadatas'], 
-                results['distances']
-            )):
-                relevant_postings.append({
-                    'id': results['ids'][i],
-                    'content': doc,
-                    'metadata': metadata,
-                    'similarity_score': 1 - distance,  # 거리를 유사도 점수로 변환
-                    'rank': i + 1
-                })
-            
-            return relevant_postings
+            return self._format_results(results)
         
         except Exception as e:
             raise Exception(f"Job Posting 검색 실패: {str(e)}")
@@ -42,70 +55,128 @@ class InformationRetrieval:
         """
         try:
             results = self.vector_store.search_pdf_documents(query, n_results)
-            
-            relevant_documents = []
-            for i, (doc, metadata, distance) in enumerate(zip(
-                results['documents'], 
-                results['metadatas'], 
-                results['distances']
-            )):
-                relevant_documents.append({
-                    'id': results['ids'][i],
-                    'content': doc,
-                    'metadata': metadata,
-                    'similarity_score': 1 - distance,
-                    'rank': i + 1
-                })
-            
-            return relevant_documents
+            return self._format_results(results)
         
         except Exception as e:
             raise Exception(f"PDF 문서 검색 실패: {str(e)}")
     
+    def _build_pdf_queries(
+        self,
+        job_title: str,
+        company_name: str,
+        user_question: str,
+        max_pdf_results: int,
+        probes: List[str]
+    ) -> List[Tuple[str, int, bool]]:
+        """
+        PDF 검색에 사용할 (쿼리, 결과 수, 일반 키워드 여부) 목록을 구성합니다.
+        """
+        queries = []
+        
+        # 1. 사용자 질문이 있는 경우 해당 질문으로 검색
+        if user_question:
+            queries.append((user_question, max_pdf_results, False))
+        
+        # 2. 직무 제목, 3. 회사명으로도 검색
+        queries.append((job_title, max_pdf_results, False))
+        queries.append((company_name, max_pdf_results, False))
+        
+        # 4. 일반적인 키워드로 검색 (경험, 프로젝트, 기술 등, 임베딩은 미리 계산됨)
+        for keyword in probes:
+            queries.append((keyword, 1, True))
+        
+        return queries
+    
+    def _batched_pdf_fetcher(
+        self,
+        pdf_queries: List[Tuple[str, int, bool]],
+        query_embeddings: List[List[float]],
+        timings: Dict[str, float]
+    ) -> Callable[[int], List[Dict[str, Any]]]:
+        """
+        PDF 쿼리 결과를 그룹(직접 쿼리 / 일반 키워드) 단위로 한 번에 조회하는 함수를 반환합니다.
+        일반 키워드 그룹은 실제로 필요할 때만 조회합니다.
+        """
+        cache = {}
+        
+        def fetch(index: int) -> List[Dict[str, Any]]:
+            if index not in cache:
+                is_keyword = pdf_queries[index][2]
+                group = [i for i, query in enumerate(pdf_queries) if query[2] == is_keyword]
+                start = time.perf_counter()
+                results = self.vector_store.search_by_embeddings(
+                    [query_embeddings[i] for i in group],
+                    'pdf_documents',
+                    max(pdf_queries[i][1] for i in group)
+                )
+                timings['pdf_query_ms'] = timings.get('pdf_query_ms', 0) + (time.perf_counter() - start) * 1000
+                timings['chroma_round_trips'] = timings.get('chroma_round_trips', 0) + 1
+                cache.update(zip(group, results))
+            return self._format_results(cache[index], pdf_queries[index][1])
+        
+        return fetch
+    
     def retrieve_context_for_cover_letter(
         self, 
         job_title: str, 
         company_name: str, 
         user_question: str = None,
         max_job_results: int = 2,
-        max_pdf_results: int = 3
+        max_pdf_results: int = 3,
+        batched: bool = None
     ) -> Dict[str, Any]:
         """
         Cover Letter 생성을 위한 컨텍스트를 검색합니다.
+        batched=True이면 모든 쿼리를 한 번에 인코딩하고 한 번의 쿼리로 검색합니다.
         """
         try:
-            # Job Posting 검색
-            job_query = f"{job_title} {company_name}"
-            relevant_jobs = self.retrieve_relevant_job_postings(job_query, max_job_results)
+            if batched is None:
+                batched = self.batched
+            request_start = time.perf_counter()
             
-            # PDF 문서 검색 - 더 적극적으로 검색
-            relevant_pdfs = []
-            
-            # 1. 사용자 질문이 있는 경우 해당 질문으로 검색
-            if user_question:
-                pdfs_from_question = self.retrieve_relevant_pdf_documents(user_question, max_pdf_results)
-                relevant_pdfs.extend(pdfs_from_question)
-            
-            # 2. 직무 제목으로도 검색 (중복 제거)
-            pdfs_from_job = self.retrieve_relevant_pdf_documents(job_title, max_pdf_results)
-            for pdf in pdfs_from_job:
-                if not any(existing['id'] == pdf['id'] for existing in relevant_pdfs):
-                    relevant_pdfs.append(pdf)
+            job_query = f"{job_title} {company_name}"
+            probes, probe_embeddings = self.query_probes.snapshot()
+            pdf_queries = self._build_pdf_queries(job_title, company_name, user_question, max_pdf_results, probes)
             
-            # 3. 회사명으로도 검색 (중복 제거)
-            pdfs_from_company = self.retrieve_relevant_pdf_documents(company_name, max_pdf_results)
-            for pdf in pdfs_from_company:
-                if not any(existing['id'] == pdf['id'] for existing in relevant_pdfs):
-                    relevant_pdfs.append(pdf)
+            timings = {}
+            if batched:
+                # 동적 쿼리만 한 번의 encode 호출로 임베딩하고 고정 키워드는 미리 계산된 값 사용
+                start = time.perf_counter()
+                dynamic_queries = [query for query, _, is_keyword in pdf_queries if not is_keyword]
+                embeddings = self.vector_store.encode_queries([job_query] + dynamic_queries)
+                embeddings.extend(probe_embeddings)
+                timings['encode_ms'] = (time.perf_counter() - start) * 1000
+                
+                start = time.perf_counter()
+                job_results = self.vector_store.search_by_embeddings(embeddings[:1], 'job_postings', max_job_results)[0]
+                timings['job_query_ms'] = (time.perf_counter() - start) * 1000
+                timings['chroma_round_trips'] = 1
+                
+                relevant_jobs = self._format_results(job_results)
+                fetch_pdfs = self._batched_pdf_fetcher(pdf_queries, embeddings[1:], timings)
+            else:
+                relevant_jobs = self.retrieve_relevant_job_postings(job_query, max_job_results)
+                
+                def fetch_pdfs(index: int) -> List[Dict[str, Any]]:
+                    query, n_results, is_keyword = pdf_queries[index]
+                    if is_keyword:
+                        probe_index = index - (len(pdf_queries) - len(probe_embeddings))
+                        results = self.vector_store.search_by_embeddings(
+                            [probe_embeddings[probe_index]], 'pdf_documents', n_results
+                        )[0]
+                        return self._format_results(results)
+                    return self.retrieve_relevant_pdf_documents(query, n_results)
             
-            # 4. 일반적인 키워드로 검색 (경험, 프로젝트, 기술 등)
-            general_keywords = ["경험", "프로젝트", "기술", "개발", "관리", "분석", "설계", "구현"]
-            for keyword in general_keywords:
-                if len(relevant_pdfs) < max_pdf_results * 2:  # 너무 많이 가져오지 않도록 제한
-                    pdfs_from_keyword = self.retrieve_relevant_pdf_documents(keyword, 1)
-                    for pdf in pdfs_from_keyword:
-                        if not any(existing['id'] == pdf['id'] for existing in relevant_pdfs):
-                            relevant_pdfs.append(pdf)
+            # PDF 문서 검색 결과 병합 (중복 제거)
+            relevant_pdfs = []
+            queries_used = 0
+            for i, (_, _, is_keyword) in enumerate(pdf_queries):
+                if is_keyword and len(relevant_pdfs) >= max_pdf_results * 2:  # 너무 많이 가져오지 않도록 제한
+                    continue
+                queries_used += 1
+                for pdf in fetch_pdfs(i):
+                    if not any(existing['id'] == pdf['id'] for existing in relevant_pdfs):
+                        relevant_pdfs.append(pdf)
             
             # 유사도 점수로 정렬하고 상위 결과만 선택
             relevant_pdfs.sort(key=lambda x: x['similarity_score'], reverse=True)
@@ -120,7 +191,16 @@ class InformationRetrieval:
                     'company_name': company_name,
                     'user_question': user_question,
                     'retrieved_at': datetime.now().isoformat(),
-                    'search_strategy': 'multi_query_enhanced'
+                    'search_strategy': 'multi_query_batched' if batched else 'multi_query_enhanced'
+                },
+                'timings': {
+                    **{name: round(value, 2) for name, value in timings.items()},
+                    'mode': 'batched' if batched else 'sequential',
+                    'num_queries': 1 + queries_used,
+                    'encode_calls': 1 if batched else 1 + sum(
+                        1 for i, query in enumerate(pdf_queries) if not query[2]
+                    ),
+                    'total_ms': round((time.perf_counter() - request_start) * 1000, 2)
                 },
                 'summary': {
                     'total_job_postings': len(relevant_jobs),
@@ -164,7 +244,8 @@ class InformationRetrieval:
             return {
                 'collections': stats,
                 'total_documents': sum(stat.get('document_count', 0) for stat in stats.values()),
-                'available_collections': list(stats.keys())
+                'available_collections': list(stats.keys()),
+                'embedding': self.embedding_service.get_stats()
             }
         
         except Exception as e:
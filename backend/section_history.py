@@ -0,0 +1,149 @@
+from typing import List, Dict, Any
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import json
+import os
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # fcntl이 없는 환경(Windows)에서는 프로세스 내 잠금만 사용
+    fcntl = None
+
+# 섹션별로 보관할 최대 히스토리 수 (0이면 제한 없음)
+DEFAULT_HISTORY_MAX_ENTRIES = int(os.getenv('SECTION_HISTORY_MAX_ENTRIES', '50'))
+# 히스토리 보관 기간(일) (0이면 제한 없음)
+DEFAULT_HISTORY_MAX_AGE_DAYS = float(os.getenv('SECTION_HISTORY_MAX_AGE_DAYS', '0'))
+# 이 횟수만큼 추가될 때마다 로그를 보관 정책에 맞게 다시 씀
+DEFAULT_HISTORY_COMPACT_EVERY = int(os.getenv('SECTION_HISTORY_COMPACT_EVERY', '100'))
+
+
+class SectionHistoryLog:
+    """Cover Letter별 섹션 히스토리를 본문과 분리된 추가 전용(JSONL) 로그로 보관하는 클래스"""
+
+    def __init__(
+        self,
+        directory: str,
+        max_entries: int = None,
+        max_age_days: float = None,
+        compact_every: int = None
+    ):
+        self.directory = directory
+        self.max_entries = DEFAULT_HISTORY_MAX_ENTRIES if max_entries is None else max_entries
+        self.max_age_days = DEFAULT_HISTORY_MAX_AGE_DAYS if max_age_days is None else max_age_days
+        self.compact_every = DEFAULT_HISTORY_COMPACT_EVERY if compact_every is None else compact_every
+        os.makedirs(directory, exist_ok=True)
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        self._appends_since_compact = {}
+
+    def _path(self, version_id: str) -> str:
+        return os.path.join(self.directory, f"{version_id}.jsonl")
+
+    def _lock_path(self, version_id: str) -> str:
+        return os.path.join(self.directory, "locks", f"{version_id}.lock")
+
+    @contextmanager
+    def _locked(self, version_id: str):
+        """
+        한 버전의 로그 추가/압축 구간을 다른 스레드/프로세스와 겹치지 않게 잠급니다.
+        압축은 로그 파일을 os.replace로 바꾸므로 별도의 잠금 파일을 사용하며,
+        버전별 잠금이므로 한 버전을 기다리는 동안 다른 버전의 히스토리는 막히지 않습니다.
+        """
+        with self._locks_guard:
+            thread_lock = self._locks.setdefault(version_id, threading.Lock())
+        with thread_lock:
+            if fcntl is None:
+                yield
+                return
+            os.makedirs(os.path.dirname(self._lock_path(version_id)), exist_ok=True)
+            with open(self._lock_path(version_id), 'a') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def append(self, version_id: str, section_name: str, entries: List[Dict[str, Any]]):
+        """히스토리 항목을 로그 끝에 추가합니다. 기존 내용은 다시 쓰지 않습니다."""
+        if not entries:
+            return
+        lines = "".join(
+            json.dumps(dict(entry, section_name=section_name), ensure_ascii=False) + "\n"
+            for entry in entries
+        )
+        with self._locked(version_id):
+            with open(self._path(version_id), 'a', encoding='utf-8') as f:
+                f.write(lines)
+            appended = self._appends_since_compact.get(version_id, 0) + len(entries)
+            self._appends_since_compact[version_id] = appended
+            if self.compact_every and appended >= self.compact_every:
+                self._compact_locked(version_id)
+
+    def _read_all(self, version_id: str) -> List[Dict[str, Any]]:
+        path = self._path(version_id)
+        if not os.path.exists(path):
+            return []
+        entries = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    # 중단된 쓰기로 잘린 마지막 줄은 건너뜀
+                    continue
+        return entries
+
+    def _apply_retention(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """보관 기간과 섹션별 최대 개수를 적용합니다 (오래된 항목부터 제거)."""
+        if self.max_age_days:
+            cutoff = (datetime.now() - timedelta(days=self.max_age_days)).isoformat()
+            entries = [entry for entry in entries if entry.get('created_at', '') >= cutoff]
+        if self.max_entries:
+            kept = []
+            counts = {}
+            for entry in reversed(entries):
+                section_name = entry.get('section_name')
+                counts[section_name] = counts.get(section_name, 0) + 1
+                if counts[section_name] <= self.max_entries:
+                    kept.append(entry)
+            entries = list(reversed(kept))
+        return entries
+
+    def read(self, version_id: str, section_name: str = None) -> List[Dict[str, Any]]:
+        """
+        보관 정책을 적용한 히스토리를 오래된 순으로 반환합니다.
+        압축은 os.replace로 파일을 통째로 바꾸고 추가 중 잘린 줄은 건너뛰므로 잠그지 않고 읽습니다.
+        """
+        entries = self._apply_retention(self._read_all(version_id))
+        if section_name is not None:
+            entries = [entry for entry in entries if entry.get('section_name') == section_name]
+        return entries
+
+    def _compact_locked(self, version_id: str):
+        entries = self._apply_retention(self._read_all(version_id))
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(temp_path, self._path(version_id))
+        self._appends_since_compact[version_id] = 0
+
+    def compact(self, version_id: str):
+        """보관 정책에 맞지 않는 항목을 제거하도록 로그를 다시 씁니다."""
+        with self._locked(version_id):
+            self._compact_locked(version_id)
+
+    def delete(self, version_id: str):
+        """Cover Letter의 히스토리 로그와 잠금 파일을 삭제합니다."""
+        with self._locked(version_id):
+            self._appends_since_compact.pop(version_id, None)
+            for path in (self._path(version_id), self._lock_path(version_id)):
+                if os.path.exists(path):
+                    os.remove(path)
+        with self._locks_guard:
+            self._locks.pop(version_id, None)
@@ -0,0 +1,255 @@
+from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # fcntl이 없는 환경(Windows)에서는 프로세스 내 잠금만 사용
+    fcntl = None
+
+# Cover Letter / Job Posting 저장 백엔드 ('json': 기존 파일 레이아웃, 'sqlite': 단일 SQLite 데이터베이스)
+STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'json')
+# sqlite 백엔드가 사용하는 데이터베이스 파일 경로
+SQLITE_DB_PATH = os.getenv('SQLITE_DB_PATH', 'storage.sqlite3')
+
+STORAGE_BACKENDS = ('json', 'sqlite')
+
+_TABLE_NAME_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+class SQLiteDatabase:
+    """WAL 모드로 연 SQLite 연결 하나를 프로세스 안에서 재사용하는 클래스"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # 같은 연결을 여러 스레드가 쓰므로 모든 접근은 lock으로 직렬화
+        self.lock = threading.RLock()
+        self._depth = 0
+        # 트랜잭션은 transaction()에서 직접 시작하므로 자동 BEGIN을 끔
+        self.connection = sqlite3.connect(path, check_same_thread=False, timeout=30, isolation_level=None)
+        # WAL: 쓰는 동안에도 다른 프로세스가 읽을 수 있고, 커밋마다 전체 파일을 동기화하지 않음
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA busy_timeout=30000")
+
+    @contextmanager
+    def transaction(self):
+        """
+        쓰기 트랜잭션을 엽니다. BEGIN IMMEDIATE로 다른 워커 프로세스의 쓰기와 직렬화되며,
+        안쪽에서 다시 호출하면 바깥 트랜잭션에 합쳐집니다.
+        """
+        with self.lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self.connection
+                finally:
+                    self._depth -= 1
+                return
+            self.connection.execute("BEGIN IMMEDIATE")
+            self._depth = 1
+            try:
+                yield self.connection
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            else:
+                self.connection.execute("COMMIT")
+            finally:
+                self._depth = 0
+
+    def journal_mode(self) -> str:
+        """현재 저널 모드를 반환합니다."""
+        with self.lock:
+            return self.connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+# 프로세스별로 재사용하는 SQLite 연결 (fork된 자식 프로세스는 부모의 연결을 쓰지 않음)
+_sqlite_databases = {}
+_sqlite_databases_lock = threading.Lock()
+
+def get_sqlite_database(path: str = None) -> SQLiteDatabase:
+    """
+    경로별로 하나씩 만든 SQLite 데이터베이스 연결을 반환합니다.
+    """
+    key = (os.getpid(), os.path.abspath(path or SQLITE_DB_PATH))
+    with _sqlite_databases_lock:
+        database = _sqlite_databases.get(key)
+        if database is None or not os.path.exists(key[1]):
+            # 파일이 지워졌으면 이전 연결을 닫고 새로 만듦
+            if database is not None:
+                database.connection.close()
+            _sqlite_databases[key] = SQLiteDatabase(key[1])
+        return _sqlite_databases[key]
+
+
+class JsonDocumentBackend:
+    """문서 하나를 디렉토리의 {key}.json 파일 하나로 저장하는 백엔드 (기존 레이아웃)"""
+
+    name = 'json'
+
+    def __init__(self, directory: str, indent: int = None):
+        self.directory = directory
+        self.indent = indent
+        os.makedirs(directory, exist_ok=True)
+        self.lock_dir = os.path.join(directory, "locks")
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """문서를 읽습니다. 없으면 None을 반환합니다."""
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save(self, key: str, data: Dict[str, Any]):
+        """임시 파일에 쓴 뒤 이름을 바꿔 원자적으로 저장합니다."""
+        separators = None if self.indent else (',', ':')
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=self.indent, separators=separators)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def save_many(self, documents: Dict[str, Dict[str, Any]]):
+        """여러 문서를 저장합니다."""
+        for key, data in documents.items():
+            self.save(key, data)
+
+    def delete(self, key: str) -> bool:
+        """문서를 삭제하고 삭제 여부를 반환합니다."""
+        path = self._path(key)
+        if not os.path.exists(path):
+            return False
+        os.remove(path)
+        return True
+
+    def stamp(self, key: str):
+        """문서가 바뀌면 달라지는 값(수정 시각, 크기)을 반환합니다. 캐시 검증에 사용합니다."""
+        try:
+            stat = os.stat(self._path(key))
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def keys(self) -> List[str]:
+        """저장된 모든 문서 키를 반환합니다."""
+        return [f[:-5] for f in os.listdir(self.directory) if f.endswith('.json')]
+
+    @contextmanager
+    def lock(self, key: str):
+        """한 문서의 읽기-수정-쓰기 구간을 다른 스레드/프로세스와 겹치지 않게 잠급니다."""
+        with self._locks_guard:
+            thread_lock = self._locks.setdefault(key, threading.Lock())
+        with thread_lock:
+            if fcntl is None:
+                yield
+                return
+            os.makedirs(self.lock_dir, exist_ok=True)
+            with open(os.path.join(self.lock_dir, f"{key}.lock"), 'a') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class SQLiteDocumentBackend:
+    """문서를 SQLite 테이블의 JSON 행으로 저장하는 백엔드"""
+
+    name = 'sqlite'
+
+    def __init__(self, database: SQLiteDatabase, table: str):
+        if not _TABLE_NAME_PATTERN.match(table):
+            raise ValueError(f"잘못된 테이블 이름입니다: {table}")
+        self.database = database
+        self.table = table
+        with database.transaction() as conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, data TEXT NOT NULL)")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """문서를 읽습니다. 없으면 None을 반환합니다."""
+        with self.database.lock:
+            row = self.database.connection.execute(
+                f"SELECT data FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def save(self, key: str, data: Dict[str, Any]):
+        """문서를 추가하거나 갱신합니다."""
+        self.save_many({key: data})
+
+    def save_many(self, documents: Dict[str, Dict[str, Any]]):
+        """여러 문서를 한 트랜잭션으로 저장합니다."""
+        with self.database.transaction() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, data) VALUES (?, ?)",
+                [
+                    (key, json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+                    for key, data in documents.items()
+                ]
+            )
+
+    def delete(self, key: str) -> bool:
+        """문서를 삭제하고 삭제 여부를 반환합니다."""
+        with self.database.transaction() as conn:
+            return conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,)).rowcount > 0
+
+    def stamp(self, key: str):
+        """
+        다른 연결(다른 워커 프로세스)이 데이터베이스에 커밋하면 달라지는 값을 반환합니다.
+        이 연결에서의 쓰기로는 바뀌지 않으므로, 캐시 검증에 사용합니다.
+        """
+        with self.database.lock:
+            return self.database.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def keys(self) -> List[str]:
+        """저장된 모든 문서 키를 반환합니다."""
+        with self.database.lock:
+            return [row[0] for row in self.database.connection.execute(f"SELECT key FROM {self.table}")]
+
+    @contextmanager
+    def lock(self, key: str):
+        """
+        읽기-수정-쓰기 구간을 쓰기 트랜잭션으로 감쌉니다.
+        구간 안의 저장은 같은 트랜잭션에 합쳐져 한 번에 커밋되거나 모두 취소됩니다.
+        """
+        with self.database.transaction():
+            yield
+
+
+def resolve_storage_backend(name: str = None) -> str:
+    """
+    설정된 저장 백엔드 이름을 확인해 반환합니다.
+    """
+    name = (name or STORAGE_BACKEND).lower()
+    if name not in STORAGE_BACKENDS:
+        raise ValueError(f"지원하지 않는 저장 백엔드입니다: {name} (가능한 값: {', '.join(STORAGE_BACKENDS)})")
+    return name
+
+
+def create_document_backend(table: str, directory: str, backend: str = None, indent: int = None):
+    """
+    설정에 맞는 문서 백엔드를 만듭니다.
+    json이면 directory에 파일로, sqlite면 SQLITE_DB_PATH의 table에 저장합니다.
+    """
+    if resolve_storage_backend(backend) == 'sqlite':
+        return SQLiteDocumentBackend(get_sqlite_database(), table)
+    return JsonDocumentBackend(directory, indent=indent)
@@ -0,0 +1,61 @@
+import hashlib
+import numpy as np
+import pytest
+import embedding_service
+import generation_cache
+import job_analysis_store
+import vector_store as vector_store_module
+
+
+class FakeSentenceTransformer:
+    """단어 해싱 기반의 결정적 임베딩을 만드는 테스트용 모델"""
+    instances = 0
+    dimension = 64
+
+    def __init__(self, model_name):
+        FakeSentenceTransformer.instances += 1
+        self.model_name = model_name
+        self.encode_batches = []
+
+    def encode(self, texts):
+        self.encode_batches.append(list(texts))
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in text.lower().split():
+                bucket = int(hashlib.md5(token.encode('utf-8')).hexdigest(), 16) % self.dimension
+                vectors[row, bucket] += 1.0
+            vectors[row, 0] += 1e-3
+            vectors[row] /= np.linalg.norm(vectors[row])
+        return vectors
+
+    def get_sentence_embedding_dimension(self):
+        return self.dimension
+
+
+@pytest.fixture
+def fake_embedding_service(monkeypatch):
+    FakeSentenceTransformer.instances = 0
+    monkeypatch.setattr(embedding_service, "SentenceTransformer", FakeSentenceTransformer)
+    monkeypatch.setattr(embedding_service, "embedding_service", None)
+    return embedding_service.get_embedding_service()
+
+
+@pytest.fixture
+def temp_vector_store(fake_embedding_service, tmp_path, monkeypatch):
+    store = vector_store_module.VectorStore(persist_directory=str(tmp_path / "chroma_db"))
+    monkeypatch.setattr(vector_store_module, "vector_store", store)
+    return store
+
+
+@pytest.fixture(autouse=True)
+def isolated_generation_cache(tmp_path, monkeypatch):
+    cache = generation_cache.GenerationResultCache(directory=str(tmp_path / "generation_cache"), enabled=True)
+    monkeypatch.setattr(generation_cache, "generation_cache", cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_job_analysis_store(tmp_path, monkeypatch):
+    store = job_analysis_store.JobAnalysisStore(directory=str(tmp_path / "analyses"))
+    monkeypatch.setattr(job_analysis_store, "job_analysis_store", store)
+    return store
@@ -0,0 +1,81 @@
+import asyncio
+import time
+from batch_engine import BatchGenerationEngine
+from cover_letter_pipeline import CoverLetterPipeline
+from rate_limiter import RateLimiter
+
+
+class FakeRetrieval:
+    def __init__(self):
+        self.calls = []
+
+    def retrieve_context_for_cover_letter(self, job_title, company_name, user_question=None):
+        self.calls.append((job_title, company_name, user_question))
+        time.sleep(0.05)
+        return {
+            'job_postings': [],
+            'pdf_documents': [],
+            'summary': {'avg_job_similarity': 0, 'avg_pdf_similarity': 0}
+        }
+
+
+class FakeLLM:
+    async def agenerate_cover_letter(self, job_title, company_name, **kwargs):
+        await asyncio.sleep(0.1)
+        if company_name == "broken":
+            raise RuntimeError("upstream error")
+        return {'cover_letter': f"{job_title} @ {company_name}", 'status': 'success'}
+
+
+def make_pipeline():
+    pipeline = CoverLetterPipeline.__new__(CoverLetterPipeline)
+    pipeline.retrieval = FakeRetrieval()
+    pipeline.llm = FakeLLM()
+    return pipeline
+
+
+def test_batch_shares_retrieval_and_runs_concurrently():
+    pipeline = make_pipeline()
+    requests = [{'job_title': "dev", 'company_name': "acme"} for _ in range(4)]
+    requests.append({'job_title': "dev", 'company_name': "broken"})
+
+    start = time.perf_counter()
+    result = asyncio.run(pipeline.abatch_generate_cover_letters(requests, max_workers=5))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.4
+    assert sorted(pipeline.retrieval.calls) == [("dev", "acme", None), ("dev", "broken", None)]
+    assert result['shared_retrievals'] == 3
+    assert (result['successful'], result['failed']) == (4, 1)
+    assert [r['request_index'] for r in result['batch_results']] == list(range(5))
+
+
+def test_engine_reports_per_item_progress():
+    engine = BatchGenerationEngine(pipeline=make_pipeline(), max_workers=2)
+    requests = [{'job_title': "dev", 'company_name': name} for name in ("a", "b", "broken")]
+
+    async def scenario():
+        submitted = engine.submit(requests)
+        assert submitted['status'] == 'pending'
+        return await engine.wait(submitted['job_id'])
+
+    job = asyncio.run(scenario())
+
+    assert job['status'] == 'completed_with_errors'
+    assert (job['completed'], job['failed'], job['progress']) == (2, 1, 1.0)
+    assert [item['status'] for item in job['items']] == ['completed', 'completed', 'failed']
+    assert all(item['finished_at'] for item in job['items'])
+
+
+def test_rate_limiter_spaces_requests_beyond_burst():
+    limiter = RateLimiter(requests_per_minute=600, burst=2)
+
+    async def acquire_many():
+        await asyncio.gather(*[limiter.acquire() for _ in range(4)])
+
+    start = time.perf_counter()
+    asyncio.run(acquire_many())
+    elapsed = time.perf_counter() - start
+
+    assert 0.15 <= elapsed < 0.5
+    assert limiter.get_stats()['throttled'] == 2
@@ -0,0 +1,120 @@
+import json
+import fitz
+import pytest
+from bulk_import import BulkImporter, ImportState, run_import
+from job_posting_store import JobPostingStore
+
+
+def make_corpus(directory):
+    doc = fitz.open()
+    for i in range(2):
+        doc.new_page().insert_text((72, 72), f"resume page {i} python backend")
+    doc.save(str(directory / "resume.pdf"))
+    doc.close()
+    (directory / "notes").mkdir()
+    (directory / "notes" / "portfolio.txt").write_text("data pipelines\fkubernetes operations", encoding="utf-8")
+    (directory / "jobs.json").write_text(json.dumps([
+        {"jobTitle": "Backend Engineer", "companyName": "Acme", "jobDescription": "python apis"},
+        {"jobTitle": "Data Engineer", "companyName": "Initech", "jobDescription": "spark"}
+    ]), encoding="utf-8")
+    (directory / "broken.json").write_text("{not json", encoding="utf-8")
+
+
+@pytest.fixture
+def make_importer(tmp_path, temp_vector_store):
+    def factory(batch_size=256):
+        return BulkImporter(
+            vector_store=temp_vector_store,
+            job_posting_store=JobPostingStore(directory=str(tmp_path / "job_postings"), backend='json'),
+            state=ImportState(str(tmp_path / "state.sqlite3")),
+            batch_size=batch_size
+        )
+    return factory
+
+
+def test_bulk_import_stores_documents_and_job_postings_and_skips_imported_files(tmp_path, temp_vector_store, make_importer):
+    source = tmp_path / "data"
+    source.mkdir()
+    make_corpus(source)
+
+    stats = run_import(str(source), workers=1, importer=make_importer())
+
+    assert stats['found'] == 4
+    assert stats['files'] == 3
+    assert stats['documents'] == 4
+    assert stats['job_postings'] == 2
+    assert [item['path'] for item in stats['failed']] == [str(source / "broken.json")]
+    assert stats['docs_per_sec'] > 0
+    assert temp_vector_store.collections['pdf_documents'].count() == 4
+    assert temp_vector_store.collections['job_postings'].count() == 2
+
+    model = temp_vector_store.embedding_service.get_model()
+    model.encode_batches.clear()
+    again = run_import(str(source), workers=1, importer=make_importer())
+
+    assert again['skipped'] == 3
+    assert again['files'] == 0
+    assert model.encode_batches == []
+    assert temp_vector_store.collections['job_postings'].count() == 2
+
+
+def test_interrupted_import_resumes_from_the_failed_batch(tmp_path, temp_vector_store, make_importer, monkeypatch):
+    source = tmp_path / "data"
+    source.mkdir()
+    make_corpus(source)
+    importer = make_importer(batch_size=1)
+    original = temp_vector_store.add_pdf_documents
+
+    def interrupt(documents, embeddings=None):
+        raise KeyboardInterrupt
+
+    # 경로 순서: broken.json, jobs.json, notes/portfolio.txt, resume.pdf -> jobs.json 배치까지만 저장됨
+    monkeypatch.setattr(temp_vector_store, "add_pdf_documents", interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        run_import(str(source), workers=1, importer=importer)
+    monkeypatch.setattr(temp_vector_store, "add_pdf_documents", original)
+    assert temp_vector_store.collections['job_postings'].count() == 2
+
+    resumed = run_import(str(source), workers=1, importer=make_importer(batch_size=1))
+
+    assert resumed['skipped'] == 1
+    assert resumed['files'] == 2
+    assert temp_vector_store.collections['job_postings'].count() == 2
+    assert temp_vector_store.collections['pdf_documents'].count() == 4
+
+
+def test_documents_with_the_same_filename_in_different_directories_are_kept(tmp_path, temp_vector_store, make_importer):
+    source = tmp_path / "data"
+    for name in ("a", "b"):
+        (source / name).mkdir(parents=True)
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), f"resume of {name} python backend")
+        doc.save(str(source / name / "resume.pdf"))
+        doc.close()
+
+    stats = run_import(str(source), workers=1, importer=make_importer(batch_size=1))
+
+    assert stats['documents'] == 2
+    collection = temp_vector_store.collections['pdf_documents']
+    assert collection.count() == 2
+    assert sorted(collection.get()['metadatas'], key=lambda m: m['source_id'])[0]['source_id'] == "a/resume.pdf"
+
+    # a/resume.pdf만 바뀌면 a의 이전 청크만 교체
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "updated resume of a")
+    doc.save(str(source / "a" / "resume.pdf"))
+    doc.close()
+    run_import(str(source), workers=1, importer=make_importer(), restart=True)
+
+    assert sorted(collection.get(include=['documents'])['documents']) == [
+        "resume of b python backend", "updated resume of a"
+    ]
+
+
+def test_job_postings_imported_from_another_location_keep_their_ids(tmp_path, temp_vector_store, make_importer):
+    for checkout in ("checkout_a", "checkout_b"):
+        (tmp_path / checkout).mkdir()
+        make_corpus(tmp_path / checkout)
+        run_import(str(tmp_path / checkout), workers=1, importer=make_importer(), restart=True)
+
+    assert temp_vector_store.collections['job_postings'].count() == 2
@@ -0,0 +1,39 @@
+from chunking import TextChunker, split_sentences, estimate_token_count
+
+
+def test_split_sentences_keeps_sentence_boundaries():
+    text = "첫 번째 문장입니다. Second sentence!\n\n- bullet item"
+    assert split_sentences(text) == ["첫 번째 문장입니다.", "Second sentence!", "- bullet item"]
+
+
+def test_chunks_respect_token_limit_and_overlap():
+    sentences = [f"Sentence number {i} describes a project." for i in range(30)]
+    chunker = TextChunker(max_tokens=40, overlap_tokens=12)
+
+    chunks = chunker.chunk_text(" ".join(sentences))
+
+    assert len(chunks) > 1
+    assert all(chunk['token_count'] <= 40 for chunk in chunks)
+    # 인접한 청크는 앞 청크의 마지막 문장을 공유
+    for previous, current in zip(chunks, chunks[1:]):
+        last_sentence = split_sentences(previous['text'])[-1]
+        assert current['text'].startswith(last_sentence)
+
+
+def test_long_sentence_is_split_by_words():
+    chunker = TextChunker(max_tokens=10, overlap_tokens=2)
+    chunks = chunker.chunk_text(" ".join(["word"] * 35))
+    assert all(estimate_token_count(chunk['text']) <= 10 for chunk in chunks)
+
+
+def test_chunk_pages_keeps_parent_metadata():
+    chunker = TextChunker(max_tokens=20, overlap_tokens=4)
+    pages = ["Short first page.", "", " ".join(f"Line {i} of page three." for i in range(12))]
+
+    chunks = chunker.chunk_pages(pages, filename="resume.pdf")
+
+    assert {chunk['page_number'] for chunk in chunks} == {1, 3}
+    assert all(chunk['filename'] == "resume.pdf" and chunk['pages'] == 3 for chunk in chunks)
+    page_three = [chunk for chunk in chunks if chunk['page_number'] == 3]
+    assert [chunk['chunk_index'] for chunk in page_three] == list(range(len(page_three)))
+    assert all(chunk['chunk_count'] == len(page_three) for chunk in page_three)
@@ -0,0 +1,70 @@
+import json
+import time
+from cover_letter_cache import CoverLetterCache
+from cover_letter_models import CoverLetterManager, CoverLetterSection, CoverLetterVersion
+
+SECTIONS = ['header', 'introduction', 'body', 'conclusion', 'signature']
+
+
+def make_version(version_id="v1"):
+    return CoverLetterVersion(
+        version_id=version_id,
+        original_content="",
+        sections={name: CoverLetterSection(section_name=name, content="") for name in SECTIONS},
+        created_at="2025-08-01T09:00:00",
+        updated_at="2025-08-01T09:00:00",
+        job_title="Backend Engineer",
+        company_name="acme"
+    )
+
+
+def read_body_on_disk(tmp_path):
+    return json.loads((tmp_path / "v1.json").read_text(encoding='utf-8'))['sections']['body']['content']
+
+
+def test_repeated_loads_hit_cache_and_external_writes_invalidate(tmp_path):
+    manager = CoverLetterManager(storage_dir=str(tmp_path), cache=CoverLetterCache(max_entries=8, write_back_ms=0))
+    manager.save_cover_letter(make_version())
+
+    for _ in range(5):
+        manager.load_cover_letter("v1").sections['body'].content = "mutated by caller"
+    assert manager.load_cover_letter("v1").sections['body'].content == ""
+    assert manager.cache.get_stats()['hits'] == 6
+
+    # 다른 프로세스가 파일을 고쳐 쓴 경우
+    data = json.loads((tmp_path / "v1.json").read_text(encoding='utf-8'))
+    data['sections']['body']['content'] = "written elsewhere"
+    (tmp_path / "v1.json").write_text(json.dumps(data) + " ", encoding='utf-8')
+
+    assert manager.load_cover_letter("v1").sections['body'].content == "written elsewhere"
+    assert manager.cache.get_stats()['stale'] == 1
+
+
+def test_write_back_coalesces_section_edits_until_flush(tmp_path):
+    manager = CoverLetterManager(storage_dir=str(tmp_path), cache=CoverLetterCache(max_entries=8, write_back_ms=60000))
+    manager.save_cover_letter(make_version())
+
+    for i in range(20):
+        assert manager.update_section("v1", "body", f"draft {i}")
+
+    assert read_body_on_disk(tmp_path) == ""
+    assert manager.load_cover_letter("v1").sections['body'].content == "draft 19"
+    assert len(manager.get_section_history("v1", "body")) == 20
+
+    assert manager.flush() == 1
+    assert read_body_on_disk(tmp_path) == "draft 19"
+    stats = manager.cache.get_stats()
+    assert (stats['deferred_writes'], stats['flushes'], stats['dirty']) == (20, 1, 0)
+
+
+def test_write_back_timer_flushes_in_background(tmp_path):
+    manager = CoverLetterManager(storage_dir=str(tmp_path), cache=CoverLetterCache(max_entries=8, write_back_ms=20))
+    manager.save_cover_letter(make_version())
+
+    manager.update_section("v1", "body", "typed")
+
+    deadline = time.time() + 5
+    while read_body_on_disk(tmp_path) != "typed" and time.time() < deadline:
+        time.sleep(0.01)
+    assert read_body_on_disk(tmp_path) == "typed"
+    assert manager.cache.get_stats()['flushed_versions'] == 1
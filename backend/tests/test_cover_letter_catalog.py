@@ -0,0 +1,50 @@
+import os
+from cover_letter_models import CoverLetterManager, CoverLetterSection, CoverLetterVersion
+
+
+def make_version(i):
+    timestamp = f"2025-08-{i + 1:02d}T09:00:00"
+    return CoverLetterVersion(
+        version_id=f"v{i}",
+        original_content="intro\nbody",
+        sections={
+            'introduction': CoverLetterSection(section_name='introduction', content="intro"),
+            'body': CoverLetterSection(section_name='body', content="body")
+        },
+        created_at=timestamp,
+        updated_at=timestamp,
+        job_title="Backend Engineer",
+        company_name=f"company {i}"
+    )
+
+
+def test_catalog_pages_with_cursor_and_tracks_saves(tmp_path):
+    manager = CoverLetterManager(storage_dir=str(tmp_path))
+    for i in range(5):
+        manager.save_cover_letter(make_version(i))
+
+    first, cursor = manager.list_versions(limit=2)
+    second, cursor = manager.list_versions(limit=2, cursor=cursor)
+    third, cursor = manager.list_versions(limit=2, cursor=cursor)
+
+    assert [v['version_id'] for v in first + second + third] == ["v4", "v3", "v2", "v1", "v0"]
+    assert cursor is None
+
+    edited = make_version(1)
+    edited.sections['body'].is_edited = True
+    edited.updated_at = "2025-09-01T00:00:00"
+    manager.save_cover_letter(edited)
+    manager.delete_cover_letter("v4")
+
+    page, _ = manager.list_versions(limit=10)
+    assert [v['version_id'] for v in page] == ["v1", "v3", "v2", "v0"]
+    assert (page[0]['edited_sections'], page[0]['total_sections'], page[0]['has_edits']) == (1, 2, True)
+
+
+def test_existing_files_are_imported_into_new_catalog(tmp_path):
+    CoverLetterManager(storage_dir=str(tmp_path)).save_cover_letter(make_version(0))
+    os.remove(tmp_path / "catalog.sqlite3")
+
+    manager = CoverLetterManager(storage_dir=str(tmp_path))
+
+    assert manager.catalog.count() == 1
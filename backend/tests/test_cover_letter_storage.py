@@ -0,0 +1,71 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from fastapi.testclient import TestClient
+import main
+from cover_letter_models import CoverLetterConflictError, CoverLetterManager, CoverLetterSection, CoverLetterVersion
+
+SECTIONS = ['header', 'introduction', 'body', 'conclusion', 'signature']
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = CoverLetterManager(storage_dir=str(tmp_path))
+    manager.save_cover_letter(CoverLetterVersion(
+        version_id="v1",
+        original_content="",
+        sections={name: CoverLetterSection(section_name=name, content="") for name in SECTIONS},
+        created_at="2025-08-01T09:00:00",
+        updated_at="2025-08-01T09:00:00",
+        job_title="Backend Engineer",
+        company_name="acme"
+    ))
+    return manager
+
+
+def test_concurrent_section_updates_are_not_lost(manager, tmp_path):
+    edits = [(name, f"{name} edit {i}") for i in range(10) for name in SECTIONS]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(lambda edit: manager.update_section("v1", *edit), edits))
+
+    # 다른 섹션의 수정이 서로를 덮어쓰지 않고, 섹션마다 모든 수정이 히스토리에 남아야 함
+    sections = manager.load_cover_letter("v1").sections
+    for name in SECTIONS:
+        assert sections[name].content.startswith(f"{name} edit")
+        assert len(manager.get_section_history("v1", name)) == 10
+    assert not [f for f in os.listdir(tmp_path) if f.endswith('.tmp')]
+
+
+def test_stale_expected_updated_at_is_rejected(manager, monkeypatch):
+    monkeypatch.setattr(main, "cover_letter_manager", manager)
+    client = TestClient(main.app)
+
+    etag = client.get("/cover-letter/v1").headers['etag']
+    first = client.put("/cover-letter/v1/save-all", json={'version_id': "v1", 'sections': {'body': "tab A"}}, headers={'If-Match': etag})
+    second = client.put("/cover-letter/v1/save-all", json={'version_id': "v1", 'sections': {'body': "tab B"}}, headers={'If-Match': etag})
+
+    assert first.status_code == 200
+    assert second.status_code == 409
+    assert second.json()['detail']['current_updated_at'] == first.json()['updated_at']
+    assert manager.load_cover_letter("v1").sections['body'].content == "tab A"
+    with pytest.raises(CoverLetterConflictError):
+        manager.update_section("v1", 'body', "tab C", expected_updated_at="2025-08-01T09:00:00")
+
+
+def test_section_updates_return_the_new_etag(manager, monkeypatch):
+    monkeypatch.setattr(main, "cover_letter_manager", manager)
+    client = TestClient(main.app)
+
+    etag = client.get("/cover-letter/v1").headers['etag']
+    first = client.put("/cover-letter/v1/section", json={'version_id': "v1", 'section_name': 'body', 'new_content': "A"}, headers={'If-Match': etag})
+    # 응답의 ETag를 다음 요청의 If-Match로 그대로 사용
+    second = client.put("/cover-letter/v1/section", json={'version_id': "v1", 'section_name': 'body', 'new_content': "B"}, headers={'If-Match': first.headers['etag']})
+    stale = client.put("/cover-letter/v1/section", json={'version_id': "v1", 'section_name': 'body', 'new_content': "C"}, headers={'If-Match': first.headers['etag']})
+    saved = client.put("/cover-letter/v1/save-all", json={'version_id': "v1", 'sections': {'body': "D"}}, headers={'If-Match': second.headers['etag']})
+
+    assert first.headers['etag'] == f'"{first.json()["updated_at"]}"'
+    assert second.status_code == 200
+    assert stale.status_code == 409
+    assert saved.status_code == 200
+    assert saved.headers['etag'] == f'"{saved.json()["updated_at"]}"'
+    assert manager.load_cover_letter("v1").sections['body'].content == "D"
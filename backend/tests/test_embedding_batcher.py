@@ -0,0 +1,105 @@
+import threading
+import time
+import numpy as np
+import pytest
+from embedding_batcher import EmbeddingMicroBatcher
+
+
+class RecordingEncoder:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.batches = []
+
+    def __call__(self, texts):
+        self.batches.append(list(texts))
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        return np.array([[float(text.split()[-1]), len(text)] for text in texts], dtype=np.float32)
+
+
+def encode_concurrently(batcher, requests):
+    barrier = threading.Barrier(len(requests))
+    results = [None] * len(requests)
+
+    def call(i):
+        barrier.wait()
+        try:
+            results[i] = batcher.encode(requests[i])
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(requests))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_requests_are_merged_and_results_scattered_back():
+    encoder = RecordingEncoder(delay=0.01)
+    batcher = EmbeddingMicroBatcher(encoder, max_batch_size=64, max_wait_ms=20)
+    requests = [[f"query {i}"] if i % 2 else [f"query {i}", f"more {i}"] for i in range(12)]
+
+    results = encode_concurrently(batcher, requests)
+
+    assert len(encoder.batches) < len(requests)
+    for texts, embeddings in zip(requests, results):
+        assert embeddings.shape == (len(texts), 2)
+        assert embeddings[:, 0].tolist() == [float(text.split()[-1]) for text in texts]
+    stats = batcher.get_stats()
+    assert stats['requests'] == 12
+    assert stats['batched_texts'] == 18
+
+
+def test_batches_respect_max_size_and_large_requests_bypass_the_queue():
+    encoder = RecordingEncoder(delay=0.01)
+    batcher = EmbeddingMicroBatcher(encoder, max_batch_size=4, max_wait_ms=20)
+
+    encode_concurrently(batcher, [[f"q {i}"] for i in range(10)])
+    assert max(len(batch) for batch in encoder.batches) <= 4
+    assert sorted(text for batch in encoder.batches for text in batch) == sorted(f"q {i}" for i in range(10))
+
+    encoder.batches.clear()
+    embeddings = batcher.encode([f"doc {i}" for i in range(6)])
+    assert encoder.batches == [[f"doc {i}" for i in range(6)]]
+    assert embeddings.shape == (6, 2)
+    assert batcher.get_stats()['direct_requests'] == 1
+
+
+def test_encode_errors_reach_every_caller_in_the_batch():
+    batcher = EmbeddingMicroBatcher(RecordingEncoder(fail=True), max_batch_size=8, max_wait_ms=20)
+
+    results = encode_concurrently(batcher, [["q 1"], ["q 2"], ["q 3"]])
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    with pytest.raises(RuntimeError):
+        batcher.encode(["q 4"])
+
+
+def test_pending_requests_fail_over_when_the_dispatcher_dies(monkeypatch):
+    encoder = RecordingEncoder()
+    batcher = EmbeddingMicroBatcher(encoder, max_batch_size=8, max_wait_ms=20)
+    original_take_batch = batcher._take_batch
+    crashes = []
+
+    def crashing_take_batch():
+        batch = original_take_batch()
+        if not crashes:
+            crashes.append(len(batch))
+            raise MemoryError("dispatcher crashed")
+        return batch
+
+    monkeypatch.setattr(batcher, "_take_batch", crashing_take_batch)
+
+    # 배치 스레드가 죽어도 대기 중이던 요청은 직접 인코딩으로 끝나고, 다음 요청은 새 스레드가 처리
+    results = encode_concurrently(batcher, [["q 1"], ["q 2"], ["q 3"]])
+    assert [result[:, 0].tolist() for result in results] == [[1.0], [2.0], [3.0]]
+    assert batcher.encode(["q 4"])[:, 0].tolist() == [4.0]
+
+    stats = batcher.get_stats()
+    assert stats['dispatcher_failures'] == 1
+    assert stats['fallback_requests'] == crashes[0]
+    assert stats['batches'] >= 1
@@ -0,0 +1,27 @@
+from embedding_service import EmbeddingService, get_embedding_service
+from tests.conftest import FakeSentenceTransformer
+
+
+def test_model_loaded_once_per_process(fake_embedding_service):
+    service = get_embedding_service()
+    assert service is fake_embedding_service
+    assert not service.is_loaded()
+
+    service.encode(["a"])
+    service.encode(["bb", "ccc"])
+
+    assert FakeSentenceTransformer.instances == 1
+    assert service.get_dimension() == FakeSentenceTransformer.dimension
+
+
+def test_stats_report_load_time_and_memory(fake_embedding_service):
+    service = EmbeddingService(model_name="fake-model")
+    service.encode(["hello"])
+
+    stats = service.get_stats()
+    assert stats["model_name"] == "fake-model"
+    assert stats["loaded"] is True
+    assert stats["load_time_seconds"] is not None
+    assert stats["resident_memory_mb"] is not None
+    assert stats["encode_calls"] == 1
+    assert stats["encoded_texts"] == 1
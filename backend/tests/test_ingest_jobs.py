@@ -0,0 +1,122 @@
+import hashlib
+import fitz
+import ingestion
+from ingest_jobs import IngestJobQueue, IngestJobStore, run_pdf_ingest_job
+
+
+def make_queue(tmp_path, workers=2):
+    return IngestJobQueue(store=IngestJobStore(str(tmp_path / "jobs.sqlite3")), workers=workers)
+
+
+def test_jobs_run_in_background_and_record_progress(tmp_path):
+    queue = make_queue(tmp_path)
+
+    def handler(payload, report_progress):
+        if payload.get('fail'):
+            raise ValueError("broken file")
+        report_progress(pages_processed=payload['pages'], page_count=payload['pages'])
+        return {'documents': payload['pages'] * 2}
+
+    queue.register('fake', handler)
+    try:
+        ok = queue.submit('fake', 'a.pdf', {'pages': 3})
+        broken = queue.submit('fake', 'b.pdf', {'fail': True})
+        assert ok['status'] == 'queued'
+
+        done = queue.wait(ok['id'])
+        failed = queue.wait(broken['id'])
+    finally:
+        queue.stop()
+
+    assert done['status'] == 'completed'
+    assert done['progress'] == {'pages_processed': 3, 'page_count': 3}
+    assert done['result'] == {'documents': 6}
+    assert failed['status'] == 'failed'
+    assert failed['error'] == "broken file"
+    assert queue.get_stats()['completed'] == 1
+
+
+def test_unfinished_jobs_resume_after_restart(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    store = IngestJobStore(path)
+    interrupted = store.create('fake', 'a.pdf', {'value': 1})
+    # 실행 중에 종료되어 임대가 만료된 작업
+    store.claim(interrupted['id'], 'crashed-worker', lease_seconds=-1)
+    waiting = store.create('fake', 'b.pdf', {'value': 2})
+
+    queue = IngestJobQueue(store=IngestJobStore(path), workers=1)
+    queue.register('fake', lambda payload, report_progress: {'value': payload['value']})
+    try:
+        assert queue.start() == 2
+        results = [queue.wait(job['id']) for job in (interrupted, waiting)]
+    finally:
+        queue.stop()
+
+    assert [job['status'] for job in results] == ['completed', 'completed']
+    assert results[0]['attempts'] == 2
+    assert [job['result'] for job in results] == [{'value': 1}, {'value': 2}]
+
+
+def test_running_job_is_reclaimed_only_after_its_lease_expires(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    store = IngestJobStore(path)
+    job = store.create('fake', 'a.pdf', {'value': 1})
+    assert store.claim(job['id'], 'other-worker', lease_seconds=0.3)
+    assert not store.claim(job['id'], 'another-worker')
+
+    # 다른 서버 프로세스가 시작해도 임대가 남아 있는 작업은 다시 실행하지 않음
+    queue = IngestJobQueue(store=IngestJobStore(path), workers=1, lease_seconds=0.3)
+    queue.register('fake', lambda payload, report_progress: {'value': payload['value']})
+    try:
+        assert queue.start() == 0
+        assert store.get(job['id'])['status'] == 'running'
+
+        # 원래 워커가 임대를 연장하지 못하면 다음 임대 확인 때 가져가서 실행
+        done = queue.wait(job['id'], timeout=5)
+    finally:
+        queue.stop()
+
+    assert done['status'] == 'completed'
+    assert done['owner'] == queue.worker_id
+    assert done['attempts'] == 2
+    # 임대를 잃은 원래 워커는 결과를 덮어쓰지 못함
+    assert not store.update(job['id'], owner='other-worker', status='failed', error="late")
+    assert store.get(job['id'])['status'] == 'completed'
+
+
+def test_pdf_job_reports_per_page_progress_and_removes_spooled_file(tmp_path, temp_vector_store, monkeypatch):
+    monkeypatch.setattr(ingestion, "pdf_ingestion_pipeline", None)
+    path = tmp_path / "resume.pdf"
+    doc = fitz.open()
+    for i in range(3):
+        doc.new_page().insert_text((72, 72), f"page {i} python backend")
+    doc.save(str(path))
+    doc.close()
+
+    queue = make_queue(tmp_path, workers=1)
+    queue.register('pdf', run_pdf_ingest_job)
+    pages_processed = []
+    original_update = queue.store.update
+
+    def recording_update(job_id, **fields):
+        if 'progress' in fields:
+            pages_processed.append(fields['progress'].get('pages_processed'))
+        return original_update(job_id, **fields)
+
+    monkeypatch.setattr(queue.store, "update", recording_update)
+    try:
+        job = queue.submit('pdf', 'resume.pdf', {
+            'path': str(path),
+            'filename': 'resume.pdf',
+            'sha256': hashlib.sha256(path.read_bytes()).hexdigest()
+        })
+        done = queue.wait(job['id'])
+    finally:
+        queue.stop()
+
+    assert done['status'] == 'completed'
+    assert done['result']['documents'] == 3
+    assert done['progress']['pages_indexed'] == 3
+    assert sorted(set(pages_processed)) == [0, 1, 2, 3]
+    assert temp_vector_store.collections['pdf_documents'].count() == 3
+    assert not path.exists()
@@ -0,0 +1,135 @@
+import pytest
+import ingestion
+from ingestion import PDFIngestionPipeline
+from chunking import TextChunker
+
+
+@pytest.fixture
+def pipeline(temp_vector_store, monkeypatch):
+    monkeypatch.setattr(ingestion, "pdf_ingestion_pipeline", None)
+    return PDFIngestionPipeline()
+
+
+def test_pages_encoded_once_and_stored(pipeline, temp_vector_store):
+    pages = ["python backend developer", "", "machine learning projects"]
+
+    result = pipeline.ingest("resume.pdf", pages)
+
+    model = pipeline.embedding_service.get_model()
+    assert model.encode_batches == [["python backend developer", "machine learning projects"]]
+    assert len(set(result['vector_ids'])) == 2
+    assert result['embedding_dimension'] == model.dimension
+    assert temp_vector_store.collections['pdf_documents'].count() == 2
+
+
+def test_reingesting_unchanged_content_is_a_noop(pipeline, temp_vector_store):
+    pages = ["python backend developer", "machine learning projects"]
+    first = pipeline.ingest("resume.pdf", pages)
+    model = pipeline.embedding_service.get_model()
+    encode_calls = len(model.encode_batches)
+
+    second = pipeline.ingest("resume.pdf", pages)
+
+    assert second['status'] == 'unchanged'
+    assert second['vector_ids'] == first['vector_ids']
+    assert len(second['embeddings']) == len(first['embeddings'])
+    assert len(model.encode_batches) == encode_calls
+    assert temp_vector_store.collections['pdf_documents'].count() == 2
+
+
+def test_changed_document_only_encodes_changed_chunks(pipeline, temp_vector_store):
+    pipeline.ingest("resume.pdf", ["python backend developer", "machine learning projects"], source_id="user-1")
+    model = pipeline.embedding_service.get_model()
+    model.encode_batches.clear()
+
+    result = pipeline.ingest(
+        "resume.pdf", ["python backend developer", "data engineering projects"], source_id="user-1"
+    )
+
+    assert result['status'] == 'updated'
+    assert model.encode_batches == [["data engineering projects"]]
+    assert result['reused_chunks'] == 1
+    assert result['removed_chunks'] == 2
+    assert temp_vector_store.collections['pdf_documents'].count() == 2
+
+
+def test_documents_sharing_a_filename_do_not_replace_each_other(pipeline, temp_vector_store):
+    collection = temp_vector_store.collections['pdf_documents']
+    pipeline.ingest("resume.pdf", ["alice python developer"], source_id="alice")
+    pipeline.ingest("resume.pdf", ["bob data engineer"], source_id="bob")
+    pipeline.ingest("resume.pdf", ["carol designer"])
+
+    updated = pipeline.ingest("resume.pdf", ["alice senior python developer"], source_id="alice")
+
+    assert updated['status'] == 'updated'
+    assert updated['removed_chunks'] == 1
+    assert sorted(collection.get(include=['documents'])['documents']) == [
+        "alice senior python developer", "bob data engineer", "carol designer"
+    ]
+
+
+def test_stream_ingestion_indexes_each_micro_batch_before_the_next_page(pipeline, temp_vector_store):
+    pages = [(1, "python backend developer"), (2, ""), (3, "machine learning projects"), (4, "data pipelines")]
+    collection = temp_vector_store.collections['pdf_documents']
+    progress = []
+
+    def page_generator():
+        for page_number, text in pages:
+            # 앞 배치의 페이지는 다음 페이지를 추출하기 전에 이미 검색 가능해야 함
+            progress.append(('page', page_number, collection.count()))
+            yield page_number, text
+
+    result = pipeline.ingest_stream(
+        "resume.pdf", page_generator(), "a" * 64, len(pages), batch_size=2,
+        on_progress=lambda stats: progress.append(('batch', stats['pages'], collection.count()))
+    )
+
+    model = pipeline.embedding_service.get_model()
+    assert model.encode_batches == [
+        ["python backend developer", "machine learning projects"],
+        ["data pipelines"]
+    ]
+    assert ('page', 4, 2) in progress
+    assert result['status'] == 'created'
+    assert result['batches'] == 2
+    assert collection.count() == 3
+
+    again = pipeline.ingest_stream("resume.pdf", iter(pages), "a" * 64, len(pages), batch_size=2)
+    assert again['status'] == 'unchanged'
+    assert len(model.encode_batches) == 2
+
+
+def test_upload_and_stream_ingestion_share_document_ids(pipeline, temp_vector_store):
+    pages = ["python backend developer", "machine learning projects"]
+    file_digest = "b" * 64
+
+    uploaded = pipeline.ingest("resume.pdf", pages, source_id="alice", file_digest=file_digest)
+    streamed = pipeline.ingest_stream(
+        "resume.pdf", enumerate(pages, start=1), file_digest, len(pages), source_id="alice"
+    )
+
+    assert streamed['vector_ids'] == uploaded['vector_ids']
+    assert streamed['status'] == 'unchanged'
+    assert temp_vector_store.collections['pdf_documents'].count() == 2
+
+
+def test_changed_chunker_settings_rewrite_chunks_of_the_same_file(temp_vector_store, monkeypatch):
+    monkeypatch.setattr(ingestion, "pdf_ingestion_pipeline", None)
+    collection = temp_vector_store.collections['pdf_documents']
+    pages = ["python backend developer. machine learning projects. data pipelines on kubernetes."]
+    small = PDFIngestionPipeline(chunker=TextChunker(max_tokens=4, overlap_tokens=0, token_counter=lambda text: len(text.split())))
+    large = PDFIngestionPipeline(chunker=TextChunker(max_tokens=64, overlap_tokens=0, token_counter=lambda text: len(text.split())))
+
+    for source_id in (None, "alice"):
+        before = small.ingest("resume.pdf", pages, source_id=source_id)
+        assert len(before['vector_ids']) > 1
+
+        # 첫 청크 ID는 같지만 내용이 달라졌으므로 unchanged가 아니고, 줄어든 청크는 지워져야 함
+        after = large.ingest("resume.pdf", pages, source_id=source_id)
+        assert after['status'] == 'updated'
+        assert after['vector_ids'] == before['vector_ids'][:1]
+        assert after['removed_chunks'] == len(before['vector_ids']) - 1
+        stored = collection.get(ids=after['vector_ids'], include=['documents'])['documents']
+        assert stored == [after['documents'][0]['text']]
+
+    assert collection.count() == 2
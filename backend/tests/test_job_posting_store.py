@@ -0,0 +1,39 @@
+import json
+from job_posting_store import JobPostingStore
+
+
+def make_posting(i, company):
+    return {
+        'id': f"job_{i:03d}",
+        'jobTitle': "Backend Engineer" if i % 2 else "Data Engineer",
+        'companyName': company,
+        'createdAt': f"2025-08-{i + 1:02d}T10:00:00",
+        'status': 'active'
+    }
+
+
+def test_existing_json_files_are_imported_in_one_pass(tmp_path):
+    for i in range(3):
+        (tmp_path / f"job_{i:03d}.json").write_text(json.dumps(make_posting(i, "acme")), encoding='utf-8')
+    (tmp_path / "broken.json").write_text("{", encoding='utf-8')
+
+    store = JobPostingStore(directory=str(tmp_path))
+
+    assert store.count() == 3
+    assert store.get("job_001")['jobTitle'] == "Backend Engineer"
+    assert store.get("missing") is None
+
+
+def test_list_paginates_filters_and_sorts(tmp_path):
+    store = JobPostingStore(directory=str(tmp_path))
+    for i in range(10):
+        store.save(make_posting(i, "카카오뱅크" if i < 4 else "Toss"))
+
+    page, total = store.list(offset=2, limit=3)
+    assert total == 10
+    assert [p['id'] for p in page] == ["job_007", "job_006", "job_005"]
+
+    page, total = store.list(company="카카오", title="backend", sort='asc')
+    assert total == 2
+    assert [p['id'] for p in page] == ["job_001", "job_003"]
+    assert (tmp_path / "job_003.json").exists()
@@ -0,0 +1,143 @@
+import asyncio
+import time
+from types import SimpleNamespace
+import pytest
+from llm_integration import LLMIntegration
+
+
+class FakeCompletions:
+    def __init__(self, delay=0.2, fail_temperatures=(), hang_temperatures=()):
+        self.delay = delay
+        self.fail_temperatures = fail_temperatures
+        self.hang_temperatures = hang_temperatures
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        temperature = round(kwargs['temperature'], 1)
+        if temperature in self.hang_temperatures:
+            await asyncio.sleep(10)
+        await asyncio.sleep(self.delay)
+        if temperature in self.fail_temperatures:
+            raise RuntimeError("rate limited")
+        message = SimpleNamespace(content=f"letter at {temperature}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    return LLMIntegration()
+
+
+def use_fake_client(llm, completions):
+    llm.async_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+def generate(llm, num_variations=3):
+    return asyncio.run(llm.agenerate_cover_letter_variations(
+        job_title="dev", company_name="acme", job_description="build things", num_variations=num_variations
+    ))
+
+
+def test_variations_run_concurrently_with_shared_prompt(llm):
+    completions = FakeCompletions(delay=0.2)
+    use_fake_client(llm, completions)
+
+    start = time.perf_counter()
+    result = generate(llm)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert [v['version'] for v in result['variations']] == [1, 2, 3]
+    user_prompts = {call['messages'][1]['content'] for call in completions.calls}
+    assert len(user_prompts) == 1
+
+
+def test_concurrency_cap_is_respected(llm):
+    llm.variation_concurrency = 1
+    use_fake_client(llm, FakeCompletions(delay=0.1))
+
+    start = time.perf_counter()
+    generate(llm)
+
+    assert time.perf_counter() - start >= 0.3
+
+
+def test_failed_and_timed_out_variations_keep_successful_ones(llm):
+    llm.variation_timeout = 0.5
+    use_fake_client(llm, FakeCompletions(delay=0.05, fail_temperatures=(0.8,), hang_temperatures=(0.9,)))
+
+    result = generate(llm)
+
+    assert result['status'] == 'partial'
+    assert [v['version'] for v in result['variations']] == [1]
+    assert {f['version'] for f in result['failed_variations']} == {2, 3}
+
+
+def test_identical_generation_is_served_from_cache(llm, isolated_generation_cache):
+    completions = FakeCompletions(delay=0)
+    use_fake_client(llm, completions)
+
+    def run(cache_mode=None):
+        return asyncio.run(llm.agenerate_cover_letter(
+            job_title="dev", company_name="acme", job_description="build things", cache_mode=cache_mode
+        ))
+
+    first, second, bypassed = run(), run(), run(cache_mode='bypass')
+
+    assert [r['generation_info']['cache'] for r in (first, second, bypassed)] == ['miss', 'hit', 'bypass']
+    assert second['cover_letter'] == first['cover_letter']
+    assert len(completions.calls) == 2
+    stats = isolated_generation_cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['bypasses'], stats['entries']) == (1, 1, 1, 1)
+
+
+def test_generation_cache_evicts_least_recently_used(tmp_path):
+    from generation_cache import GenerationResultCache
+
+    cache = GenerationResultCache(directory=str(tmp_path), max_bytes=250, enabled=True)
+    for key in ("a", "b", "c"):
+        cache.put(key, {'response_content': key * 40})
+        cache.get("a")
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get_stats()['evictions'] == 1
+
+
+def test_generation_cache_is_shared_through_the_directory(tmp_path, monkeypatch):
+    from generation_cache import GenerationResultCache
+
+    monkeypatch.delenv("GENERATION_CACHE_ENABLED", raising=False)
+    assert GenerationResultCache(directory=str(tmp_path / "default")).enabled is False
+
+    # 두 워커 프로세스가 같은 디렉토리를 쓰는 상황
+    first = GenerationResultCache(directory=str(tmp_path / "shared"), max_bytes=10_000, enabled=True)
+    second = GenerationResultCache(directory=str(tmp_path / "shared"), max_bytes=10_000, enabled=True)
+    first.put("a", {'response_content': "from first"})
+
+    assert second.get("a")['response_content'] == "from first"
+    assert second.get_stats()['entries'] == 1
+    assert second.get_stats()['size_bytes'] == first.get_stats()['size_bytes'] > 0
+
+
+def test_job_analysis_is_reused_until_posting_text_changes(llm, isolated_job_analysis_store):
+    class AnalysisCompletions:
+        calls = 0
+
+        async def create(self, **kwargs):
+            AnalysisCompletions.calls += 1
+            message = SimpleNamespace(content='{"skills": ["python"]}')
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    use_fake_client(llm, AnalysisCompletions())
+
+    first = asyncio.run(llm.aanalyze_job_posting("Backend engineer, Python"))
+    second = asyncio.run(llm.aanalyze_job_posting("Backend engineer, Python"))
+    changed = asyncio.run(llm.aanalyze_job_posting("Backend engineer, Python and Go"))
+
+    assert (first['cached'], second['cached'], changed['cached']) == (False, True, False)
+    assert second['analysis'] == {'skills': ['python']}
+    assert second['content_hash'] == first['content_hash'] != changed['content_hash']
+    assert AnalysisCompletions.calls == 2
@@ -1,5 +1,10 @@
+import asyncio
+import time
+import fitz
+import httpx
 import pytest
 from fastapi.testclient import TestClient
+import main
 from main import app
 
 client = TestClient(app)
@@ -12,4 +17,156 @@ def test_read_root():
 def test_health_check():
     response = client.get("/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "healthy"} 
\ No newline at end of file
+    assert response.json() == {"status": "healthy"} 
+
+
+def test_health_responds_while_generation_is_in_flight(monkeypatch):
+    class SlowPipeline:
+        async def agenerate_cover_letter(self, **kwargs):
+            # 블로킹 검색(스레드 풀) + 느린 LLM 호출(비동기)을 흉내냄
+            await main.run_blocking(time.sleep, 0.3)
+            await asyncio.sleep(0.3)
+            return {'cover_letter': 'done', 'status': 'success'}
+
+    monkeypatch.setattr(main, "get_cover_letter_pipeline", lambda: SlowPipeline())
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            start = time.perf_counter()
+            generation = asyncio.create_task(async_client.post(
+                "/api/generate-cover-letter", json={'job_title': 'dev', 'company_name': 'acme'}
+            ))
+            await asyncio.sleep(0.05)
+            health = await async_client.get("/health")
+            health_latency = time.perf_counter() - start
+            response = await generation
+            return health, health_latency, response
+
+    health, health_latency, response = asyncio.run(scenario())
+
+    assert health.status_code == 200
+    assert health_latency < 0.3
+    assert response.json()['cover_letter'] == 'done'
+
+
+def test_stream_cover_letter_sends_metadata_tokens_and_done(monkeypatch):
+    from types import SimpleNamespace
+    from cover_letter_pipeline import CoverLetterPipeline
+    from llm_integration import LLMIntegration
+
+    class FakeRetrieval:
+        def retrieve_context_for_cover_letter(self, job_title, company_name, user_question=None):
+            return {
+                'job_postings': [],
+                'pdf_documents': [{'id': 'pdf_1', 'content': 'resume', 'similarity_score': 0.8, 'metadata': {'page_number': 1}}],
+                'summary': {'avg_job_similarity': 0, 'avg_pdf_similarity': 0.8}
+            }
+
+    class FakeStream:
+        def __init__(self, deltas):
+            self.deltas = iter(deltas)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                delta = next(self.deltas)
+            except StopIteration:
+                raise StopAsyncIteration
+            return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+    class FakeCompletions:
+        async def create(self, **kwargs):
+            assert kwargs['stream'] is True
+            return FakeStream(["Dear ", "team,", None, "\nthanks"])
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    pipeline = CoverLetterPipeline.__new__(CoverLetterPipeline)
+    pipeline.retrieval = FakeRetrieval()
+    pipeline.llm = LLMIntegration()
+    pipeline.llm.async_client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    monkeypatch.setattr(main, "get_cover_letter_pipeline", lambda: pipeline)
+
+    response = client.post("/api/generate-cover-letter/stream", json={'job_title': 'dev', 'company_name': 'acme'})
+
+    assert response.headers['content-type'].startswith("text/event-stream")
+    events = [block.split("\n", 1) for block in response.text.strip().split("\n\n")]
+    names = [name.removeprefix("event: ") for name, _ in events]
+    assert names == ['metadata', 'token', 'token', 'token', 'done']
+    metadata = main.json.loads(events[0][1].removeprefix("data: "))
+    assert metadata['pdf_documents'][0]['id'] == 'pdf_1'
+    done = main.json.loads(events[-1][1].removeprefix("data: "))
+    assert done['cover_letter'] == "Dear team,\nthanks"
+    assert done['context_info']['pdf_documents_found'] == 1
+    assert done['pipeline_info']['streaming_timings']['first_token_ms'] is not None
+    assert done['generation_info']['cache'] == 'miss'
+
+    # 같은 요청은 캐시된 응답을 한 번에 보내고, 일반 생성 엔드포인트와 같은 cache 상태를 알림
+    again = client.post("/api/generate-cover-letter/stream", json={'job_title': 'dev', 'company_name': 'acme'})
+    cached = main.json.loads(again.text.strip().split("\n\n")[-1].split("\n", 1)[1].removeprefix("data: "))
+    assert cached['cover_letter'] == "Dear team,\nthanks"
+    assert cached['generation_info']['cache'] == 'hit'
+    assert set(cached) >= {'generation_info', 'context_info', 'pipeline_info', 'status'}
+
+
+def test_job_postings_list_reports_next_offset(monkeypatch, tmp_path):
+    from job_posting_store import JobPostingStore
+
+    store = JobPostingStore(directory=str(tmp_path), backend='json')
+    for i in range(5):
+        store.save({'id': f"job_{i}", 'jobTitle': f"Engineer {i}", 'companyName': "acme", 'createdAt': f"2024-01-0{i + 1}"})
+    monkeypatch.setattr(main, "get_job_posting_store", lambda: store)
+
+    pages = []
+    offset = 0
+    while offset is not None:
+        body = client.get("/job-postings", params={'offset': offset, 'limit': 2}).json()
+        pages.append([posting['id'] for posting in body['job_postings']])
+        assert body['total'] == 5
+        offset = body['next_offset']
+
+    assert pages == [['job_4', 'job_3'], ['job_2', 'job_1'], ['job_0']]
+
+
+def make_pdf_bytes(pages):
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_reuploading_an_edited_resume_replaces_its_old_chunks(temp_vector_store, monkeypatch):
+    import ingestion
+
+    monkeypatch.setattr(ingestion, "pdf_ingestion_pipeline", None)
+    collection = temp_vector_store.collections['pdf_documents']
+    headers = {'X-Client-Id': "browser-1"}
+
+    first = client.post(
+        "/api/upload-pdf",
+        files={'file': ("resume.pdf", make_pdf_bytes(["python backend developer", "machine learning"]), "application/pdf")},
+        headers=headers
+    )
+    assert first.status_code == 200
+    old_ids = first.json()['vector_ids']
+    # 다른 브라우저의 같은 이름 파일은 교체 대상이 아님
+    client.post(
+        "/api/upload-pdf",
+        files={'file': ("resume.pdf", make_pdf_bytes(["designer portfolio"]), "application/pdf")},
+        headers={'X-Client-Id': "browser-2"}
+    )
+
+    edited = client.post(
+        "/api/upload-pdf/stream",
+        files={'file': ("resume.pdf", make_pdf_bytes(["senior python backend developer"]), "application/pdf")},
+        headers=headers
+    )
+
+    assert edited.status_code == 200
+    assert edited.json()['source_id'] == "browser-1/resume.pdf"
+    assert collection.get(ids=old_ids, include=[])['ids'] == []
+    assert collection.count() == len(edited.json()['vector_ids']) + 1
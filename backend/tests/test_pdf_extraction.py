@@ -0,0 +1,76 @@
+import fitz
+import pdf_extraction
+from pdf_extraction import extract_pdf_pages, shutdown_pdf_process_pool, split_page_ranges
+
+
+def make_pdf(path, pages, blank_pages=()):
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        if i not in blank_pages:
+            page.insert_text((72, 72), f"page {i} text")
+    doc.save(str(path))
+    doc.close()
+
+
+def test_split_page_ranges_covers_every_page_in_order():
+    ranges = split_page_ranges(100, workers=4)
+
+    assert ranges[0][0] == 0 and ranges[-1][1] == 100
+    assert all(previous[1] == current[0] for previous, current in zip(ranges, ranges[1:]))
+    assert len(ranges) == 8
+
+
+def test_only_empty_pages_fall_back_to_pdfplumber(tmp_path, monkeypatch):
+    path = tmp_path / "scanned.pdf"
+    make_pdf(path, 6, blank_pages=(1, 4))
+    requested = []
+
+    def fake_pdfplumber_pages(file_path, page_numbers):
+        requested.extend(page_numbers)
+        return [f"ocr {page_number}" for page_number in page_numbers]
+
+    monkeypatch.setattr(pdf_extraction, "_extract_pdfplumber_pages", fake_pdfplumber_pages)
+
+    pages = extract_pdf_pages(str(path), workers=1)
+
+    assert requested == [1, 4]
+    assert pages == ["page 0 text", "ocr 1", "page 2 text", "page 3 text", "ocr 4", "page 5 text"]
+
+
+def test_large_pdf_is_extracted_in_process_pool_in_page_order(tmp_path):
+    path = tmp_path / "portfolio.pdf"
+    make_pdf(path, 40, blank_pages=(7,))
+    try:
+        pages = extract_pdf_pages(str(path), workers=2, min_parallel_pages=16)
+    finally:
+        shutdown_pdf_process_pool()
+
+    assert len(pages) == 40
+    assert pages[7] == ""
+    assert [text for i, text in enumerate(pages) if i != 7] == [f"page {i} text" for i in range(40) if i != 7]
+
+
+def test_broken_process_pool_is_rebuilt_and_retried(tmp_path, monkeypatch):
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    path = tmp_path / "portfolio.pdf"
+    make_pdf(path, 20)
+
+    # 워커가 죽어 BrokenProcessPool 상태가 된 풀
+    broken = ProcessPoolExecutor(max_workers=1)
+    try:
+        broken.submit(os._exit, 1).result()
+    except BrokenProcessPool:
+        pass
+    monkeypatch.setattr(pdf_extraction, "pdf_process_pool", broken)
+
+    try:
+        pages = extract_pdf_pages(str(path), workers=2, min_parallel_pages=16)
+        assert pdf_extraction.pdf_process_pool is not broken
+    finally:
+        shutdown_pdf_process_pool()
+
+    assert pages == [f"page {i} text" for i in range(20)]
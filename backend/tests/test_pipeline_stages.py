@@ -0,0 +1,58 @@
+import asyncio
+import time
+import pytest
+from cover_letter_pipeline import CoverLetterPipeline
+from pipeline_stages import StageGraph
+
+
+class FakeRetrieval:
+    def retrieve_context_for_cover_letter(self, job_title, company_name, user_question=None):
+        time.sleep(0.2)
+        return {
+            'job_postings': [],
+            'pdf_documents': [],
+            'summary': {'avg_job_similarity': 0, 'avg_pdf_similarity': 0}
+        }
+
+
+class FakeLLM:
+    async def aanalyze_job_posting(self, job_description):
+        await asyncio.sleep(0.2)
+        return {'analysis': f"analysis of {job_description}", 'status': 'success'}
+
+    async def agenerate_cover_letter(self, **kwargs):
+        await asyncio.sleep(0.1)
+        return {'cover_letter': "letter", 'status': 'success'}
+
+
+def test_analysis_and_retrieval_run_in_parallel():
+    pipeline = CoverLetterPipeline.__new__(CoverLetterPipeline)
+    pipeline.retrieval = FakeRetrieval()
+    pipeline.llm = FakeLLM()
+
+    start = time.perf_counter()
+    result = asyncio.run(pipeline.aanalyze_and_generate("dev", "acme", "build things"))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.45
+    assert result['job_analysis'] == "analysis of build things"
+    stages = result['pipeline_info']['stage_timings']['stages']
+    assert set(stages) == {'analysis', 'retrieval', 'generation'}
+    assert stages['analysis']['started_ms'] < stages['retrieval']['finished_ms']
+    assert stages['generation']['started_ms'] >= stages['retrieval']['finished_ms']
+
+
+def test_failed_stage_cancels_dependents():
+    generated = []
+
+    async def fail(_):
+        raise RuntimeError("boom")
+
+    async def generate(inputs):
+        generated.append(inputs)
+
+    graph = StageGraph().add_stage('retrieval', fail).add_stage('generation', generate, depends_on=['retrieval'])
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(graph.run())
+    assert generated == []
@@ -0,0 +1,78 @@
+import pytest
+import query_probes
+import retrieval
+from query_probes import QueryProbeTable, DEFAULT_QUERY_PROBES
+from retrieval import InformationRetrieval
+
+
+@pytest.fixture
+def component(temp_vector_store, monkeypatch):
+    monkeypatch.setattr(retrieval, "retrieval_component", None)
+    monkeypatch.setattr(query_probes, "query_probe_table", None)
+    temp_vector_store.add_pdf_documents([
+        {'filename': 'resume.pdf', 'text': 'backend engineer python fastapi', 'page_number': 1},
+        {'filename': 'resume.pdf', 'text': 'acme corp internship data pipeline', 'page_number': 2},
+        {'filename': 'resume.pdf', 'text': '프로젝트 경험 기술 개발', 'page_number': 3},
+    ])
+    temp_vector_store.add_job_posting({'id': 'job_1', 'jobTitle': 'backend engineer', 'companyName': 'acme corp'})
+    return InformationRetrieval()
+
+
+def test_batched_mode_encodes_all_queries_once(component):
+    model = component.embedding_service.get_model()
+    component.query_probes.precompute()
+    model.encode_batches.clear()
+
+    context = component.retrieve_context_for_cover_letter(
+        "backend engineer", "acme corp", user_question="python", batched=True
+    )
+
+    # 고정 키워드는 미리 계산되어 있으므로 동적 쿼리 4개만 한 번에 인코딩
+    assert model.encode_batches == [["backend engineer acme corp", "python", "backend engineer", "acme corp"]]
+    assert context['timings']['mode'] == 'batched'
+    assert 'encode_ms' in context['timings']
+
+
+def test_batched_and_sequential_modes_return_same_context(component):
+    batched = component.retrieve_context_for_cover_letter("backend engineer", "acme corp", batched=True)
+    sequential = component.retrieve_context_for_cover_letter("backend engineer", "acme corp", batched=False)
+
+    assert [doc['id'] for doc in batched['pdf_documents']] == [doc['id'] for doc in sequential['pdf_documents']]
+    assert [job['id'] for job in batched['job_postings']] == [job['id'] for job in sequential['job_postings']]
+
+
+def test_probe_table_recomputes_when_model_changes(fake_embedding_service):
+    table = QueryProbeTable()
+    probes, embeddings = table.snapshot()
+    assert probes == DEFAULT_QUERY_PROBES
+    assert len(embeddings) == len(DEFAULT_QUERY_PROBES)
+    model = fake_embedding_service.get_model()
+    calls = len(model.encode_batches)
+
+    table.snapshot()
+    assert len(model.encode_batches) == calls
+
+    fake_embedding_service.model_name = "another-model"
+    table.snapshot()
+    assert len(model.encode_batches) == calls + 1
+    assert table.get_stats()['model_name'] == "another-model"
+
+    # 같은 모델 이름으로 다른 차원의 모델이 로드되면 다시 계산
+    model.dimension = 32
+    _, embeddings = table.snapshot()
+    assert len(model.encode_batches) == calls + 2
+    assert len(embeddings[0]) == 32
+
+    # 검색어 내용이 바뀌면(목록 순서 포함) 다시 계산
+    table.probes = list(reversed(table.probes))
+    table.snapshot()
+    assert len(model.encode_batches) == calls + 3
+
+
+def test_probe_list_is_configurable(fake_embedding_service, monkeypatch):
+    monkeypatch.setenv("RETRIEVAL_PROBES", "리더십, 협업")
+    table = QueryProbeTable()
+    assert table.probes == ["리더십", "협업"]
+
+    table.set_probes(["성과"])
+    assert table.snapshot()[0] == ["성과"]
@@ -0,0 +1,101 @@
+import fcntl
+import json
+import os
+import threading
+from cover_letter_models import CoverLetterManager, CoverLetterSection, CoverLetterVersion, SectionVersion
+from section_history import SectionHistoryLog
+
+
+def make_version(version_history=None):
+    return CoverLetterVersion(
+        version_id="v1",
+        original_content="intro",
+        sections={
+            'introduction': CoverLetterSection(
+                section_name='introduction', content="draft 0", version_history=version_history or []
+            )
+        },
+        created_at="2025-08-01T09:00:00",
+        updated_at="2025-08-01T09:00:00",
+        job_title="Backend Engineer",
+        company_name="acme"
+    )
+
+
+def test_history_lives_outside_the_document_and_is_retained(tmp_path):
+    manager = CoverLetterManager(storage_dir=str(tmp_path))
+    manager.history.max_entries = 5
+    manager.history.compact_every = 4
+    manager.save_cover_letter(make_version())
+
+    sizes = []
+    for i in range(1, 21):
+        assert manager.update_section("v1", 'introduction', f"draft {i}")
+        sizes.append(os.path.getsize(tmp_path / "v1.json"))
+
+    document = json.loads((tmp_path / "v1.json").read_text(encoding='utf-8'))
+    assert document['sections']['introduction']['version_history'] == []
+    assert max(sizes) - min(sizes) < 10
+
+    history = manager.get_section_history("v1", 'introduction')
+    assert [v.content for v in history] == [f"draft {i}" for i in range(15, 20)]
+    with open(tmp_path / "history" / "v1.jsonl", encoding='utf-8') as f:
+        assert sum(1 for _ in f) < 10
+
+    assert manager.revert_section("v1", 'introduction', history[0].version_id)
+    assert manager.load_cover_letter("v1").sections['introduction'].content == "draft 15"
+
+
+def test_legacy_embedded_history_moves_to_log_on_save(tmp_path):
+    manager = CoverLetterManager(storage_dir=str(tmp_path))
+    legacy = SectionVersion(version_id="old", content="legacy draft", created_at="2025-08-01T08:00:00")
+    manager.save_cover_letter(make_version(version_history=[legacy]))
+
+    assert manager.load_cover_letter("v1").sections['introduction'].version_history == []
+    assert [v.version_id for v in manager.get_section_history("v1", 'introduction')] == ["old"]
+
+
+def test_legacy_history_on_disk_is_migrated_before_new_entries(tmp_path):
+    legacy = SectionVersion(version_id="old", content="legacy draft", created_at="2025-08-01T08:00:00")
+    # 예전 버전이 저장한 문서처럼 히스토리가 본문 안에 있는 파일
+    (tmp_path / "v1.json").write_text(
+        json.dumps(make_version(version_history=[legacy]).model_dump(), ensure_ascii=False), encoding='utf-8'
+    )
+    manager = CoverLetterManager(storage_dir=str(tmp_path))
+
+    assert manager.update_section("v1", 'introduction', "draft 1")
+    snapshot = manager.add_section_version("v1", 'introduction', "checkpoint")
+    manager.flush()
+
+    history = manager.get_section_history("v1", 'introduction')
+    assert [v.version_id for v in history][:1] == ["old"]
+    assert [v.content for v in history] == ["legacy draft", "draft 0", "draft 1"]
+    assert history[-1].version_id == snapshot.version_id
+    document = json.loads((tmp_path / "v1.json").read_text(encoding='utf-8'))
+    assert document['sections']['introduction']['version_history'] == []
+
+
+def test_a_held_version_lock_does_not_block_other_versions(tmp_path):
+    log = SectionHistoryLog(str(tmp_path / "history"))
+    log.append("v1", 'introduction', [{'version_id': "a", 'content': "draft"}])
+    log.append("v2", 'introduction', [{'version_id': "b", 'content': "draft"}])
+
+    # 다른 프로세스가 v1의 잠금을 쥐고 있는 상황 (같은 파일의 별도 open은 flock이 충돌함)
+    with open(os.path.join(str(tmp_path / "history"), "locks", "v1.lock"), 'a') as other_process:
+        fcntl.flock(other_process.fileno(), fcntl.LOCK_EX)
+        blocked = threading.Thread(target=log.append, args=("v1", 'introduction', [{'version_id': "c"}]), daemon=True)
+        blocked.start()
+        other = threading.Thread(target=log.append, args=("v2", 'introduction', [{'version_id': "d"}]))
+        other.start()
+        other.join(timeout=5)
+
+        assert not other.is_alive()
+        assert [entry['version_id'] for entry in log.read("v2")] == ["b", "d"]
+        assert [entry['version_id'] for entry in log.read("v1")] == ["a"]
+        fcntl.flock(other_process.fileno(), fcntl.LOCK_UN)
+    blocked.join(timeout=5)
+    assert [entry['version_id'] for entry in log.read("v1")] == ["a", "c"]
+
+    log.delete("v1")
+    assert not os.path.exists(os.path.join(str(tmp_path / "history"), "locks", "v1.lock"))
+    assert os.path.exists(os.path.join(str(tmp_path / "history"), "locks", "v2.lock"))
@@ -0,0 +1,103 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from cover_letter_models import CoverLetterManager, CoverLetterSection, CoverLetterVersion
+from job_posting_store import JobPostingStore
+from migrate_storage import migrate_cover_letters, migrate_job_postings
+from storage_backends import SQLiteDocumentBackend, get_sqlite_database
+
+SECTIONS = ['header', 'introduction', 'body', 'conclusion', 'signature']
+
+
+def make_version(version_id, updated_at="2025-08-01T09:00:00"):
+    return CoverLetterVersion(
+        version_id=version_id,
+        original_content="",
+        sections={name: CoverLetterSection(section_name=name, content="") for name in SECTIONS},
+        created_at="2025-08-01T09:00:00",
+        updated_at=updated_at,
+        job_title="Backend Engineer",
+        company_name="acme"
+    )
+
+
+def test_sqlite_database_uses_wal_and_reuses_connection(tmp_path):
+    path = str(tmp_path / "storage.sqlite3")
+
+    database = get_sqlite_database(path)
+
+    assert database.journal_mode() == 'wal'
+    assert get_sqlite_database(path) is database
+
+
+def test_sqlite_backend_serializes_concurrent_section_updates(tmp_path):
+    backend = SQLiteDocumentBackend(get_sqlite_database(str(tmp_path / "storage.sqlite3")), "cover_letters")
+    manager = CoverLetterManager(storage_dir=str(tmp_path / "cover_letters"), backend=backend)
+    manager.save_cover_letter(make_version("v1"))
+
+    edits = [(name, f"{name} edit {i}") for i in range(5) for name in SECTIONS]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(lambda edit: manager.update_section("v1", *edit), edits))
+
+    sections = manager.load_cover_letter("v1").sections
+    for name in SECTIONS:
+        assert sections[name].content.startswith(f"{name} edit")
+        assert len(manager.get_section_history("v1", name)) == 5
+    # 본문은 JSON 파일이 아니라 SQLite에 저장됨
+    assert not list((tmp_path / "cover_letters").glob("*.json"))
+    assert manager.list_versions()[0][0]['edited_sections'] == len(SECTIONS)
+    assert manager.delete_cover_letter("v1") is True
+    assert manager.get_all_versions() == []
+
+
+def test_migration_copies_json_layout_into_sqlite(tmp_path):
+    cover_letters_dir = str(tmp_path / "cover_letters")
+    json_manager = CoverLetterManager(storage_dir=cover_letters_dir)
+    for i in range(3):
+        json_manager.save_cover_letter(make_version(f"v{i}", updated_at=f"2025-08-0{i + 1}T09:00:00"))
+    json_manager.update_section("v1", "body", "edited body")
+    job_postings_dir = tmp_path / "job_postings"
+    job_postings_dir.mkdir()
+    (job_postings_dir / "job_1.json").write_text(
+        json.dumps({'id': "job_1", 'jobTitle': "Backend", 'companyName': "acme", 'createdAt': "2025-08-01"}),
+        encoding='utf-8'
+    )
+    db_path = str(tmp_path / "storage.sqlite3")
+
+    assert migrate_cover_letters(cover_letters_dir, db_path)['migrated'] == 3
+    assert migrate_job_postings(str(job_postings_dir), db_path)['total'] == 1
+    # 다시 실행해도 중복 없이 같은 결과
+    assert migrate_job_postings(str(job_postings_dir), db_path)['total'] == 1
+
+    backend = SQLiteDocumentBackend(get_sqlite_database(db_path), "cover_letters")
+    manager = CoverLetterManager(storage_dir=cover_letters_dir, backend=backend)
+    assert sorted(manager.get_all_versions()) == ["v0", "v1", "v2"]
+    assert manager.load_cover_letter("v1").sections['body'].content == "edited body"
+    assert len(manager.get_section_history("v1", "body")) == 1
+    versions, _ = manager.list_versions()
+    assert [version['version_id'] for version in versions] == ["v1", "v2", "v0"]
+
+    store = JobPostingStore(directory=str(tmp_path / "empty"), index_path=db_path, backend='sqlite')
+    assert store.get("job_1")['companyName'] == "acme"
+    store.save({'id': "job_2", 'jobTitle': "Data", 'companyName': "acme", 'createdAt': "2025-08-02"})
+    assert store.list(company="acme")[1] == 2
+    assert not list((tmp_path / "empty").glob("*.json"))
+
+
+def test_migration_builds_the_catalog_once(tmp_path, monkeypatch):
+    cover_letters_dir = str(tmp_path / "cover_letters")
+    json_manager = CoverLetterManager(storage_dir=cover_letters_dir)
+    for i in range(3):
+        json_manager.save_cover_letter(make_version(f"v{i}"))
+    rebuilds = []
+    original_rebuild = CoverLetterManager.rebuild_catalog
+
+    def counting_rebuild(self):
+        rebuilds.append(self.backend)
+        return original_rebuild(self)
+
+    monkeypatch.setattr(CoverLetterManager, "rebuild_catalog", counting_rebuild)
+
+    result = migrate_cover_letters(cover_letters_dir, str(tmp_path / "storage.sqlite3"))
+
+    assert result['cataloged'] == 3
+    assert len(rebuilds) == 1
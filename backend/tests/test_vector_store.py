@@ -0,0 +1,40 @@
+from vector_store import QueryEmbeddingCache
+
+
+def test_cache_evicts_least_recently_used():
+    cache = QueryEmbeddingCache(max_size=2)
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+    assert cache.get("a") == [1.0]
+
+    cache.put("c", [3.0])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1.0]
+    assert cache.get_stats()['evictions'] == 1
+
+
+def test_cache_expires_entries_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("vector_store.time.monotonic", lambda: now[0])
+    cache = QueryEmbeddingCache(max_size=10, ttl_seconds=5)
+    cache.put("a", [1.0])
+
+    now[0] += 10
+
+    assert cache.get("a") is None
+    assert cache.get_stats()['expirations'] == 1
+
+
+def test_repeated_search_skips_model_inference(temp_vector_store):
+    temp_vector_store.add_pdf_documents([{'filename': 'resume.pdf', 'text': 'backend engineer', 'page_number': 1}])
+    model = temp_vector_store.embedding_service.get_model()
+    model.encode_batches.clear()
+
+    temp_vector_store.search_pdf_documents("backend engineer acme", 1)
+    temp_vector_store.search_pdf_documents("backend engineer acme", 1)
+
+    assert model.encode_batches == [["backend engineer acme"]]
+    stats = temp_vector_store.query_cache.get_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
@@ -2,10 +2,126 @@ import chromadb
 from chromadb.config import Settings
 import os
 from typing import List, Dict, Any, Optional
-from sentence_transformers import SentenceTransformer
 import numpy as np
 import json
 from datetime import datetime
+from embedding_service import get_embedding_service
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+def compute_content_digest(texts: List[str]) -> str:
+    """
+    텍스트 목록의 내용 기반 SHA-256 다이제스트를 반환합니다.
+    Python 내장 hash()와 달리 프로세스가 바뀌어도 값이 동일합니다.
+    """
+    digest = hashlib.sha256()
+    for text in texts:
+        digest.update(text.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def build_job_posting_text(job_posting: Dict[str, Any]) -> str:
+    """
+    Job Posting 필드를 임베딩/분석에 사용하는 하나의 텍스트로 합칩니다.
+    """
+    text_parts = []
+    if job_posting.get('jobTitle'):
+        text_parts.append(f"Job Title: {job_posting['jobTitle']}")
+    if job_posting.get('companyName'):
+        text_parts.append(f"Company: {job_posting['companyName']}")
+    if job_posting.get('jobDescription'):
+        text_parts.append(f"Description: {job_posting['jobDescription']}")
+    if job_posting.get('requirements'):
+        text_parts.append(f"Requirements: {job_posting['requirements']}")
+    if job_posting.get('companyVision'):
+        text_parts.append(f"Company Vision: {job_posting['companyVision']}")
+    return "\n".join(text_parts)
+
+def make_pdf_document_id(file_digest: str, page_number: int, chunk_index: int, source_id: str = None) -> str:
+    """
+    파일 다이제스트와 페이지/청크 번호로 안정적인 PDF 문서 ID를 만듭니다.
+    source_id(문서 식별자)가 주어지면 ID에 포함하여, 내용이 같아도 다른 문서의 청크와 섞이지 않도록 합니다.
+    """
+    if source_id:
+        source_hash = hashlib.sha256(source_id.encode('utf-8')).hexdigest()[:8]
+        return f"pdf_{source_hash}_{file_digest[:16]}_p{page_number}_c{chunk_index}"
+    return f"pdf_{file_digest[:16]}_p{page_number}_c{chunk_index}"
+
+
+class QueryEmbeddingCache:
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = None):
+        """
+        쿼리 임베딩을 저장하는 LRU 캐시를 초기화합니다.
+        ttl_seconds가 주어지면 그 시간이 지난 항목은 만료됩니다.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key) -> Optional[List[float]]:
+        """
+        캐시된 임베딩을 반환합니다. 없거나 만료되었으면 None을 반환합니다.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            embedding, stored_at = entry
+            if self.ttl_seconds and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return embedding
+
+    def put(self, key, embedding: List[float]):
+        """
+        임베딩을 캐시에 저장하고 크기를 넘으면 가장 오래 쓰이지 않은 항목을 제거합니다.
+        """
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (embedding, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        캐시를 비웁니다.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 적중/미스 통계를 반환합니다.
+        """
+        total = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+
 
 class VectorStore:
     def __init__(self, persist_directory: str = "chroma_db"):
@@ -31,8 +147,15 @@ class VectorStore:
             'cover_letters': self._get_or_create_collection('cover_letters')
         }
         
-        # 임베딩 모델 초기화
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+        # 공유 임베딩 서비스 (프로세스당 모델 1개)
+        self.embedding_service = get_embedding_service()
+        
+        # 쿼리 임베딩 캐시 (반복되는 직무명/회사명은 모델 추론 생략)
+        cache_ttl = float(os.getenv('QUERY_EMBEDDING_CACHE_TTL', '0'))
+        self.query_cache = QueryEmbeddingCache(
+            max_size=int(os.getenv('QUERY_EMBEDDING_CACHE_SIZE', '1024')),
+            ttl_seconds=cache_ttl if cache_ttl > 0 else None
+        )
     
     def _get_or_create_collection(self, name: str):
         """
@@ -46,9 +169,11 @@ class VectorStore:
                 metadata={"hnsw:space": "cosine"}
             )
     
-    def add_pdf_documents(self, documents: List[Dict[str, Any]]):
+    def add_pdf_documents(self, documents: List[Dict[str, Any]], embeddings: Optional[List[List[float]]] = None):
         """
         PDF 문서를 벡터 스토어에 추가합니다.
+        embeddings가 주어지면 다시 인코딩하지 않고 그대로 사용합니다.
+        ID는 내용 기반이므로 같은 문서를 다시 추가하면 덮어쓰기(upsert)됩니다.
         """
         if not documents:
             return
@@ -56,25 +181,39 @@ class VectorStore:
         ids = []
         texts = []
         metadatas = []
-        embeddings = []
         
         for doc in documents:
-            doc_id = f"pdf_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hash(doc.get('filename', ''))}"
+            text = doc.get('text', '')
+            file_digest = doc.get('file_digest') or compute_content_digest([text])
+            doc_id = doc.get('id') or make_pdf_document_id(
+                file_digest, doc.get('page_number', 0), doc.get('chunk_index', 0), doc.get('source_id')
+            )
             ids.append(doc_id)
-            texts.append(doc.get('text', ''))
+            texts.append(text)
             metadatas.append({
                 'filename': doc.get('filename', ''),
                 'pages': doc.get('pages', 0),
+                'page_number': doc.get('page_number', 0),
+                'chunk_index': doc.get('chunk_index', 0),
+                'chunk_count': doc.get('chunk_count', 1),
+                'file_digest': file_digest,
+                'source_id': doc.get('source_id') or '',
+                'content_hash': doc.get('content_hash') or compute_content_digest([text]),
                 'type': 'pdf_document',
                 'created_at': datetime.now().isoformat()
             })
         
-        # 임베딩 생성
-        if texts:
-            embeddings = self.embedding_model.encode(texts).tolist()
+        # 임베딩 생성 (미리 계산된 임베딩이 없을 때만)
+        if embeddings is None:
+            embeddings = self.embedding_service.encode(texts).tolist() if texts else []
+        elif isinstance(embeddings, np.ndarray):
+            embeddings = embeddings.tolist()
         
-        # ChromaDB에 추가
-        self.collections['pdf_documents'].add(
+        if len(embeddings) != len(texts):
+            raise ValueError(f"임베딩 수({len(embeddings)})와 문서 수({len(texts)})가 일치하지 않습니다.")
+        
+        # ChromaDB에 추가 (같은 ID는 갱신)
+        self.collections['pdf_documents'].upsert(
             ids=ids,
             documents=texts,
             metadatas=metadatas,
@@ -83,44 +222,119 @@ class VectorStore:
         
         return ids
     
+    def get_pdf_content_hashes(self, ids: List[str]) -> Dict[str, str]:
+        """
+        주어진 ID 중 이미 저장된 PDF 청크의 content_hash를 ID별로 반환합니다.
+        """
+        if not ids:
+            return {}
+        results = self.collections['pdf_documents'].get(ids=ids, include=['metadatas'])
+        return {
+            doc_id: (metadata or {}).get('content_hash')
+            for doc_id, metadata in zip(results['ids'], results['metadatas'])
+        }
+    
+    def get_pdf_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """
+        저장된 PDF 문서의 임베딩을 ID별로 반환합니다.
+        """
+        if not ids:
+            return {}
+        results = self.collections['pdf_documents'].get(ids=ids, include=['embeddings'])
+        return {
+            doc_id: np.asarray(embedding).tolist()
+            for doc_id, embedding in zip(results['ids'], results['embeddings'])
+        }
+    
+    def get_pdf_embeddings_for_hashes(self, content_hashes: List[str]) -> Dict[str, List[float]]:
+        """
+        주어진 내용 해시로 이미 저장된 청크의 임베딩을 내용 해시별로 반환합니다.
+        임베딩은 텍스트에만 의존하므로 어느 문서의 청크든 재사용할 수 있습니다.
+        """
+        if not content_hashes:
+            return {}
+        results = self.collections['pdf_documents'].get(
+            where={'content_hash': {'$in': list(set(content_hashes))}},
+            include=['metadatas', 'embeddings']
+        )
+        embeddings = {}
+        for metadata, embedding in zip(results['metadatas'], results['embeddings']):
+            content_hash = (metadata or {}).get('content_hash')
+            if content_hash:
+                embeddings[content_hash] = np.asarray(embedding).tolist()
+        return embeddings
+    
+    def has_pdf_source(self, source_id: str) -> bool:
+        """
+        해당 문서 식별자로 저장된 청크가 있는지 반환합니다.
+        """
+        if not source_id:
+            return False
+        return bool(self.collections['pdf_documents'].get(
+            where={'source_id': source_id}, limit=1, include=[]
+        )['ids'])
+    
+    def delete_stale_pdf_documents(self, source_id: str, file_digest: str, keep_ids: List[str] = None) -> int:
+        """
+        같은 문서의 청크 중 keep_ids(방금 저장한 현재 버전)에 없는 청크를 삭제하고 삭제 수를 반환합니다.
+        source_id가 있으면 그 식별자의 모든 이전 청크(다른 다이제스트 포함)를,
+        없으면 같은 다이제스트로 식별자 없이 저장된 청크를 대상으로 하므로
+        청커 설정이 바뀌어 청크 수가 줄어든 경우에도 남은 청크가 정리됩니다.
+        파일명은 다른 문서와 겹칠 수 있으므로 사용하지 않습니다.
+        """
+        if source_id:
+            where = {'source_id': source_id}
+        else:
+            where = {'$and': [{'file_digest': file_digest}, {'source_id': ''}]}
+        collection = self.collections['pdf_documents']
+        keep = set(keep_ids or [])
+        stale_ids = [doc_id for doc_id in collection.get(where=where, include=[])['ids'] if doc_id not in keep]
+        if stale_ids:
+            collection.delete(ids=stale_ids)
+        return len(stale_ids)
+    
     def add_job_posting(self, job_posting: Dict[str, Any]):
         """
         Job Posting을 벡터 스토어에 추가합니다.
         """
-        job_id = job_posting.get('id', f"job_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        return self.add_job_postings([job_posting])[0]
+    
+    def add_job_postings(self, job_postings: List[Dict[str, Any]]) -> List[str]:
+        """
+        여러 Job Posting을 한 번에 인코딩하여 벡터 스토어에 추가합니다.
+        같은 ID는 갱신(upsert)되므로 다시 가져와도 중복되지 않습니다.
+        """
+        if not job_postings:
+            return []
+        
+        ids = [
+            job_posting.get('id', f"job_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+            for job_posting in job_postings
+        ]
         
         # Job Posting 텍스트 구성
-        text_parts = []
-        if job_posting.get('jobTitle'):
-            text_parts.append(f"Job Title: {job_posting['jobTitle']}")
-        if job_posting.get('companyName'):
-            text_parts.append(f"Company: {job_posting['companyName']}")
-        if job_posting.get('jobDescription'):
-            text_parts.append(f"Description: {job_posting['jobDescription']}")
-        if job_posting.get('requirements'):
-            text_parts.append(f"Requirements: {job_posting['requirements']}")
-        if job_posting.get('companyVision'):
-            text_parts.append(f"Company Vision: {job_posting['companyVision']}")
-        
-        text = "\n".join(text_parts)
+        texts = [build_job_posting_text(job_posting) for job_posting in job_postings]
         
         # 임베딩 생성
-        embedding = self.embedding_model.encode([text]).tolist()[0]
+        embeddings = self.embedding_service.encode(texts).tolist()
         
         # ChromaDB에 추가
-        self.collections['job_postings'].add(
-            ids=[job_id],
-            documents=[text],
-            metadatas=[{
-                'job_title': job_posting.get('jobTitle', ''),
-                'company_name': job_posting.get('companyName', ''),
-                'type': 'job_posting',
-                'created_at': job_posting.get('createdAt', datetime.now().isoformat())
-            }],
-            embeddings=[embedding]
+        self.collections['job_postings'].upsert(
+            ids=ids,
+            documents=texts,
+            metadatas=[
+                {
+                    'job_title': job_posting.get('jobTitle', ''),
+                    'company_name': job_posting.get('companyName', ''),
+                    'type': 'job_posting',
+                    'created_at': job_posting.get('createdAt', datetime.now().isoformat())
+                }
+                for job_posting in job_postings
+            ],
+            embeddings=embeddings
         )
         
-        return job_id
+        return ids
     
     def search_similar_documents(self, query: str, collection_name: str = 'pdf_documents', n_results: int = 5):
         """
@@ -129,21 +343,70 @@ class VectorStore:
         if collection_name not in self.collections:
             raise ValueError(f"Collection '{collection_name}' not found")
         
-        # 쿼리 임베딩 생성
-        query_embedding = self.embedding_model.encode([query]).tolist()[0]
+        # 쿼리 임베딩 생성 (캐시 우선)
+        query_embedding = self.encode_queries([query])[0]
         
         # 유사도 검색
+        return self.search_by_embeddings([query_embedding], collection_name, n_results)[0]
+    
+    def encode_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        여러 쿼리를 한 번의 encode 호출로 임베딩합니다.
+        캐시에 있는 쿼리는 인코딩하지 않습니다.
+        """
+        if not queries:
+            return []
+        
+        model_name = self.embedding_service.model_name
+        embeddings = [self.query_cache.get((model_name, query)) for query in queries]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            encoded = self.embedding_service.encode([queries[i] for i in missing]).tolist()
+            for i, embedding in zip(missing, encoded):
+                embeddings[i] = embedding
+                self.query_cache.put((model_name, queries[i]), embedding)
+        return embeddings
+    
+    def search_by_embeddings(
+        self,
+        query_embeddings: List[List[float]],
+        collection_name: str = 'pdf_documents',
+        n_results: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        미리 계산된 쿼리 임베딩들로 한 번에 유사도 검색을 수행합니다.
+        쿼리마다 하나의 결과 딕셔너리를 반환합니다.
+        """
+        if collection_name not in self.collections:
+            raise ValueError(f"Collection '{collection_name}' not found")
+        if not query_embeddings:
+            return []
+        
         results = self.collections[collection_name].query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=n_results
         )
         
-        return {
-            'documents': results['documents'][0] if results['documents'] else [],
-            'metadatas': results['metadatas'][0] if results['metadatas'] else [],
-            'distances': results['distances'][0] if results['distances'] else [],
-            'ids': results['ids'][0] if results['ids'] else []
-        }
+        batch_results = []
+        for i in range(len(query_embeddings)):
+            batch_results.append({
+                'documents': results['documents'][i] if results['documents'] else [],
+                'metadatas': results['metadatas'][i] if results['metadatas'] else [],
+                'distances': results['distances'][i] if results['distances'] else [],
+                'ids': results['ids'][i] if results['ids'] else []
+            })
+        return batch_results
+    
+    def search_similar_documents_batch(
+        self,
+        queries: List[str],
+        collection_name: str = 'pdf_documents',
+        n_results: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 쿼리를 한 번에 인코딩하고 한 번의 Chroma 쿼리로 검색합니다.
+        """
+        return self.search_by_embeddings(self.encode_queries(queries), collection_name, n_results)
     
     def search_job_postings(self, query: str, n_results: int = 3):
         """
@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import './CoverLetterGenerator.css';
 import CoverLetterEditor from './CoverLetterEditor';
+import { streamCoverLetter } from './coverLetterStream';
 
 const CoverLetterGenerator = () => {
   const [formData, setFormData] = useState({
@@ -20,6 +21,7 @@ const CoverLetterGenerator = () => {
   const [showEditor, setShowEditor] = useState(false);
   const [editedCoverLetter, setEditedCoverLetter] = useState(null);
   const [savedVersions, setSavedVersions] = useState([]);
+  const [versionsCursor, setVersionsCursor] = useState(null);
   const [showVersions, setShowVersions] = useState(false);
   const [debugInfo, setDebugInfo] = useState(null);
   const [showDebugInfo, setShowDebugInfo] = useState(false);
@@ -28,13 +30,19 @@ const CoverLetterGenerator = () => {
     loadJobPostings();
   }, []);
 
+  // 목록은 페이지 단위로 반환되므로 next_offset이 없을 때까지 이어서 조회
   const loadJobPostings = async () => {
     try {
-      const response = await fetch('http://localhost:8000/job-postings');
-      if (response.ok) {
+      const postings = [];
+      let offset = 0;
+      while (offset !== null) {
+        const response = await fetch(`http://localhost:8000/job-postings?offset=${offset}`);
+        if (!response.ok) break;
         const data = await response.json();
-        setJobPostings(data.job_postings || []);
+        postings.push(...(data.job_postings || []));
+        offset = data.next_offset ?? null;
       }
+      setJobPostings(postings);
     } catch (err) {
       console.error('Job Postings 로드 실패:', err);
     }
@@ -57,6 +65,23 @@ const CoverLetterGenerator = () => {
     }));
   };
 
+  const handleStream = async (payload) => {
+    let retrieval = null;
+    try {
+      const data = await streamCoverLetter('http://localhost:8000/generate-cover-letter/stream', payload, {
+        onMetadata: (metadata) => {
+          retrieval = metadata;
+          setResult({ cover_letter: '', retrieval, streaming: true });
+        },
+        onToken: (coverLetter) => setResult(prev => ({ ...prev, cover_letter: coverLetter })),
+      });
+      setResult({ ...data, retrieval, streaming: false });
+    } catch (err) {
+      setResult(null);
+      setError(err.message);
+    }
+  };
+
   const handleGenerate = async (e) => {
     e.preventDefault();
     
@@ -70,6 +95,17 @@ const CoverLetterGenerator = () => {
     setResult(null);
 
     try {
+      // 단일 Cover Letter는 스트리밍으로 받아 토큰이 생성되는 대로 표시
+      if (!formData.includeVariations) {
+        await handleStream({
+          job_title: formData.jobTitle,
+          company_name: formData.companyName,
+          user_question: formData.userQuestion || null,
+          user_background: formData.userBackground || null
+        });
+        return;
+      }
+
       const response = await fetch('http://localhost:8000/generate-cover-letter', {
         method: 'POST',
         headers: {
@@ -137,30 +173,16 @@ const CoverLetterGenerator = () => {
     setEditedCoverLetter(null);
   };
 
-  const loadSavedVersions = async () => {
+  const loadSavedVersions = async (cursor = null) => {
     try {
-      const response = await fetch('http://localhost:8000/cover-letter/versions');
+      // 카탈로그 요약(편집 섹션 수 포함)을 페이지 단위로 조회
+      const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+      const response = await fetch(`http://localhost:8000/cover-letter/versions${query}`);
       if (response.ok) {
         const data = await response.json();
         const versions = data.versions || [];
-        
-        // 각 버전의 상세 정보 로드
-        const detailedVersions = await Promise.all(
-          versions.map(async (version) => {
-            try {
-              const statusResponse = await fetch(`http://localhost:8000/cover-letter/${version.version_id}/save-status`);
-              if (statusResponse.ok) {
-                const statusData = await statusResponse.json();
-                return { ...version, ...statusData };
-              }
-            } catch (err) {
-              console.error(`버전 ${version.version_id} 상태 로드 실패:`, err);
-            }
-            return version;
-          })
-        );
-        
-        setSavedVersions(detailedVersions);
+        setSavedVersions(prev => (cursor ? [...prev, ...versions] : versions));
+        setVersionsCursor(data.next_cursor || null);
       }
     } catch (err) {
       console.error('저장된 버전 로드 실패:', err);
@@ -409,6 +431,7 @@ const CoverLetterGenerator = () => {
                   <button 
                     onClick={() => handleEditCoverLetter(result.cover_letter)}
                     className="edit-button"
+                    disabled={result.streaming}
                   >
                     편집
                   </button>
@@ -433,13 +456,16 @@ const CoverLetterGenerator = () => {
             <p><strong>모델:</strong> {result.generation_info?.model}</p>
             <p><strong>생성 시간:</strong> {new Date(result.generation_info?.generated_at).toLocaleString()}</p>
             <p><strong>사용된 컨텍스트:</strong> {result.context_info?.job_postings_found || 0}개 Job Posting, {result.context_info?.pdf_documents_found || 0}개 PDF 문서</p>
+            {result.pipeline_info?.streaming_timings && (
+              <p><strong>첫 토큰까지:</strong> {result.pipeline_info.streaming_timings.first_token_ms}ms (검색 {result.pipeline_info.streaming_timings.retrieval_ms}ms)</p>
+            )}
           </div>
 
           <div className="version-management">
             <div className="version-header">
               <h4>저장된 버전</h4>
               <div className="version-controls">
-                <button onClick={loadSavedVersions} className="refresh-button">
+                <button onClick={() => loadSavedVersions()} className="refresh-button">
                   새로고침
                 </button>
                 <button onClick={() => setShowVersions(!showVersions)} className="toggle-button">
@@ -480,6 +506,11 @@ const CoverLetterGenerator = () => {
                     </div>
                   ))
                 )}
+                {versionsCursor && (
+                  <button onClick={() => loadSavedVersions(versionsCursor)} className="refresh-button">
+                    더 보기
+                  </button>
+                )}
               </div>
             )}
           </div>
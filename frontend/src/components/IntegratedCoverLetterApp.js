@@ -1,5 +1,7 @@
 import React, { useState, useEffect, useCallback } from 'react';
 import './IntegratedCoverLetterApp.css';
+import { streamCoverLetter } from './coverLetterStream';
+import { clientIdHeaders } from './clientId';
 
 const IntegratedCoverLetterApp = () => {
   // 상태 관리
@@ -62,6 +64,7 @@ const IntegratedCoverLetterApp = () => {
         try {
           const response = await fetch('/api/upload-pdf', {
             method: 'POST',
+            headers: clientIdHeaders(),
             body: formData,
           });
 
@@ -106,27 +109,17 @@ const IntegratedCoverLetterApp = () => {
 
     setIsGenerating(true);
     try {
-      const response = await fetch('/api/generate-cover-letter', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          job_posting: jobPosting,
-        }),
+      // 토큰이 생성되는 대로 편집 영역에 표시
+      const data = await streamCoverLetter('/api/generate-cover-letter/stream', {
+        job_posting: jobPosting,
+      }, {
+        onToken: (text) => setGeneratedCoverLetter(text),
       });
-
-      if (response.ok) {
-        const data = await response.json();
-        setGeneratedCoverLetter(data.cover_letter);
-        setCoverLetter(data.cover_letter);
-      } else {
-        const errorData = await response.json();
-        alert(`커버레터 생성 실패: ${errorData.detail}`);
-      }
+      setGeneratedCoverLetter(data.cover_letter);
+      setCoverLetter(data.cover_letter);
     } catch (error) {
       console.error('커버레터 생성 오류:', error);
-      alert('커버레터 생성 중 오류가 발생했습니다.');
+      alert(`커버레터 생성 실패: ${error.message}`);
     } finally {
       setIsGenerating(false);
     }
@@ -1,5 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import './UnifiedCoverLetterApp.css';
+import { streamCoverLetter } from './coverLetterStream';
+import { clientIdHeaders } from './clientId';
 
 const UnifiedCoverLetterApp = () => {
   // 상태 관리
@@ -82,6 +84,7 @@ const UnifiedCoverLetterApp = () => {
         
         const response = await fetch('http://localhost:8000/upload-pdf', {
           method: 'POST',
+          headers: clientIdHeaders(),
           body: formData,
         });
 
@@ -153,16 +156,36 @@ const UnifiedCoverLetterApp = () => {
       setIsLoading(true);
       setError(null);
 
+      const payload = {
+        job_title: jobPosting.jobTitle,
+        company_name: jobPosting.companyName,
+        user_question: coverLetterData.userQuestion,
+        user_background: coverLetterData.userBackground
+      };
+
+      // 단일 Cover Letter는 스트리밍으로 받아 편집 탭에서 토큰이 생성되는 대로 표시
+      if (!coverLetterData.includeVariations) {
+        try {
+          setActiveTab('edit');
+          const data = await streamCoverLetter('http://localhost:8000/generate-cover-letter/stream', payload, {
+            onToken: (text) => setGeneratedCoverLetter({ cover_letter: text, streaming: true }),
+          });
+          setGeneratedCoverLetter(data);
+          setSuccess('Cover Letter가 성공적으로 생성되었습니다!');
+        } catch (err) {
+          setGeneratedCoverLetter(null);
+          setError(`Cover Letter 생성 실패: ${err.message}`);
+        }
+        return;
+      }
+
       const response = await fetch('http://localhost:8000/generate-cover-letter', {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
         body: JSON.stringify({
-          job_title: jobPosting.jobTitle,
-          company_name: jobPosting.companyName,
-          user_question: coverLetterData.userQuestion,
-          user_background: coverLetterData.userBackground,
+          ...payload,
           include_variations: coverLetterData.includeVariations,
           num_variations: coverLetterData.numVariations
         }),
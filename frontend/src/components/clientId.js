@@ -0,0 +1,19 @@
+const CLIENT_ID_KEY = 'coverLetterClientId';
+
+// 브라우저마다 한 번 만들어 localStorage에 보관하는 사용자 식별자
+// 업로드 시 X-Client-Id 헤더로 보내면 서버가 (클라이언트 ID, 파일명)을 문서 식별자로 사용해
+// 같은 이름으로 다시 올린 이력서가 이전 버전 청크를 교체함
+export const getClientId = () => {
+  let clientId = localStorage.getItem(CLIENT_ID_KEY);
+  if (!clientId) {
+    clientId = window.crypto && window.crypto.randomUUID
+      ? window.crypto.randomUUID()
+      : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+    localStorage.setItem(CLIENT_ID_KEY, clientId);
+  }
+  return clientId;
+};
+
+export const clientIdHeaders = () => ({
+  'X-Client-Id': getClientId(),
+});
@@ -0,0 +1,63 @@
+// SSE 응답 본문을 읽으면서 이벤트마다 onEvent(event, data)를 호출
+export const readServerSentEvents = async (response, onEvent) => {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const block = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      let event = 'message';
+      let data = '';
+      block.split('\n').forEach((line) => {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data += line.slice(6);
+      });
+      onEvent(event, data ? JSON.parse(data) : {});
+    }
+  }
+};
+
+// /generate-cover-letter/stream으로 생성하면서 onMetadata(검색 결과), onToken(지금까지의 본문)을 호출하고
+// 일반 생성 엔드포인트와 같은 형식의 최종 결과(done)를 반환. 실패하면 detail 메시지로 Error를 던짐
+export const streamCoverLetter = async (url, payload, { onMetadata, onToken } = {}) => {
+  const response = await fetch(url, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify(payload),
+  });
+
+  if (!response.ok) {
+    const errorData = await response.json();
+    throw new Error(errorData.detail || 'Cover Letter 생성 중 오류가 발생했습니다.');
+  }
+
+  let coverLetter = '';
+  let result = null;
+  let error = null;
+  await readServerSentEvents(response, (event, data) => {
+    if (event === 'metadata') {
+      if (onMetadata) onMetadata(data);
+    } else if (event === 'token') {
+      coverLetter += data.text;
+      if (onToken) onToken(coverLetter);
+    } else if (event === 'done') {
+      result = data;
+    } else if (event === 'error') {
+      error = data.detail;
+    }
+  });
+
+  if (error || !result) {
+    throw new Error(error || 'Cover Letter 생성 중 오류가 발생했습니다.');
+  }
+  return result;
+};